@@ -0,0 +1,124 @@
+"""Cheap answers for the signup form's availability checks.
+
+register.js asks whether a username or email is free on every keystroke.
+``RecentlyChecked`` remembers each answer, taken or free, for a few
+seconds so retyping, backspacing and the username/email round trips of
+one visitor don't each cost a query, and ``TokenBucket`` caps how fast a
+single client address can ask at all. Both are process-local: a miss or
+a fresh bucket in another worker only costs what every check used to.
+Registration itself always checks the database, so a stale "free" answer
+can at worst let someone submit a form that is then rejected.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.contrib.auth.models import User
+from django.http import JsonResponse
+
+CACHE_TTL = 30
+CACHE_SIZE = 4096
+# Sustained checks per second per address, and how many may come at once.
+RATE = 5
+BURST = 20
+CLIENTS = 10000
+
+
+class RecentlyChecked:
+    """Short-lived memo of whether a ``User`` with ``field == value`` exists."""
+
+    def __init__(self, field: str, ttl: float = CACHE_TTL, size: int = CACHE_SIZE):
+        self.field = field
+        self.ttl = ttl
+        self.size = size
+        self._answers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, value: str):
+        with self._lock:
+            entry = self._answers.get(value)
+            if entry is None:
+                return None
+            expires, taken = entry
+            if expires < time.monotonic():
+                del self._answers[value]
+                return None
+            return taken
+
+    def put(self, value: str, taken: bool):
+        with self._lock:
+            self._answers[value] = (time.monotonic() + self.ttl, taken)
+            self._answers.move_to_end(value)
+            if len(self._answers) > self.size:
+                self._answers.popitem(last=False)
+
+    def forget(self, value: str):
+        with self._lock:
+            self._answers.pop(value, None)
+
+    def clear(self):
+        with self._lock:
+            self._answers.clear()
+
+    async def ataken(self, value: str) -> bool:
+        taken = self.get(value)
+        if taken is None:
+            taken = await User.objects.filter(**{self.field: value}).aexists()
+            self.put(value, taken)
+        return taken
+
+
+class TokenBucket:
+    """Per-key token bucket: ``burst`` requests at once, refilled at ``rate`` per second."""
+
+    def __init__(self, rate: float = RATE, burst: int = BURST, keys: int = CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.keys = keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            # Re-inserted last, so the least recently seen address is dropped first.
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.keys:
+                self._buckets.popitem(last=False)
+            return allowed
+
+    def retry_after(self) -> int:
+        return max(1, round(1 / self.rate))
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+usernames = RecentlyChecked('username')
+emails = RecentlyChecked('email')
+limiter = TokenBucket()
+
+
+def client_address(request) -> str:
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def throttled(request, error_key: str):
+    """A 429 response if the client is over its rate, else None."""
+    if limiter.allow(client_address(request)):
+        return None
+    response = JsonResponse({error_key: 'Too many checks, try again in a moment'}, status=429)
+    response['Retry-After'] = str(limiter.retry_after())
+    return response
+
+
+def registered(username: str, email: str):
+    """Drop cached answers for a newly created account."""
+    usernames.forget(username)
+    emails.forget(email)
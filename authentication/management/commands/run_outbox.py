@@ -0,0 +1,37 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from authentication import outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbound email on a thread pool, retrying with backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4,
+                            help="Threads sending mail concurrently.")
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument("--poll-interval", type=float, default=2.0,
+                            help="Seconds to sleep when nothing is due.")
+        parser.add_argument("--once", action="store_true",
+                            help="Exit once no message is due instead of polling.")
+        parser.add_argument("--stats", action="store_true",
+                            help="Print queue depth and delivery latency, then exit.")
+
+    def handle(self, *args, **options):
+        if options["stats"]:
+            self.stdout.write(json.dumps(outbox.stats(), indent=2))
+            return
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            while True:
+                claimed = outbox.process_batch(options["batch_size"], executor)
+                if claimed:
+                    self.stdout.write(f"Processed {claimed} messages")
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
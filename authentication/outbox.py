@@ -0,0 +1,120 @@
+"""Transactional email outbox.
+
+Views ``enqueue`` mail in the same request that creates the data it refers
+to; ``manage.py run_outbox`` claims due rows in batches and delivers them on
+a thread pool, retrying failures with exponential backoff.
+"""
+from datetime import timedelta
+
+from django.core.mail import EmailMessage
+from django.db import close_old_connections, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = timedelta(seconds=30)
+BACKOFF_MAX = timedelta(hours=1)
+# A claimed row whose worker died becomes due again after this long.
+LEASE = timedelta(minutes=5)
+
+
+def enqueue(subject: str, body: str, from_email: str, to: list) -> OutboundEmail:
+    return OutboundEmail.objects.create(
+        subject=subject, body=body, from_email=from_email, to=list(to))
+
+
+def backoff(attempts: int) -> timedelta:
+    return min(BACKOFF_BASE * 2 ** (attempts - 1), BACKOFF_MAX)
+
+
+def due(now=None):
+    now = now or timezone.now()
+    return OutboundEmail.objects.filter(
+        Q(status=OutboundEmail.PENDING) | Q(status=OutboundEmail.SENDING),
+        next_attempt_at__lte=now,
+    )
+
+
+def claim(limit: int) -> list:
+    """Mark up to ``limit`` due messages as sending and return their ids."""
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            due(now).select_for_update(skip_locked=True)
+            .order_by('next_attempt_at').values_list('id', flat=True)[:limit]
+        )
+        OutboundEmail.objects.filter(id__in=ids).update(
+            status=OutboundEmail.SENDING, next_attempt_at=now + LEASE)
+    return ids
+
+
+def deliver(message_id: int) -> bool:
+    message = OutboundEmail.objects.get(pk=message_id)
+    message.attempts += 1
+    try:
+        EmailMessage(message.subject, message.body,
+                     message.from_email, message.to).send(fail_silently=False)
+    except Exception as exc:
+        message.last_error = f'{type(exc).__name__}: {exc}'
+        if message.attempts >= MAX_ATTEMPTS:
+            message.status = OutboundEmail.FAILED
+        else:
+            message.status = OutboundEmail.PENDING
+            message.next_attempt_at = timezone.now() + backoff(message.attempts)
+        message.save(update_fields=['attempts', 'status', 'next_attempt_at', 'last_error'])
+        return False
+
+    message.status = OutboundEmail.SENT
+    message.sent_at = timezone.now()
+    message.last_error = ''
+    message.save(update_fields=['attempts', 'status', 'sent_at', 'last_error'])
+    return True
+
+
+def _deliver_in_thread(message_id: int) -> bool:
+    try:
+        return deliver(message_id)
+    finally:
+        close_old_connections()
+
+
+def process_batch(limit: int = 50, executor=None) -> int:
+    """Deliver one batch; returns how many messages were claimed.
+
+    With an executor the sends run on its threads, otherwise inline.
+    """
+    ids = claim(limit)
+    if executor is None:
+        for message_id in ids:
+            deliver(message_id)
+    else:
+        list(executor.map(_deliver_in_thread, ids))
+    return len(ids)
+
+
+def stats(sample: int = 500) -> dict:
+    """Queue depth by status and delivery latency over the latest sent mail."""
+    counts = dict.fromkeys((status for status, _ in OutboundEmail.STATUS_CHOICES), 0)
+    for row in OutboundEmail.objects.values('status').annotate(n=Count('id')).order_by():
+        counts[row['status']] = row['n']
+
+    latencies = sorted(
+        (sent_at - created_at).total_seconds()
+        for created_at, sent_at in OutboundEmail.objects
+        .filter(status=OutboundEmail.SENT).order_by('-sent_at')
+        .values_list('created_at', 'sent_at')[:sample]
+    )
+    latency = {}
+    if latencies:
+        latency = {
+            'p50': latencies[len(latencies) // 2],
+            'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            'max': latencies[-1],
+        }
+    return {
+        'queue_depth': counts[OutboundEmail.PENDING] + counts[OutboundEmail.SENDING],
+        'by_status': counts,
+        'delivery_latency_seconds': latency,
+    }
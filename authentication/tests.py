@@ -1,3 +1,134 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from . import availability, outbox
+from .models import OutboundEmail
+
+
+@override_settings(EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend')
+class OutboxTests(TestCase):
+    def register(self, username='alice'):
+        return self.client.post(reverse('register'), {
+            'username': username,
+            'email': f'{username}@example.com',
+            'password': 'secret123',
+        })
+
+    def test_registration_queues_activation_mail_without_sending(self):
+        self.register()
+        self.assertEqual(len(mail.outbox), 0)
+        message = OutboundEmail.objects.get()
+        self.assertEqual(message.to, ['alice@example.com'])
+        self.assertIn('/authentication/activate/', message.body)
+        self.assertFalse(User.objects.get(username='alice').is_active)
+
+    def test_failed_enqueue_creates_no_account(self):
+        with mock.patch.object(outbox, 'enqueue', side_effect=RuntimeError('queue down')):
+            with self.assertRaises(RuntimeError):
+                self.register()
+        self.assertFalse(User.objects.filter(username='alice').exists())
+        self.register()
+        self.assertTrue(OutboundEmail.objects.filter(to=['alice@example.com']).exists())
+
+    def test_process_batch_delivers_due_messages(self):
+        self.register()
+        self.assertEqual(outbox.process_batch(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, 'Activate your account')
+
+        message = OutboundEmail.objects.get()
+        self.assertEqual(message.status, OutboundEmail.SENT)
+        self.assertEqual(outbox.process_batch(), 0)
+        self.assertEqual(outbox.stats()['queue_depth'], 0)
+        self.assertIn('p50', outbox.stats()['delivery_latency_seconds'])
+
+    def test_failures_back_off_then_give_up(self):
+        message = outbox.enqueue('Hi', 'body', 'noreply@example.com', ['bob@example.com'])
+        with mock.patch('authentication.outbox.EmailMessage.send', side_effect=OSError('smtp down')):
+            outbox.process_batch()
+            message.refresh_from_db()
+            self.assertEqual(message.status, OutboundEmail.PENDING)
+            self.assertEqual(message.attempts, 1)
+            self.assertGreater(message.next_attempt_at, timezone.now())
+            self.assertIn('smtp down', message.last_error)
+
+            # Not due again until the backoff has elapsed
+            self.assertEqual(outbox.process_batch(), 0)
+
+            for _ in range(outbox.MAX_ATTEMPTS - 1):
+                OutboundEmail.objects.filter(pk=message.pk).update(
+                    next_attempt_at=timezone.now() - timedelta(seconds=1))
+                outbox.process_batch()
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboundEmail.FAILED)
+        self.assertEqual(message.attempts, outbox.MAX_ATTEMPTS)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_expired_lease_is_reclaimed(self):
+        message = outbox.enqueue('Hi', 'body', 'noreply@example.com', ['bob@example.com'])
+        self.assertEqual(outbox.claim(10), [message.pk])
+        self.assertEqual(outbox.claim(10), [])
+        OutboundEmail.objects.filter(pk=message.pk).update(
+            next_attempt_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(outbox.claim(10), [message.pk])
+
+
+class AvailabilityViewTests(TestCase):
+    def setUp(self):
+        for cache in (availability.usernames, availability.emails, availability.limiter):
+            cache.clear()
+            self.addCleanup(cache.clear)
+
+    async def test_username_availability(self):
+        await User.objects.acreate(username='alice', email='alice@example.com')
+        url = reverse('validate-username')
+
+        response = await self.async_client.post(
+            url, {'username': 'alice'}, content_type='application/json')
+        self.assertEqual(response.status_code, 409)
+        response = await self.async_client.post(
+            url, {'username': 'bob'}, content_type='application/json')
+        self.assertEqual(response.json(), {'username_valid': True})
+
+    async def test_email_syntax_only(self):
+        url = reverse('validate-email')
+        with mock.patch('email_validator.deliverability.validate_email_deliverability') as dns:
+            response = await self.async_client.post(
+                url, {'email': 'carol@example.com'}, content_type='application/json')
+            self.assertEqual(response.json(), {'email_valid': True})
+            response = await self.async_client.post(
+                url, {'email': 'not-an-email'}, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+        dns.assert_not_called()
+
+    def test_answers_are_cached_until_registration(self):
+        url = reverse('validate-username')
+
+        def check():
+            return self.client.post(url, {'username': 'dave'}, content_type='application/json')
+
+        self.assertEqual(check().status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(check().status_code, 200)
+
+        self.client.post(reverse('register'), {
+            'username': 'dave', 'email': 'dave@example.com', 'password': 'secret123'})
+        self.assertEqual(check().status_code, 409)
+
+    def test_rate_limited_per_address(self):
+        url = reverse('validate-username')
+        with mock.patch.object(availability.limiter, 'burst', 3), \
+                mock.patch.object(availability.limiter, 'rate', 0.001):
+            statuses = [
+                self.client.post(url, {'username': 'erin'}, content_type='application/json').status_code
+                for _ in range(4)]
+            self.assertEqual(statuses, [200, 200, 200, 429])
+            response = self.client.post(url, {'username': 'erin'}, content_type='application/json',
+                                        REMOTE_ADDR='10.0.0.2')
+            self.assertEqual(response.status_code, 200)
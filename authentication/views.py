@@ -17,32 +17,43 @@ from django.contrib.sites.shortcuts import get_current_site
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from django.template.loader import render_to_string
 from .utils import account_activation_token
+from . import availability, outbox
 from django.urls import reverse
 from django.contrib import auth
+from django.db import transaction
 
 # Create your views here.
 
 
 class EmailValidationView(View):
-    def post(self, request):
+    async def post(self, request):
+        response = availability.throttled(request, 'email_error')
+        if response:
+            return response
         data = json.loads(request.body)
         email = data['email']
-        if not validate_email(email):
+        try:
+            # Syntax only: deliverability checks resolve DNS on every keystroke.
+            validate_email(email, check_deliverability=False)
+        except EmailNotValidError:
             return JsonResponse({'email_error': 'Email is invalid'}, status=400)
-        if User.objects.filter(email=email).exists():
+        if await availability.emails.ataken(email):
             return JsonResponse({'email_error': 'sorry email in use,choose another one '}, status=409)
         return JsonResponse({'email_valid': True})
 
 
 class UsernameValidationView(View):
-    def post(self, request):
+    async def post(self, request):
+        response = availability.throttled(request, 'username_error')
+        if response:
+            return response
         data = json.loads(request.body)
         username = data['username']
 
         if not str(username).isalnum():  # or regex check
             return JsonResponse({'username_error': 'Username must be alphanumeric'}, status=400)
 
-        if User.objects.filter(username=username).exists():
+        if await availability.usernames.ataken(username):
             return JsonResponse({'username_error': 'Username already taken'}, status=409)
 
         return JsonResponse({'username_valid': True})
@@ -71,32 +82,36 @@ class RegistrationView(View):
                     messages.error(request, 'Password too short')
                     return render(request, 'authentication/register.html', context)
 
-                user = User.objects.create_user(username=username, email=email)
-                user.set_password(password)
-                user.is_active = False
-                user.save()
-                current_site = get_current_site(request)
-                email_body = {
-                    'user': user,
-                    'domain': current_site.domain,
-                    'uid': urlsafe_base64_encode(force_bytes(user.pk)),
-                    'token': account_activation_token.make_token(user),
-                }
-
-                link = reverse('activate', kwargs={
-                               'uidb64': email_body['uid'], 'token': email_body['token']})
-
-                email_subject = 'Activate your account'
-
-                activate_url = 'http://'+current_site.domain+link
-
-                email = EmailMessage(
-                    email_subject,
-                    'Hi '+user.username + ', Please the link below to activate your account \n'+activate_url,
-                    'noreply@semycolon.com',
-                    [email],
-                )
-                email.send(fail_silently=False)
+                # The account and its activation mail commit together, so a
+                # failed enqueue never leaves an inactive user with no link.
+                with transaction.atomic():
+                    user = User.objects.create_user(username=username, email=email)
+                    user.set_password(password)
+                    user.is_active = False
+                    user.save()
+                    current_site = get_current_site(request)
+                    email_body = {
+                        'user': user,
+                        'domain': current_site.domain,
+                        'uid': urlsafe_base64_encode(force_bytes(user.pk)),
+                        'token': account_activation_token.make_token(user),
+                    }
+
+                    link = reverse('activate', kwargs={
+                                   'uidb64': email_body['uid'], 'token': email_body['token']})
+
+                    email_subject = 'Activate your account'
+
+                    activate_url = 'http://'+current_site.domain+link
+
+                    # Delivered by manage.py run_outbox, not inside the request
+                    outbox.enqueue(
+                        email_subject,
+                        'Hi '+user.username + ', Please the link below to activate your account \n'+activate_url,
+                        'noreply@semycolon.com',
+                        [email],
+                    )
+                availability.registered(username, email)
                 messages.success(request, 'Account successfully created')
                 return render(request, 'authentication/register.html')
 
@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class ExpensesConfig(AppConfig):
     name = 'expenses'
+
+    def ready(self):
+        import expenses.checks  # registers the deploy checks
+        import expenses.signals  # ensures signals are registered
+        import expenseswebsite.profiling  # hooks database connections before any open
@@ -0,0 +1,190 @@
+"""Shared timing helpers for the bench_* management commands.
+
+A *target* sends one request and reports how long it took and how many
+SQL queries it ran: ``ClientTarget`` goes through the Django test client
+in-process (so queries can be counted), ``ServerTarget`` goes over HTTP to
+a running server (latency only). ``run`` times a list of endpoints against
+a target, and baselines are plain JSON so a later run can be compared
+with ``regressions``.
+"""
+import json
+import math
+import secrets
+import statistics
+import time
+import urllib.request
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+
+from expenses.management.commands.seed_benchmark_data import WORDS
+from expenseswebsite.profiling import QueryRecorder
+
+
+def searches(i: int) -> dict:
+    """The body of the ``i``-th search: the seeded words in turn.
+
+    There are more words than ``search.recent`` keeps per session, so every
+    timed search misses that cache and runs its query.
+    """
+    return {"searchText": WORDS[i % len(WORDS)]}
+
+
+def body(data, i: int):
+    """The JSON body of the ``i``-th request; ``data`` may be a function of ``i``."""
+    return data(i) if callable(data) else data
+
+
+def hot_endpoints() -> list:
+    """``(name, method, path, json body)`` for the pages and APIs users hit most."""
+    return [
+        ("expenses", "get", reverse("expenses"), None),
+        ("search", "post", reverse("expense-search"), searches),
+        ("summary", "get", reverse("summary"), None),
+        ("category-summary", "get", reverse("expense-category-summary"), None),
+        ("income", "get", reverse("income"), None),
+        ("income-summary", "get", reverse("income-summary"), None),
+        ("stats", "get", reverse("stats-api"), None),
+    ]
+
+
+def async_endpoints() -> list:
+    """The JSON endpoints implemented as async views."""
+    return [
+        ("search", "post", reverse("expense-search"), searches),
+        ("search-income", "post", reverse("search_income"), searches),
+        ("category-summary", "get", reverse("expense-category-summary"), None),
+        ("income-summary", "get", reverse("income-summary"), None),
+        ("validate-username", "post", reverse("validate-username"), {"username": "someone"}),
+    ]
+
+
+def percentile(samples, pct: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``pct`` in 0-100)."""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(seconds, queries) -> dict:
+    """Latency percentiles in milliseconds plus the worst query count."""
+    ms = [value * 1000 for value in seconds]
+    counted = [count for count in queries if count is not None]
+    return {
+        "requests": len(ms),
+        "p50": round(percentile(ms, 50), 3),
+        "p95": round(percentile(ms, 95), 3),
+        "p99": round(percentile(ms, 99), 3),
+        "mean": round(statistics.fmean(ms), 3),
+        "queries": max(counted) if counted else None,
+    }
+
+
+class ClientTarget:
+    """In-process requests as ``user`` through the Django test client."""
+
+    def __init__(self, user):
+        self.client = Client(HTTP_HOST="localhost")
+        self.client.force_login(user)
+
+    def request(self, method: str, path: str, data=None):
+        recorder = QueryRecorder()
+        kwargs = {}
+        if data is not None:
+            kwargs = {"data": json.dumps(data), "content_type": "application/json"}
+        started = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = getattr(self.client, method)(path, **kwargs)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        elapsed = time.perf_counter() - started
+        _check(method, path, response.status_code)
+        return elapsed, recorder.count
+
+
+class ServerTarget:
+    """HTTP requests to a running server, signed in as ``user``.
+
+    The session is created directly in the database the server uses, and
+    a CSRF cookie/header pair is made up locally so POSTs pass the check.
+    """
+
+    def __init__(self, user, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        client = Client()
+        client.force_login(user)
+        self.csrf_token = secrets.token_hex(16)
+        self.cookie = "; ".join([
+            f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}",
+            f"{settings.CSRF_COOKIE_NAME}={self.csrf_token}",
+        ])
+
+    def request(self, method: str, path: str, data=None):
+        body = json.dumps(data).encode() if data is not None else None
+        request = urllib.request.Request(
+            self.base_url + path, data=body, method=method.upper(),
+            headers={"Cookie": self.cookie, "X-CSRFToken": self.csrf_token,
+                     "Content-Type": "application/json"})
+        started = time.perf_counter()
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            status = response.status
+        elapsed = time.perf_counter() - started
+        _check(method, path, status)
+        return elapsed, None
+
+
+def _check(method, path, status):
+    if status != 200:
+        raise RuntimeError(f"{method.upper()} {path} returned {status}")
+
+
+def run(target, endpoints, requests: int, warmup: int = 5) -> dict:
+    """Time each ``(name, method, path, data)`` endpoint ``requests`` times."""
+    results = {}
+    for name, method, path, data in endpoints:
+        seconds, queries = [], []
+        # One count across warmup and timed requests, so search terms keep cycling.
+        for i in range(warmup + requests):
+            elapsed, count = target.request(method, path, body(data, i))
+            if i >= warmup:
+                seconds.append(elapsed)
+                queries.append(count)
+        results[name] = summarize(seconds, queries)
+    return results
+
+
+def save_baseline(path: str, results: dict):
+    with open(path, "w") as baseline:
+        json.dump(results, baseline, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> dict:
+    with open(path) as baseline:
+        return json.load(baseline)
+
+
+def regressions(results: dict, baseline: dict, tolerance: float = 0.25,
+                slack_ms: float = 1.0, metric: str = "p95") -> list:
+    """Human-readable failures where ``results`` is worse than ``baseline``.
+
+    Latency fails past ``tolerance`` (a fraction) plus ``slack_ms`` of
+    absolute headroom, which keeps sub-millisecond endpoints from failing
+    on noise. Any increase in the query count fails outright.
+    """
+    failures = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        limit = previous[metric] * (1 + tolerance) + slack_ms
+        if current[metric] > limit:
+            failures.append(
+                f"{name}: {metric} {current[metric]:.2f}ms > {limit:.2f}ms "
+                f"(baseline {previous[metric]:.2f}ms)")
+        if None not in (current["queries"], previous["queries"]) and current["queries"] > previous["queries"]:
+            failures.append(
+                f"{name}: {current['queries']} queries, baseline {previous['queries']}")
+    return failures
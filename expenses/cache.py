@@ -0,0 +1,108 @@
+"""Per-owner dashboard cache and data versions.
+
+Entries live in the ``dashboard`` cache alias and are dropped by the
+post_save and post_delete receivers in ``expenses.signals`` whenever one
+of the owner's expenses or incomes changes; bulk writers that bypass the
+signals (the importer, ``rebuild_rollups``) call ``owner_data_changed``
+themselves. The same calls bump the owner's data version, which other
+derived results (search responses, stats ETags) put in their keys instead
+of being invalidated one by one. Those writes happen in whichever process
+saved the rows, so outside a single dev server the alias must be shared
+(database or Redis, see ``CACHES`` in settings and ``expenses.checks``).
+"""
+import time
+
+from django.core.cache import caches
+
+DASHBOARD_TIMEOUT = 60 * 60
+STATS = ("hits", "misses")
+
+
+def _cache():
+    return caches["dashboard"]
+
+
+def _key(owner_id) -> str:
+    return f"dashboard:{owner_id}"
+
+
+def _count(stat: str):
+    key = f"dashboard:stats:{stat}"
+    cache = _cache()
+    if not cache.add(key, 1, timeout=None):
+        cache.incr(key)
+
+
+def get_dashboard(owner_id, build, variant: str = ""):
+    """Return the cached dashboard for ``owner_id``, calling ``build()`` on a miss.
+
+    ``variant`` captures inputs other than the owner's rows (display
+    currency, exchange rates); an entry built for another variant is a miss.
+    """
+    cache = _cache()
+    entry = cache.get(_key(owner_id))
+    if entry is None or entry["variant"] != variant:
+        _count("misses")
+        entry = {"variant": variant, "dashboard": build()}
+        cache.set(_key(owner_id), entry, DASHBOARD_TIMEOUT)
+    else:
+        _count("hits")
+    return entry["dashboard"]
+
+
+def invalidate_dashboard(owner_id):
+    _cache().delete(_key(owner_id))
+
+
+def _version_key(owner_id) -> str:
+    return f"dataversion:{owner_id}"
+
+
+def data_version(owner_id) -> int:
+    """Changes whenever the owner's expenses or incomes do."""
+    cache = _cache()
+    version = cache.get(_version_key(owner_id))
+    if version is None:
+        # Seeded from the clock so an evicted counter never repeats a value.
+        cache.add(_version_key(owner_id), time.time_ns(), timeout=None)
+        version = cache.get(_version_key(owner_id))
+    return version
+
+
+async def adata_version(owner_id) -> int:
+    cache = _cache()
+    version = await cache.aget(_version_key(owner_id))
+    if version is None:
+        await cache.aadd(_version_key(owner_id), time.time_ns(), timeout=None)
+        version = await cache.aget(_version_key(owner_id))
+    return version
+
+
+def bump_data_version(owner_id):
+    cache = _cache()
+    try:
+        cache.incr(_version_key(owner_id))
+    except ValueError:
+        cache.add(_version_key(owner_id), time.time_ns(), timeout=None)
+
+
+def owner_data_changed(owner_id):
+    """Drop the owner's dashboard and move their data version on."""
+    invalidate_dashboard(owner_id)
+    bump_data_version(owner_id)
+
+
+def stats() -> dict:
+    counts = _cache().get_many([f"dashboard:stats:{stat}" for stat in STATS])
+    hits = counts.get("dashboard:stats:hits", 0)
+    misses = counts.get("dashboard:stats:misses", 0)
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / lookups if lookups else None,
+    }
+
+
+def reset_stats():
+    _cache().delete_many([f"dashboard:stats:{stat}" for stat in STATS])
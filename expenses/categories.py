@@ -0,0 +1,65 @@
+"""Process-level registry of expense categories.
+
+Categories are a short list that changes rarely, yet every add/edit form
+and every saved expense's search document needs them. The registry loads
+the table once and serves the rows and the name/id maps from memory,
+reloading at most every ``CATEGORY_TTL`` seconds and immediately when a
+category is saved or deleted in this process (see ``expenses.signals``).
+Other processes pick up changes within the TTL; a name that is not
+known yet triggers one reload before it is reported missing.
+"""
+import threading
+import time
+
+from .models import Category
+
+CATEGORY_TTL = 300
+
+
+class CategoryRegistry:
+    def __init__(self):
+        self._snapshot = None
+        self._loaded_at = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        self._snapshot = None
+
+    def _load(self) -> tuple:
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._loaded_at < CATEGORY_TTL:
+            return snapshot
+        rows = list(Category.objects.all())
+        snapshot = (rows, {row.name: row.id for row in rows}, {row.id: row.name for row in rows})
+        with self._lock:
+            self._snapshot, self._loaded_at = snapshot, time.monotonic()
+        return snapshot
+
+    def all(self) -> list:
+        """The Category rows, for rendering only; treat them as read-only."""
+        return self._load()[0]
+
+    def ids(self, expect: str = None) -> dict:
+        """``{name: id}``, reloaded first if ``expect`` is not in it."""
+        ids = self._load()[1]
+        if expect and expect not in ids:
+            self.invalidate()
+            ids = self._load()[1]
+        return ids
+
+    def names(self, expect: int = None) -> dict:
+        """``{id: name}``, reloaded first if ``expect`` is not in it."""
+        names = self._load()[2]
+        if expect and expect not in names:
+            self.invalidate()
+            names = self._load()[2]
+        return names
+
+    def id_of(self, name: str):
+        return self.ids(expect=name).get(name)
+
+    def name_of(self, category_id: int):
+        return self.names(expect=category_id).get(category_id)
+
+
+registry = CategoryRegistry()
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Aliases written from signals in any process and read by every web worker.
+SHARED_CACHE_ALIASES = ("dashboard",)
+PER_PROCESS_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",
+                        "django.core.cache.backends.dummy.DummyCache")
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_caches(app_configs, **kwargs):
+    return [
+        Warning(
+            f"The {alias!r} cache uses {settings.CACHES[alias]['BACKEND']}, which each "
+            "process keeps to itself, so invalidations made in one worker or management "
+            "command never reach the others.",
+            hint="Set DASHBOARD_CACHE_BACKEND to 'db' (after createcachetable) or 'redis'.",
+            id="expenses.W001",
+        )
+        for alias in SHARED_CACHE_ALIASES
+        if settings.CACHES.get(alias, {}).get("BACKEND") in PER_PROCESS_BACKENDS
+    ]
@@ -0,0 +1,156 @@
+"""Bulk expense import from CSV or OFX files.
+
+Files are parsed as a stream of ``(line_number, fields)`` pairs, validated
+with the same rules as ``add_expense`` against an in-memory category map,
+and written with ``bulk_create`` in batches. bulk_create skips model
+signals, so the search document, monthly rollup and dashboard cache are
+maintained here directly.
+"""
+import csv
+import re
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+
+from userpreferences import currencies
+
+from . import rollups
+from .cache import owner_data_changed
+from .models import Category, Expense, ExpenseMonthlyRollup
+from .search import build_search_document
+from .validation import ExpenseRowError, clean_expense
+
+BATCH_SIZE = 1000
+FORMATS = ("csv", "ofx")
+# Codecs an upload may be declared in; bank exports are often Windows-1252.
+ENCODINGS = {
+    "utf-8-sig": "UTF-8",
+    "cp1252": "Windows-1252",
+    "latin-1": "ISO-8859-1",
+}
+
+OFX_TAG = re.compile(r"<(/?)([A-Z0-9.]+)>([^<]*)")
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        self.errors = []
+
+    def add_error(self, line: int, message: str):
+        self.errors.append((line, message))
+
+
+def parse_csv(lines):
+    """Rows from a CSV with date, description, category and amount columns.
+
+    ``lines`` is any iterable of text lines. The header matches the CSV
+    export, so exported files import unchanged; the currency column is
+    optional.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, {
+            "amount": (row.get("amount") or "").strip(),
+            "description": row.get("description") or "",
+            "date": (row.get("date") or row.get("expense_date") or "").strip(),
+            "category": (row.get("category") or "").strip(),
+            "currency": (row.get("currency") or "").strip().upper(),
+        }
+
+
+def parse_ofx(lines):
+    """Debit transactions from an OFX statement (SGML or XML flavour)."""
+    transaction_fields = None
+    start_line = 0
+    for line_number, line in enumerate(lines, start=1):
+        for closing, tag, value in OFX_TAG.findall(line):
+            value = value.strip()
+            if tag == "STMTTRN":
+                if not closing:
+                    transaction_fields, start_line = {}, line_number
+                elif transaction_fields is not None:
+                    yield start_line, _ofx_expense(transaction_fields)
+                    transaction_fields = None
+            elif transaction_fields is not None and not closing and value:
+                transaction_fields[tag] = value
+
+
+def _ofx_expense(fields: dict) -> dict:
+    amount = fields.get("TRNAMT", "")
+    posted = fields.get("DTPOSTED", "")[:8]
+    date = f"{posted[:4]}-{posted[4:6]}-{posted[6:8]}" if len(posted) == 8 else posted
+    expense = {
+        "amount": amount.lstrip("-"),
+        "description": fields.get("MEMO") or fields.get("NAME") or "",
+        "date": date,
+        "category": "",
+        "currency": "",
+    }
+    # Debits are negative in OFX; a credit isn't an expense.
+    if amount and not amount.startswith("-"):
+        expense["error"] = "Credit transactions are not expenses"
+    return expense
+
+
+PARSERS = {"csv": parse_csv, "ofx": parse_ofx}
+
+
+def import_expenses(owner, rows, default_category: str = "", default_currency: str = None,
+                    batch_size: int = BATCH_SIZE) -> ImportReport:
+    """Validate and bulk insert ``rows`` for ``owner``, collecting per-row errors.
+
+    Rows without a currency are recorded in ``default_currency`` (the base
+    currency unless given).
+    """
+    default_currency = default_currency or settings.FX_BASE_CURRENCY
+    report = ImportReport()
+    category_ids = dict(Category.objects.values_list("name", "id"))
+    category_names = {pk: name for name, pk in category_ids.items()}
+    buckets = defaultdict(lambda: [0, 0])
+    batch = []
+
+    with transaction.atomic():
+        for line, fields in rows:
+            if fields.get("error"):
+                report.add_error(line, fields["error"])
+                continue
+            try:
+                cleaned = clean_expense(
+                    fields["amount"], fields["description"], fields["date"],
+                    fields["category"] or default_category, category_ids)
+            except ExpenseRowError as exc:
+                report.add_error(line, str(exc))
+                continue
+            currency = fields.get("currency") or default_currency
+            if currency not in currencies.registry:
+                report.add_error(line, f"Unknown currency {currency!r}")
+                continue
+
+            expense = Expense(owner=owner, currency=currency, **cleaned)
+            expense.search_document = build_search_document(
+                expense, category_names[expense.category_id])
+            batch.append(expense)
+            bucket = buckets[(rollups.month_start(expense.expense_date), expense.category_id, currency)]
+            bucket[0] += expense.amount
+            bucket[1] += 1
+
+            if len(batch) >= batch_size:
+                Expense.objects.bulk_create(batch)
+                report.created += len(batch)
+                batch = []
+        if batch:
+            Expense.objects.bulk_create(batch)
+            report.created += len(batch)
+
+        for (month, category_id, currency), (amount, count) in buckets.items():
+            rollups.apply_delta(
+                ExpenseMonthlyRollup,
+                {"owner_id": owner.pk, "month": month, "category_id": category_id,
+                 "currency": currency},
+                amount, count)
+
+    if report.created:
+        owner_data_changed(owner.pk)
+    return report
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient
+
+from authentication import availability
+from expenses import benchmarking
+
+
+class LocalhostAsyncClient(AsyncClient):
+    """AsyncClient that sends ``Host: localhost``, like ClientTarget.
+
+    AsyncRequestFactory always adds ``Host: testserver``, which only the test
+    runner allows, and a ``host`` passed in ``headers`` is appended to it
+    rather than replacing it.
+    """
+
+    def _base_scope(self, **request):
+        scope = super()._base_scope(**request)
+        scope["headers"] = [(name, b"localhost" if name == b"host" else value)
+                            for name, value in scope["headers"]]
+        return scope
+
+
+class Command(BaseCommand):
+    help = ("Compare concurrent throughput of the async JSON endpoints on the ASGI "
+            "path against the WSGI path. Both paths run the same async views; under "
+            "WSGI Django wraps each one in async_to_sync, so the comparison is the "
+            "request path, not an async implementation against a sync one.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", default="bench0000",
+                            help="Username to request as (see seed_benchmark_data).")
+        parser.add_argument("--requests", type=int, default=400, help="Requests per endpoint and path.")
+        parser.add_argument("--concurrency", type=int, default=32,
+                            help="Requests in flight at once.")
+        parser.add_argument("--only", nargs="+", help="Endpoint names to run.")
+        parser.add_argument("--asgi-url",
+                            help="A running ASGI server, e.g. "
+                                 "`uvicorn expenseswebsite.asgi:application --port 8001`.")
+        parser.add_argument("--wsgi-url",
+                            help="A running WSGI server, e.g. `manage.py runserver 8000`.")
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}; run seed_benchmark_data first")
+        if bool(options["asgi_url"]) != bool(options["wsgi_url"]):
+            raise CommandError("Pass both --asgi-url and --wsgi-url, or neither")
+
+        selected = benchmarking.async_endpoints()
+        if options["only"]:
+            selected = [endpoint for endpoint in selected if endpoint[0] in options["only"]]
+        requests, concurrency = options["requests"], options["concurrency"]
+        if not options["asgi_url"]:
+            # In process, every request comes from 127.0.0.1; give that address
+            # room for both paths so validate-username is timed, not throttled.
+            availability.limiter.burst = 2 * requests
+            availability.limiter.clear()
+
+        self.stdout.write(f"{'endpoint':<20}{'path':<6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+        for endpoint in selected:
+            if options["asgi_url"]:
+                runs = {
+                    "asgi": self.threaded(lambda: benchmarking.ServerTarget(owner, options["asgi_url"]),
+                                          endpoint, requests, concurrency),
+                    "wsgi": self.threaded(lambda: benchmarking.ServerTarget(owner, options["wsgi_url"]),
+                                          endpoint, requests, concurrency),
+                }
+            else:
+                runs = {
+                    "asgi": asyncio.run(self.in_process_asgi(owner, endpoint, requests, concurrency)),
+                    "wsgi": self.threaded(lambda: benchmarking.ClientTarget(owner),
+                                          endpoint, requests, concurrency),
+                }
+            for path, (seconds, elapsed) in runs.items():
+                result = benchmarking.summarize(seconds, [])
+                self.stdout.write(
+                    f"{endpoint[0]:<20}{path:<6}{len(seconds) / elapsed:>9.1f}"
+                    f"{result['p50']:>9.2f}{result['p95']:>9.2f}{result['p99']:>9.2f}")
+
+    def threaded(self, make_target, endpoint, requests, concurrency):
+        """``concurrency`` threads, each with its own target, sharing ``requests``."""
+        _, method, path, data = endpoint
+        targets = [make_target() for _ in range(concurrency)]
+        per_target = max(requests // concurrency, 1)
+
+        def drive(target):
+            return [target.request(method, path, benchmarking.body(data, i))[0]
+                    for i in range(per_target)]
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            started = time.perf_counter()
+            seconds = [value for batch in executor.map(drive, targets) for value in batch]
+            elapsed = time.perf_counter() - started
+        return seconds, elapsed
+
+    async def in_process_asgi(self, owner, endpoint, requests, concurrency):
+        """``concurrency`` coroutines on one event loop through Django's ASGI handler."""
+        _, method, path, data = endpoint
+        clients = []
+        for _ in range(concurrency):
+            client = LocalhostAsyncClient()
+            await client.aforce_login(owner)
+            clients.append(client)
+        per_client = max(requests // concurrency, 1)
+        seconds = []
+
+        async def drive(client):
+            for i in range(per_client):
+                kwargs = {}
+                if data is not None:
+                    kwargs = {"data": json.dumps(benchmarking.body(data, i)),
+                              "content_type": "application/json"}
+                started = time.perf_counter()
+                response = await getattr(client, method)(path, **kwargs)
+                seconds.append(time.perf_counter() - started)
+                if response.status_code != 200:
+                    raise CommandError(f"{method.upper()} {path} returned {response.status_code}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(drive(client) for client in clients))
+        return seconds, time.perf_counter() - started
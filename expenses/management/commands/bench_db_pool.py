@@ -0,0 +1,121 @@
+import os
+import shlex
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.urls import reverse
+
+from expenses import benchmarking
+
+# Environment for each connection strategy; settings read these at import
+# time, so every mode gets its own server process.
+MODES = {
+    "fresh": {"DB_POOL": "off", "DB_CONN_MAX_AGE": "0"},
+    "persistent": {"DB_POOL": "off", "DB_CONN_MAX_AGE": "60"},
+    "pool": {"DB_POOL": "on"},
+}
+# A real server, so request_started/request_finished close or return
+# connections as they do in production (the test client disconnects them).
+SERVER_COMMAND = ("{python} -m uvicorn expenseswebsite.asgi:application "
+                  "--host 127.0.0.1 --port {port} --workers {workers} --log-level warning")
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = ("Compare requests per second on the expenses index with fresh, "
+            "persistent and pooled database connections (Postgres only). Each mode "
+            "starts its own server process and is loaded over HTTP.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", required=True,
+                            help="Username whose expenses index is requested.")
+        parser.add_argument("--requests", type=int, default=500,
+                            help="Requests per mode, spread across the threads.")
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--warmup", type=int, default=20,
+                            help="Untimed requests per thread before measuring.")
+        parser.add_argument("--workers", type=int, default=2, help="Server worker processes.")
+        parser.add_argument("--server-command", default=SERVER_COMMAND,
+                            help="Server to start per mode; {python}, {port} and {workers} "
+                                 "are filled in (e.g. a gunicorn command line).")
+        parser.add_argument("--startup-timeout", type=float, default=30)
+        parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("bench_db_pool needs the Postgres database configured in settings")
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}")
+
+        results = {mode: self.run_mode(mode, owner, options) for mode in options["modes"]}
+        baseline = results.get("fresh")
+        self.stdout.write(f"{'mode':<12}{'requests':>10}{'seconds':>10}{'req/s':>10}{'speedup':>10}")
+        for mode, result in results.items():
+            speedup = f"{result['rps'] / baseline['rps']:.2f}x" if baseline else "-"
+            self.stdout.write(
+                f"{mode:<12}{result['requests']:>10}{result['seconds']:>10.2f}"
+                f"{result['rps']:>10.1f}{speedup:>10}")
+
+    def run_mode(self, mode, owner, options):
+        port = free_port()
+        command = shlex.split(options["server_command"].format(
+            python=sys.executable, port=port, workers=options["workers"]))
+        server = subprocess.Popen(command, env={**os.environ, **MODES[mode]}, cwd=settings.BASE_DIR,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        try:
+            base_url = f"http://127.0.0.1:{port}"
+            self.wait_until_up(server, base_url, options["startup_timeout"])
+            return self.load(mode, owner, base_url, options)
+        finally:
+            server.terminate()
+            try:
+                server.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+
+    def wait_until_up(self, server, base_url, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f"Server exited with {server.returncode}:\n{server.stderr.read()}")
+            try:
+                urllib.request.urlopen(base_url + reverse("login"), timeout=1).close()
+                return
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.1)
+        raise CommandError(f"Server did not answer on {base_url} within {timeout:.0f}s")
+
+    def load(self, mode, owner, base_url, options):
+        path = reverse("expenses")
+        concurrency = options["concurrency"]
+        per_thread = max(options["requests"] // concurrency, 1)
+        targets = [benchmarking.ServerTarget(owner, base_url) for _ in range(concurrency)]
+
+        def hammer(target, count):
+            for _ in range(count):
+                target.request("get", path)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(hammer, targets, [options["warmup"]] * concurrency))
+            started = time.perf_counter()
+            list(executor.map(hammer, targets, [per_thread] * concurrency))
+            elapsed = time.perf_counter() - started
+
+        total = per_thread * concurrency
+        return {"mode": mode, "requests": total, "seconds": elapsed, "rps": total / elapsed}
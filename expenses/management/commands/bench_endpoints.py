@@ -0,0 +1,59 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from expenses import benchmarking
+
+
+class Command(BaseCommand):
+    help = ("Time the hot endpoints for one user and report p50/p95/p99 latency and "
+            "query counts; optionally save a baseline or fail on regressions against one.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", default="bench0000",
+                            help="Username to request as (see seed_benchmark_data).")
+        parser.add_argument("--requests", type=int, default=100, help="Timed requests per endpoint.")
+        parser.add_argument("--warmup", type=int, default=5)
+        parser.add_argument("--base-url",
+                            help="Hit a running server instead of the in-process test client "
+                                 "(query counts are then unavailable).")
+        parser.add_argument("--only", nargs="+", help="Endpoint names to run.")
+        parser.add_argument("--save-baseline", metavar="PATH")
+        parser.add_argument("--baseline", metavar="PATH", help="Fail if results regress against this file.")
+        parser.add_argument("--tolerance", type=float, default=0.25,
+                            help="Allowed p95 slowdown as a fraction of the baseline.")
+        parser.add_argument("--slack-ms", type=float, default=1.0,
+                            help="Absolute p95 headroom on top of --tolerance.")
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}; run seed_benchmark_data first")
+
+        selected = benchmarking.hot_endpoints()
+        if options["only"]:
+            selected = [endpoint for endpoint in selected if endpoint[0] in options["only"]]
+        if options["base_url"]:
+            target = benchmarking.ServerTarget(owner, options["base_url"])
+        else:
+            target = benchmarking.ClientTarget(owner)
+
+        results = benchmarking.run(target, selected, options["requests"], options["warmup"])
+
+        self.stdout.write(f"{'endpoint':<18}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'queries':>9}")
+        for name, result in results.items():
+            queries = "-" if result["queries"] is None else result["queries"]
+            self.stdout.write(
+                f"{name:<18}{result['p50']:>9.2f}{result['p95']:>9.2f}"
+                f"{result['p99']:>9.2f}{queries:>9}")
+
+        if options["save_baseline"]:
+            benchmarking.save_baseline(options["save_baseline"], results)
+            self.stdout.write(f"Baseline saved to {options['save_baseline']}")
+        if options["baseline"]:
+            failures = benchmarking.regressions(
+                results, benchmarking.load_baseline(options["baseline"]),
+                tolerance=options["tolerance"], slack_ms=options["slack_ms"])
+            if failures:
+                raise CommandError("Regressions against baseline:\n" + "\n".join(failures))
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline"))
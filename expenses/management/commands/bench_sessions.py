@@ -0,0 +1,95 @@
+import time
+from datetime import date
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from expenses import categories
+from expenses.models import Expense
+
+
+class Command(BaseCommand):
+    help = ("Walk the expenses CRUD flow (list, add, edit, delete) under each session "
+            "mode and report django_session reads/writes and total queries per request. "
+            "Everything the flow writes is rolled back.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", default="bench0000",
+                            help="Username to run the flow as (see seed_benchmark_data).")
+        parser.add_argument("--rounds", type=int, default=20, help="Times to walk the flow per mode.")
+        parser.add_argument("--modes", nargs="+", choices=settings.SESSION_ENGINES,
+                            default=list(settings.SESSION_ENGINES))
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}; run seed_benchmark_data first")
+        if not categories.registry.all():
+            raise CommandError("Create at least one category first")
+
+        self.stdout.write(f"{'mode':<16}{'requests':>10}{'reads/req':>11}{'writes/req':>12}"
+                          f"{'queries/req':>13}{'ms/req':>9}")
+        for mode in options["modes"]:
+            with override_settings(SESSION_ENGINE=settings.SESSION_ENGINES[mode],
+                                   MESSAGE_STORAGE=settings.MESSAGE_STORAGES[mode]):
+                result = self.run_mode(owner, options["rounds"])
+            requests = result["requests"]
+            self.stdout.write(
+                f"{mode:<16}{requests:>10}{result['reads'] / requests:>11.2f}"
+                f"{result['writes'] / requests:>12.2f}{result['queries'] / requests:>13.2f}"
+                f"{result['seconds'] * 1000 / requests:>9.2f}")
+
+    def run_mode(self, owner, rounds):
+        result = {"requests": 0, "reads": 0, "writes": 0, "queries": 0, "seconds": 0.0}
+        with transaction.atomic():
+            # A new client per mode, so its middleware picks up the session engine.
+            client = Client(HTTP_HOST="localhost")
+            client.force_login(owner)
+            for _ in range(rounds):
+                for method, path, data in self.flow(client, owner):
+                    self.measure(client, method, path, data, result)
+            transaction.set_rollback(True)
+        return result
+
+    def flow(self, client, owner):
+        """The CRUD walk as ``(method, path, data)``; paths may depend on earlier steps."""
+        today = date.today().isoformat()
+        category = categories.registry.all()[0].name
+        yield "get", reverse("expenses"), None
+        yield "get", reverse("expense-add"), None
+        yield "post", reverse("expense-add"), {
+            "amount": "12.50", "description": "session bench", "expense_date": today,
+            "category": category}
+        yield "get", reverse("expenses"), None
+        expense = Expense.objects.filter(owner=owner, description="session bench").latest("id")
+        yield "get", reverse("expense-edit", args=[expense.pk]), None
+        yield "post", reverse("expense-edit", args=[expense.pk]), {
+            "amount": "15.00", "description": "session bench", "expense_date": today,
+            "category": category}
+        yield "post", reverse("expense-delete", args=[expense.pk]), None
+        yield "get", reverse("expenses"), None
+
+    def measure(self, client, method, path, data, result):
+        started = time.perf_counter()
+        with CaptureQueriesContext(connection) as captured:
+            response = getattr(client, method)(path, data)
+        result["seconds"] += time.perf_counter() - started
+        if response.status_code >= 400:
+            raise CommandError(f"{method.upper()} {path} returned {response.status_code}")
+
+        result["requests"] += 1
+        result["queries"] += len(captured.captured_queries)
+        for query in captured.captured_queries:
+            sql = query["sql"]
+            if "django_session" not in sql:
+                continue
+            if sql.lstrip().upper().startswith("SELECT"):
+                result["reads"] += 1
+            else:
+                result["writes"] += 1
@@ -0,0 +1,89 @@
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Run in a fresh interpreter so nothing is already imported. Prints the
+# seconds spent importing the settings module and in the whole of setup().
+SETUP_SNIPPET = (
+    "import importlib, os, time; started = time.perf_counter(); "
+    "importlib.import_module(os.environ['DJANGO_SETTINGS_MODULE']); "
+    "imported = time.perf_counter(); import django; django.setup(); "
+    "print(imported - started, time.perf_counter() - started)"
+)
+
+
+def parse_importtime(stderr: str) -> list:
+    """``(module, self_us, cumulative_us, depth)`` rows from ``-X importtime`` output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # the header row
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), self_us, cumulative_us, depth))
+    return rows
+
+
+class Command(BaseCommand):
+    help = ("Time django.setup() in fresh interpreters and break down where import time "
+            "goes, to keep worker cold starts fast.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to time.")
+        parser.add_argument("--settings-modules", nargs="+", metavar="MODULE",
+                            help="Settings modules to compare (default: the current one).")
+        parser.add_argument("--top", type=int, default=15,
+                            help="Slowest top-level imports to list.")
+        parser.add_argument("--max-ms", type=float,
+                            help="Fail if the median django.setup() takes longer than this.")
+
+    def handle(self, *args, **options):
+        modules = options["settings_modules"] or [os.environ.get(
+            "DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE)]
+        failures = []
+        for module in modules:
+            env = {**os.environ, "DJANGO_SETTINGS_MODULE": module}
+            timings = [self.time_setup(env) for _ in range(options["runs"])]
+            seconds = [setup for _, setup in timings]
+            median_ms = statistics.median(seconds) * 1000
+            self.stdout.write(
+                f"{module}: django.setup() median {median_ms:.1f} ms, "
+                f"min {min(seconds) * 1000:.1f} ms over {len(seconds)} runs; settings import "
+                f"median {statistics.median(settings for settings, _ in timings) * 1000:.1f} ms")
+            self.report_imports(env, options["top"])
+            if options["max_ms"] is not None and median_ms > options["max_ms"]:
+                failures.append(f"{module}: {median_ms:.1f} ms > {options['max_ms']:.1f} ms")
+
+        if failures:
+            raise CommandError("Startup over budget:\n" + "\n".join(failures))
+
+    def run(self, env, *args):
+        finished = subprocess.run([sys.executable, *args, "-c", SETUP_SNIPPET], env=env,
+                                  cwd=settings.BASE_DIR, capture_output=True, text=True)
+        if finished.returncode:
+            raise CommandError(f"django.setup() failed:\n{finished.stderr}")
+        return finished
+
+    def time_setup(self, env) -> tuple:
+        """``(settings import, setup)`` seconds; setup includes the settings import."""
+        settings_seconds, setup_seconds = self.run(env).stdout.strip().splitlines()[-1].split()
+        return float(settings_seconds), float(setup_seconds)
+
+    def report_imports(self, env, top):
+        # -X importtime only sees import statements, not importlib.import_module().
+        rows = parse_importtime(self.run(env, "-X", "importtime").stderr)
+        total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+        self.stdout.write(f"  import statements {total_us / 1000:.1f} ms in total")
+        self.stdout.write(f"  {'module':<48}{'cumulative ms':>15}{'self ms':>10}")
+        top_level = sorted((row for row in rows if row[3] == 0), key=lambda row: -row[2])
+        for name, self_us, cumulative_us, _ in top_level[:top]:
+            self.stdout.write(f"  {name:<48}{cumulative_us / 1000:>15.1f}{self_us / 1000:>10.1f}")
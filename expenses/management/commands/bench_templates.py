@@ -0,0 +1,64 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.template import Engine, RequestContext, engines
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+UNCACHED_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+CACHED_LOADERS = [("django.template.loaders.cached.Loader", UNCACHED_LOADERS)]
+
+MODES = [
+    ("no caching", UNCACHED_LOADERS),
+    ("cached loader", CACHED_LOADERS),
+]
+
+
+class Command(BaseCommand):
+    help = ("Render each layout template with and without the cached template "
+            "loader, and report ms and queries per render.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", default="bench0000",
+                            help="Username to render as (see seed_benchmark_data).")
+        parser.add_argument("--renders", type=int, default=200, help="Renders per template and mode.")
+        parser.add_argument("--templates", nargs="+", default=["base.html"])
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}; run seed_benchmark_data first")
+        request = RequestFactory().get("/", HTTP_HOST="localhost")
+        request.user = owner
+
+        self.stdout.write(f"{'template':<28}{'mode':<22}{'ms/render':>11}{'queries/render':>16}")
+        for name in options["templates"]:
+            for label, loaders in MODES:
+                seconds, queries = self.measure(self.engine(loaders), name, request, options["renders"])
+                self.stdout.write(f"{name:<28}{label:<22}{seconds * 1000:>11.3f}{queries:>16.2f}")
+
+    def engine(self, loaders) -> Engine:
+        """An engine like the configured one, but with the given loaders."""
+        configured = engines["django"].engine
+        return Engine(dirs=configured.dirs, loaders=loaders,
+                      context_processors=configured.context_processors,
+                      libraries=configured.libraries, debug=False)
+
+    def measure(self, engine, name, request, renders) -> tuple:
+        """Mean ``(seconds, queries)`` per render, after one untimed render."""
+        engine.get_template(name).render(RequestContext(request))
+        seconds, queries = 0.0, 0
+        for _ in range(renders):
+            started = time.perf_counter()
+            with CaptureQueriesContext(connection) as captured:
+                # Looked up every time, as render() does; only the cached loader keeps it.
+                engine.get_template(name).render(RequestContext(request))
+            seconds += time.perf_counter() - started
+            queries += len(captured.captured_queries)
+        return seconds / renders, queries / renders
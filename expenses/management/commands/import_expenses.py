@@ -0,0 +1,53 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from expenses import importers
+from userpreferences import fx
+
+
+class Command(BaseCommand):
+    help = "Bulk import expenses for one user from a CSV or OFX file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--owner", required=True, help="Username to import for.")
+        parser.add_argument("--format", choices=importers.FORMATS,
+                            help="File format; defaults to the file extension.")
+        parser.add_argument("--category", default="",
+                            help="Category for rows without one (OFX has none).")
+        parser.add_argument("--currency",
+                            help="Currency for rows without one; defaults to the owner's preference.")
+        parser.add_argument("--encoding", choices=importers.ENCODINGS, default="utf-8-sig")
+        parser.add_argument("--batch-size", type=int, default=importers.BATCH_SIZE)
+        parser.add_argument("--max-errors", type=int, default=50,
+                            help="How many row errors to print.")
+
+    def handle(self, *args, **options):
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}")
+
+        fmt = options["format"] or options["path"].rsplit(".", 1)[-1].lower()
+        if fmt not in importers.PARSERS:
+            raise CommandError(f"Unsupported format {fmt!r}; use --format")
+
+        started = time.perf_counter()
+        with open(options["path"], encoding=options["encoding"], newline="") as source:
+            try:
+                report = importers.import_expenses(
+                    owner, importers.PARSERS[fmt](source),
+                    default_category=options["category"],
+                    default_currency=options["currency"] or fx.preferred_currency(owner),
+                    batch_size=options["batch_size"])
+            except UnicodeDecodeError as exc:
+                raise CommandError(f"{exc}; pass --encoding. Nothing was imported.")
+        elapsed = time.perf_counter() - started
+
+        for line, message in report.errors[:options["max_errors"]]:
+            self.stderr.write(f"line {line}: {message}")
+        self.stdout.write(
+            f"Imported {report.created} expenses, rejected {len(report.errors)} "
+            f"in {elapsed:.2f}s")
@@ -0,0 +1,33 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from expenses import rollups
+from expenses.cache import owner_data_changed
+
+
+class Command(BaseCommand):
+    help = "Recompute the monthly expense and income rollup tables from raw rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--owner", help="Only rebuild rollups for this username.")
+
+    def handle(self, *args, **options):
+        owner = None
+        if options["owner"]:
+            try:
+                owner = User.objects.get(username=options["owner"])
+            except User.DoesNotExist:
+                raise CommandError(f"No user named {options['owner']!r}")
+
+        for source_model, rollup_model in rollups.TRACKED:
+            rollups.rebuild(source_model, rollup_model, owner=owner)
+            rows = rollup_model.objects.all()
+            if owner is not None:
+                rows = rows.filter(owner=owner)
+            self.stdout.write(
+                f"{rollup_model._meta.label}: {rows.count()} buckets rebuilt")
+
+        # Cached dashboards and versioned responses were built from the old rows.
+        owners = [owner.pk] if owner else User.objects.values_list("pk", flat=True).iterator()
+        for owner_id in owners:
+            owner_data_changed(owner_id)
@@ -0,0 +1,109 @@
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from expenses import rollups
+from expenses.cache import owner_data_changed
+from expenses.models import Category, Expense
+from expenses.search import build_search_document
+from income.models import Income
+from userincome.models import Source, UserIncome
+
+DEFAULT_CATEGORIES = ["Food", "Rent", "Transport", "Utilities", "Entertainment", "Health"]
+DEFAULT_SOURCES = ["Salary", "Freelance", "Investments"]
+WORDS = ["lunch", "groceries", "taxi", "coffee", "rent", "power", "cinema",
+         "pharmacy", "dinner", "bus", "internet", "gym", "books", "fuel"]
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = ("Create N users with M expenses and incomes each for benchmarking. "
+            "Everything is generated from --seed, so runs are reproducible.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=10)
+        parser.add_argument("--expenses", type=int, default=1000, help="Expenses per user.")
+        parser.add_argument("--incomes", type=int, default=200,
+                            help="Income and user income rows per user (each).")
+        parser.add_argument("--days", type=int, default=365, help="How far back dates go.")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--prefix", default="bench", help="Username prefix.")
+        parser.add_argument("--password", default="bench-password")
+        parser.add_argument("--reset", action="store_true",
+                            help="Delete existing users with the prefix first.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        prefix = options["prefix"]
+
+        with transaction.atomic():
+            if options["reset"]:
+                deleted = User.objects.filter(username__startswith=prefix).delete()[0]
+                self.stdout.write(f"Deleted {deleted} rows for existing {prefix}* users")
+
+            categories = self.ensure(Category, DEFAULT_CATEGORIES)
+            sources = [source.name for source in self.ensure(Source, DEFAULT_SOURCES)]
+            income_categories = [code for code, _ in Income.CATEGORY_CHOICES]
+
+            password = make_password(options["password"])
+            users = User.objects.bulk_create(
+                User(username=f"{prefix}{i:04d}", email=f"{prefix}{i:04d}@example.com",
+                     password=password)
+                for i in range(options["users"]))
+            # bulk_create only fills primary keys on some backends.
+            users = list(User.objects.filter(username__in=[user.username for user in users]))
+
+            today = date.today()
+
+            def some_day():
+                return today - timedelta(days=rng.randrange(options["days"]))
+
+            def amount(low, high):
+                return Decimal(rng.randrange(low * 100, high * 100)) / 100
+
+            expenses, incomes, user_incomes = [], [], []
+            for user in users:
+                for _ in range(options["expenses"]):
+                    category = rng.choice(categories)
+                    expense = Expense(
+                        owner=user, category=category, amount=amount(1, 500),
+                        description=" ".join(rng.sample(WORDS, 2)),
+                        expense_date=some_day(), currency=settings.FX_BASE_CURRENCY)
+                    expense.search_document = build_search_document(expense, category.name)
+                    expenses.append(expense)
+                for _ in range(options["incomes"]):
+                    incomes.append(Income(
+                        owner=user, category=rng.choice(income_categories),
+                        amount=amount(50, 5000), date=some_day(),
+                        description=rng.choice(WORDS), currency=settings.FX_BASE_CURRENCY))
+                    user_incomes.append(UserIncome(
+                        owner=user, source=rng.choice(sources),
+                        amount=amount(50, 5000), date=some_day(),
+                        description=rng.choice(WORDS), currency=settings.FX_BASE_CURRENCY))
+
+            Expense.objects.bulk_create(expenses, batch_size=BATCH_SIZE)
+            Income.objects.bulk_create(incomes, batch_size=BATCH_SIZE)
+            UserIncome.objects.bulk_create(user_incomes, batch_size=BATCH_SIZE)
+
+            # bulk_create skips the signals that maintain the rollups.
+            for source_model, rollup_model in rollups.TRACKED:
+                rollups.rebuild(source_model, rollup_model)
+
+        for user in users:
+            owner_data_changed(user.pk)
+        self.stdout.write(
+            f"Created {len(users)} users ({prefix}0000..) with {len(expenses)} expenses, "
+            f"{len(incomes)} incomes and {len(user_incomes)} user incomes")
+
+    def ensure(self, model, names):
+        """Existing rows of a lookup model, creating ``names`` if there are none."""
+        rows = list(model.objects.all())
+        if not rows:
+            rows = [model.objects.create(name=name) for name in names]
+        return rows
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:51
+
+from django.contrib.postgres.operations import BtreeGinExtension
+from django.db import migrations, models
+
+SEARCH_INDEX_NAME = "expense_owner_search_gin"
+
+
+def populate_search_document(apps, schema_editor):
+    Expense = apps.get_model("expenses", "Expense")
+    batch = []
+    for expense in Expense.objects.select_related("category").iterator(chunk_size=1000):
+        parts = [str(expense.amount), str(expense.expense_date),
+                 expense.description or "", expense.category.name]
+        expense.search_document = " ".join(parts).lower()
+        batch.append(expense)
+        if len(batch) >= 1000:
+            Expense.objects.bulk_update(batch, ["search_document"])
+            batch = []
+    if batch:
+        Expense.objects.bulk_update(batch, ["search_document"])
+
+
+def create_search_index(apps, schema_editor):
+    # GIN is Postgres-only; other backends use the substring fallback.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+    from django.db.models import F
+
+    Expense = apps.get_model("expenses", "Expense")
+    schema_editor.add_index(Expense, GinIndex(
+        F("owner"),
+        SearchVector("search_document", config="simple"),
+        name=SEARCH_INDEX_NAME,
+    ))
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="expense",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(populate_search_document, migrations.RunPython.noop),
+        BtreeGinExtension(),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
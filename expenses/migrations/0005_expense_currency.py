@@ -0,0 +1,90 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:01
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+CENTS = Decimal("0.01")
+
+
+# Frozen as it stood for this migration, like the aggregation below; app code
+# (userpreferences.currencies.code_of) may change after it has run.
+def preferred_codes(apps):
+    """``{owner_id: code}`` for owners whose preference is not the base currency.
+
+    Until this migration amounts were entered in the owner's preferred
+    currency, so that is the currency of every existing row. Preferences
+    were stored either as 'EUR' or as 'EUR - Euro'.
+    """
+    UserPreference = apps.get_model("userpreferences", "UserPreference")
+    codes = {}
+    for owner_id, value in UserPreference.objects.values_list("owner_id", "currency"):
+        code = (value or "").split(" - ", 1)[0].strip().upper()
+        if len(code) == 3 and code != settings.FX_BASE_CURRENCY:
+            codes[owner_id] = code
+    return codes
+
+
+def backfill_currency(apps, schema_editor):
+    Source = apps.get_model("expenses", "Expense")
+    for owner_id, code in preferred_codes(apps).items():
+        Source.objects.filter(owner_id=owner_id).update(currency=code)
+
+
+def rebuild_rollups(apps, schema_editor):
+    Source = apps.get_model("expenses", "Expense")
+    Rollup = apps.get_model("expenses", "ExpenseMonthlyRollup")
+    rows = (
+        Source.objects.annotate(bucket_month=TruncMonth("expense_date"))
+        .values("owner_id", "bucket_month", "category_id", "currency")
+        .annotate(bucket_total=Sum("amount"), bucket_count=Count("pk"))
+        .order_by()
+    )
+    Rollup.objects.all().delete()
+    Rollup.objects.bulk_create(
+        (Rollup(owner_id=row["owner_id"], month=row["bucket_month"],
+                category_id=row["category_id"], currency=row["currency"],
+                total=Decimal(str(row["bucket_total"])).quantize(CENTS),
+                count=row["bucket_count"])
+         for row in rows.iterator(chunk_size=2000)),
+        batch_size=1000,
+    )
+
+
+def backfill(apps, schema_editor):
+    backfill_currency(apps, schema_editor)
+    rebuild_rollups(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('expenses', '0004_owner_date_indexes'),
+        ('userpreferences', '0002_rename_user_userpreference_owner'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='expensemonthlyrollup',
+            name='unique_expense_rollup_bucket',
+        ),
+        migrations.AddField(
+            model_name='expense',
+            name='currency',
+            field=models.CharField(default=settings.FX_BASE_CURRENCY, max_length=3),
+        ),
+        migrations.AddField(
+            model_name='expensemonthlyrollup',
+            name='currency',
+            field=models.CharField(default=settings.FX_BASE_CURRENCY, max_length=3),
+        ),
+        migrations.AddConstraint(
+            model_name='expensemonthlyrollup',
+            constraint=models.UniqueConstraint(fields=('owner', 'month', 'category', 'currency'), name='unique_expense_rollup_bucket'),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+SEARCH_INDEX_NAME = "expense_owner_search_gin"
+TRIGRAM_INDEX_NAME = "expense_owner_search_trgm"
+
+
+class PostgresTrigramExtension(TrigramExtension):
+    """Skipped on other backends in both directions (CreateExtension only
+    checks the vendor going forwards)."""
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+def create_trigram_index(apps, schema_editor):
+    # Serves search_document__contains; other backends scan the owner's rows.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    from django.contrib.postgres.indexes import GinIndex, OpClass
+    from django.db.models import F
+
+    Expense = apps.get_model("expenses", "Expense")
+    schema_editor.execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX_NAME}")
+    schema_editor.add_index(Expense, GinIndex(
+        F("owner"),
+        OpClass(F("search_document"), name="gin_trgm_ops"),
+        name=TRIGRAM_INDEX_NAME,
+    ))
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+    from django.db.models import F
+
+    Expense = apps.get_model("expenses", "Expense")
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TRIGRAM_INDEX_NAME}")
+    schema_editor.add_index(Expense, GinIndex(
+        F("owner"),
+        SearchVector("search_document", config="simple"),
+        name=SEARCH_INDEX_NAME,
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("expenses", "0005_expense_currency"),
+    ]
+
+    operations = [
+        PostgresTrigramExtension(),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -1,7 +1,10 @@
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils.timezone import now
 
+from .rollups import MonthlyRollup
+
 
 class Category(models.Model):
     name = models.CharField(max_length=255)
@@ -20,3 +23,28 @@ class Expense(models.Model):
     category = models.ForeignKey(Category, on_delete=models.CASCADE)
     description = models.TextField()
     expense_date = models.DateField(default=now)
+    currency = models.CharField(max_length=3, default=settings.FX_BASE_CURRENCY)
+    # Lowercased amount/date/description/category, maintained by
+    # expenses.signals; the Postgres trigram index lives in migration 0006.
+    search_document = models.TextField(blank=True, default="", editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "-expense_date", "-id"],
+                         name="expense_owner_date_idx"),
+            models.Index(fields=["owner", "category", "expense_date"],
+                         name="expense_owner_cat_date_idx"),
+        ]
+
+
+class ExpenseMonthlyRollup(MonthlyRollup):
+    category = models.ForeignKey(Category, on_delete=models.CASCADE)
+
+    date_field = "expense_date"
+    group_field = "category_id"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["owner", "month", "category", "currency"],
+                                    name="unique_expense_rollup_bucket"),
+        ]
@@ -0,0 +1,76 @@
+"""Keyset (seek) pagination over ``(expense_date, id)``.
+
+Pages are addressed by the row they start after (or end before) rather than
+by number, so every page is a bounded index range scan and no COUNT is run.
+"""
+from datetime import date
+
+from django.db.models import Q
+
+
+class KeysetPage:
+    def __init__(self, object_list, has_next: bool, has_previous: bool):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(self.object_list[-1]) if self.has_next and self.object_list else None
+
+    @property
+    def previous_cursor(self):
+        return encode_cursor(self.object_list[0]) if self.has_previous and self.object_list else None
+
+
+def encode_cursor(expense) -> str:
+    return f"{expense.expense_date.isoformat()}.{expense.pk}"
+
+
+def decode_cursor(value: str):
+    """Return ``(date, id)`` for a cursor string, or None if it is malformed."""
+    try:
+        day, pk = value.split(".")
+        return date.fromisoformat(day), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def _older(queryset, day, pk):
+    return queryset.filter(Q(expense_date__lt=day) | Q(expense_date=day, id__lt=pk))
+
+
+def keyset_page(queryset, after: str = None, before: str = None, per_page: int = 5) -> KeysetPage:
+    """Newest-first page of ``queryset`` following ``after`` or preceding ``before``.
+
+    A ``before`` page that would reach the newest row is served as the first
+    page, so stepping back never ends on a short or empty page.
+    """
+    after_key = decode_cursor(after) if after else None
+    before_key = decode_cursor(before) if before else None
+
+    if before_key:
+        day, pk = before_key
+        rows = list(
+            queryset.filter(Q(expense_date__gt=day) | Q(expense_date=day, id__gt=pk))
+            .order_by("expense_date", "id")[:per_page + 1]
+        )
+        if len(rows) > per_page:
+            rows = rows[:per_page][::-1]
+            oldest = rows[-1]
+            has_next = _older(queryset, oldest.expense_date, oldest.pk).exists()
+            return KeysetPage(rows, has_next=has_next, has_previous=True)
+        after_key = None
+
+    queryset = queryset.order_by("-expense_date", "-id")
+    if after_key:
+        queryset = _older(queryset, *after_key)
+    rows = list(queryset[:per_page + 1])
+    return KeysetPage(rows[:per_page], has_next=len(rows) > per_page,
+                      has_previous=after_key is not None)
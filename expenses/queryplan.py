@@ -0,0 +1,58 @@
+"""Query-plan inspection used by the index regression tests.
+
+``full_scans`` EXPLAINs a captured SQL statement and reports which tables
+the database would read in full. Postgres happily seq-scans the tiny
+tables a test seeds, so sequential scans are disabled for the EXPLAIN to
+show whether an index *could* serve the query.
+"""
+import re
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+SQLITE_SCAN = re.compile(r"^SCAN (\w+)")
+POSTGRES_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+# Small lookup tables that are fine to read whole.
+LOOKUP_TABLES = {"expenses_category", "userincome_source", "userpreferences_exchangerate"}
+# The alias Django gives a sliced queryset wrapped for COUNT(*); reading the
+# already-limited derived table is not a table scan.
+DERIVED_TABLES = {"subquery"}
+
+
+def full_scans(sql: str) -> set:
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("EXPLAIN " + sql)
+            pattern = POSTGRES_SCAN
+        else:
+            cursor.execute("EXPLAIN QUERY PLAN " + sql)
+            pattern = SQLITE_SCAN
+        plan = [row[-1] for row in cursor.fetchall()]
+
+    tables = set()
+    for line in plan:
+        match = pattern.search(line.strip())
+        if match:
+            tables.add(match.group(1))
+    return tables - LOOKUP_TABLES - DERIVED_TABLES
+
+
+class QueryPlanAssertions:
+    """TestCase mixin asserting a request's SELECTs never fall back to a full scan."""
+
+    def assertRequestUsesIndexes(self, method, path, *args, **kwargs):
+        with CaptureQueriesContext(connection) as captured:
+            response = getattr(self.client, method)(path, *args, **kwargs)
+        self.assertLess(response.status_code, 400)
+
+        offenders = {}
+        for query in captured.captured_queries:
+            if query["sql"].lstrip().upper().startswith("SELECT"):
+                tables = full_scans(query["sql"])
+                if tables:
+                    offenders[query["sql"]] = tables
+        self.assertFalse(
+            offenders, f"{method.upper()} {path} scans whole tables: {offenders}")
+        return response
@@ -0,0 +1,136 @@
+"""Per-owner, per-month rollups of transaction tables.
+
+Each concrete rollup names the source columns it groups on through
+``date_field`` and ``group_field``; ``track`` keeps it current from model
+signals and ``rebuild`` recomputes it from the raw rows.
+"""
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import post_delete, post_save, pre_save
+
+CENTS = Decimal("0.01")
+
+# (source model, rollup model) pairs registered through track()
+TRACKED = []
+
+
+class MonthlyRollup(models.Model):
+    owner = models.ForeignKey(User, on_delete=models.CASCADE)
+    month = models.DateField()
+    currency = models.CharField(max_length=3, default=settings.FX_BASE_CURRENCY)
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.PositiveIntegerField(default=0)
+
+    date_field = None
+    group_field = None
+
+    class Meta:
+        abstract = True
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def _to_decimal(amount) -> Decimal:
+    return Decimal(str(amount)).quantize(CENTS)
+
+
+def _bucket(rollup_model, owner_id, day, group, currency):
+    return {"owner_id": owner_id, "month": month_start(day),
+            rollup_model.group_field: group, "currency": currency}
+
+
+def apply_delta(rollup_model, bucket: dict, amount: Decimal, count: int):
+    if count > 0:
+        rollup_model.objects.get_or_create(**bucket)
+    # Decrements never create rows, so cascades from a deleted owner or
+    # category cannot resurrect a bucket pointing at them.
+    rollups = rollup_model.objects.filter(**bucket)
+    rollups.update(total=F("total") + amount, count=F("count") + count)
+    if count < 0:
+        rollups.filter(count=0).delete()
+
+
+def track(source_model, rollup_model):
+    """Keep ``rollup_model`` in step with saves and deletes of ``source_model``."""
+    date_field, group_field = rollup_model.date_field, rollup_model.group_field
+
+    def bucket_of(row):
+        return _bucket(rollup_model, row["owner_id"], row[date_field],
+                       row[group_field], row["currency"])
+
+    to_date = source_model._meta.get_field(date_field).to_python
+
+    def snapshot(instance):
+        # Attributes hold whatever was assigned (a string, or a datetime from
+        # default=now) until the instance is reloaded.
+        return {"owner_id": instance.owner_id, date_field: to_date(getattr(instance, date_field)),
+                group_field: getattr(instance, group_field),
+                "currency": instance.currency, "amount": _to_decimal(instance.amount)}
+
+    def remember_previous(sender, instance, raw=False, **kwargs):
+        instance._rollup_previous = None
+        if instance.pk and not raw:
+            instance._rollup_previous = sender.objects.filter(pk=instance.pk).values(
+                "owner_id", date_field, group_field, "currency", "amount").first()
+
+    def apply_save(sender, instance, raw=False, **kwargs):
+        if raw:
+            return
+        current = snapshot(instance)
+        previous = getattr(instance, "_rollup_previous", None)
+        with transaction.atomic():
+            if previous is None:
+                apply_delta(rollup_model, bucket_of(current), current["amount"], 1)
+            elif bucket_of(previous) == bucket_of(current):
+                apply_delta(rollup_model, bucket_of(current),
+                            current["amount"] - _to_decimal(previous["amount"]), 0)
+            else:
+                apply_delta(rollup_model, bucket_of(previous),
+                            -_to_decimal(previous["amount"]), -1)
+                apply_delta(rollup_model, bucket_of(current), current["amount"], 1)
+
+    def apply_delete(sender, instance, **kwargs):
+        current = snapshot(instance)
+        apply_delta(rollup_model, bucket_of(current), -current["amount"], -1)
+
+    uid = f"rollup:{rollup_model._meta.label}"
+    pre_save.connect(remember_previous, sender=source_model, weak=False, dispatch_uid=uid)
+    post_save.connect(apply_save, sender=source_model, weak=False, dispatch_uid=uid)
+    post_delete.connect(apply_delete, sender=source_model, weak=False, dispatch_uid=uid)
+    if (source_model, rollup_model) not in TRACKED:
+        TRACKED.append((source_model, rollup_model))
+
+
+def rebuild(source_model, rollup_model, owner=None):
+    """Recompute ``rollup_model`` from scratch, for one owner or everyone."""
+    date_field, group_field = rollup_model.date_field, rollup_model.group_field
+    keys = [group_field, "currency"]
+    sources = source_model.objects.all()
+    rollups = rollup_model.objects.all()
+    if owner is not None:
+        sources = sources.filter(owner=owner)
+        rollups = rollups.filter(owner=owner)
+
+    rows = (
+        sources.annotate(bucket_month=TruncMonth(date_field))
+        .values("owner_id", "bucket_month", *keys)
+        .annotate(bucket_total=Sum("amount"), bucket_count=Count("pk"))
+        .order_by()
+    )
+    with transaction.atomic():
+        rollups.delete()
+        rollup_model.objects.bulk_create(
+            (rollup_model(owner_id=row["owner_id"], month=row["bucket_month"],
+                          total=_to_decimal(row["bucket_total"]),
+                          count=row["bucket_count"],
+                          **{key: row[key] for key in keys})
+             for row in rows.iterator(chunk_size=2000)),
+            batch_size=1000,
+        )
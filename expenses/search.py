@@ -0,0 +1,185 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from django.db import connection
+from django.db.models import F
+
+from . import categories
+from .models import Expense
+
+SEARCH_FIELDS = ("id", "amount", "expense_date", "description")
+TERM_RE = re.compile(r"[\w.\-]+")
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+TOTAL_CAP = 1000
+# Postgres ranks at most this many of the newest matches, so a broad term
+# computes to_tsvector for a bounded set rather than every matching row.
+# One past TOTAL_CAP keeps the capped total exact.
+RANK_CANDIDATES = TOTAL_CAP + 1
+
+
+def build_search_document(expense: Expense, category_name: str = None) -> str:
+    """Flatten the searchable columns of an expense into one lowercase string."""
+    if category_name is None:
+        category_name = categories.registry.name_of(expense.category_id)
+    parts = [str(expense.amount), str(expense.expense_date),
+             expense.description or "", category_name]
+    return " ".join(parts).lower()
+
+
+def parse_terms(search_str: str) -> list:
+    return TERM_RE.findall(search_str.lower())
+
+
+def _ranked(queryset, terms):
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+    # Rows where every term starts a word rank above mid-word matches.
+    query = SearchQuery(" & ".join(f"'{term}':*" for term in terms),
+                        search_type="raw", config="simple")
+    rank = SearchRank(SearchVector("search_document", config="simple"), query)
+    # The trigram index fetches the newest candidates; only those are ranked.
+    candidates = queryset.order_by("-expense_date", "-id").values("pk")[:RANK_CANDIDATES]
+    return (Expense.objects.filter(pk__in=candidates)
+            .annotate(rank=rank).order_by("-rank", "-expense_date", "-id"))
+
+
+def matches(owner, terms):
+    """The owner's expenses containing every term, best first, as result rows.
+
+    Terms match anywhere in the document, like the icontains search this
+    replaced. Postgres serves the substring filter from the trigram GIN
+    index in 0006_expense_search_trigram and ranks word-prefix matches
+    first among the newest RANK_CANDIDATES matches; other backends order
+    the matches newest first.
+    """
+    queryset = Expense.objects.filter(owner=owner)
+    for term in terms:
+        queryset = queryset.filter(search_document__contains=term)
+    if connection.vendor == "postgresql":
+        queryset = _ranked(queryset, terms)
+    else:
+        queryset = queryset.order_by("-expense_date", "-id")
+    return queryset.values(*SEARCH_FIELDS, category_name=F("category__name"))
+
+
+def window_params(payload: dict) -> tuple:
+    """``(limit, offset)`` from a search request body, clamped to sane bounds."""
+    try:
+        limit = min(max(int(payload.get("limit", DEFAULT_LIMIT)), 1), MAX_LIMIT)
+        offset = max(int(payload.get("offset", 0)), 0)
+    except (TypeError, ValueError):
+        limit, offset = DEFAULT_LIMIT, 0
+    return limit, offset
+
+
+def _window(rows, limit: int, offset: int, total: int) -> dict:
+    return {
+        "results": rows[:limit],
+        "limit": limit,
+        "offset": offset,
+        "has_next": len(rows) > limit,
+        # Counting stops at TOTAL_CAP; the client shows e.g. "1000+".
+        "total": min(total, TOTAL_CAP),
+        "total_capped": total > TOTAL_CAP,
+    }
+
+
+def _needs_count(rows, limit: int, offset: int) -> bool:
+    # A short first page already is the whole match set.
+    return len(rows) > limit or (offset > 0 and not rows)
+
+
+def _capped_count_query(queryset):
+    return queryset.order_by()[:TOTAL_CAP + 1]
+
+
+def paginate(queryset, limit: int, offset: int) -> dict:
+    """One window of ``queryset`` plus a total counted no further than TOTAL_CAP.
+
+    One extra row is fetched to tell whether there is a next window; the
+    count only runs when there is.
+    """
+    rows = list(queryset[offset:offset + limit + 1])
+    total = offset + len(rows)
+    if _needs_count(rows, limit, offset):
+        total = _capped_count_query(queryset).count()
+    return _window(rows, limit, offset, total)
+
+
+async def apaginate(queryset, limit: int, offset: int) -> dict:
+    rows = [row async for row in queryset[offset:offset + limit + 1]]
+    total = offset + len(rows)
+    if _needs_count(rows, limit, offset):
+        total = await _capped_count_query(queryset).acount()
+    return _window(rows, limit, offset, total)
+
+
+def search(owner, search_str: str, limit: int = DEFAULT_LIMIT, offset: int = 0) -> dict:
+    """Ranked, windowed search over one owner's expenses (see ``matches``)."""
+    terms = parse_terms(search_str)
+    if not terms:
+        return _window([], limit, offset, 0)
+    return paginate(matches(owner, terms), limit, offset)
+
+
+async def asearch(owner, search_str: str, limit: int = DEFAULT_LIMIT, offset: int = 0) -> dict:
+    """``search`` on the async ORM, for the ASGI view."""
+    terms = parse_terms(search_str)
+    if not terms:
+        return _window([], limit, offset, 0)
+    return await apaginate(matches(owner, terms), limit, offset)
+
+
+class RecentSearches:
+    """Small per-session LRU of search responses.
+
+    Keystroke searches repeat themselves (a debounce that fires twice,
+    backspacing over a character and typing it again), so each session keeps
+    its last few responses. Keys carry the owner's data version, read from
+    the shared dashboard cache, so a write in any process makes older entries
+    unreachable; ``ttl`` bounds everything else, such as category renames.
+    The responses themselves stay process-local: a miss only costs the query.
+    """
+
+    def __init__(self, per_session: int = 8, sessions: int = 1024, ttl: float = 60):
+        self.per_session = per_session
+        self.sessions = sessions
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session: str, key):
+        with self._lock:
+            recent = self._entries.get(session)
+            if recent is None or key not in recent:
+                return None
+            expires, response = recent[key]
+            if expires < time.monotonic():
+                del recent[key]
+                return None
+            recent.move_to_end(key)
+            self._entries.move_to_end(session)
+            return response
+
+    def put(self, session: str, key, response: dict):
+        with self._lock:
+            recent = self._entries.get(session)
+            if recent is None:
+                recent = self._entries[session] = OrderedDict()
+                if len(self._entries) > self.sessions:
+                    self._entries.popitem(last=False)
+            self._entries.move_to_end(session)
+            recent[key] = (time.monotonic() + self.ttl, response)
+            recent.move_to_end(key)
+            if len(recent) > self.per_session:
+                recent.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+recent = RecentSearches()
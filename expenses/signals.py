@@ -0,0 +1,61 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from income.models import Income
+from userincome.models import UserIncome
+from . import categories, rollups
+from .cache import owner_data_changed
+from .models import Category, Expense, ExpenseMonthlyRollup
+from .search import build_search_document
+
+rollups.track(Expense, ExpenseMonthlyRollup)
+
+
+SEARCH_SOURCE_FIELDS = {"amount", "expense_date", "description", "category", "category_id"}
+
+
+@receiver(pre_save, sender=Expense)
+def update_search_document(sender, instance, **kwargs):
+    instance.search_document = build_search_document(instance)
+
+
+@receiver(post_save, sender=Expense)
+def save_skipped_search_document(sender, instance, created, update_fields=None, **kwargs):
+    # save(update_fields=[...]) writes only the listed columns, so a document
+    # rebuilt in pre_save for a changed source column has to be written here.
+    if (created or update_fields is None or "search_document" in update_fields
+            or not SEARCH_SOURCE_FIELDS & update_fields):
+        return
+    Expense.objects.filter(pk=instance.pk).update(search_document=instance.search_document)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_registry(sender, **kwargs):
+    categories.registry.invalidate()
+
+
+@receiver(post_save, sender=Category)
+def refresh_category_search_documents(sender, instance, created, **kwargs):
+    if created:
+        return
+    # A renamed category changes the document of every expense filed under it
+    batch = []
+    for expense in Expense.objects.filter(category=instance).iterator(chunk_size=1000):
+        expense.search_document = build_search_document(expense, instance.name)
+        batch.append(expense)
+        if len(batch) >= 1000:
+            Expense.objects.bulk_update(batch, ["search_document"])
+            batch = []
+    if batch:
+        Expense.objects.bulk_update(batch, ["search_document"])
+
+
+@receiver(post_save, sender=Expense)
+@receiver(post_delete, sender=Expense)
+@receiver(post_save, sender=Income)
+@receiver(post_delete, sender=Income)
+@receiver(post_save, sender=UserIncome)
+@receiver(post_delete, sender=UserIncome)
+def invalidate_owner_caches(sender, instance, **kwargs):
+    owner_data_changed(instance.owner_id)
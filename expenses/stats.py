@@ -0,0 +1,99 @@
+"""Everything the stats page shows, from one grouped query over the rollups.
+
+This year's expenses and income by month, the last three months of
+expenses by category and this year's income by source all come from the
+monthly rollups, so one ``UNION ALL`` of three grouped selects covers them;
+the rows are then converted to the owner's currency and folded in Python.
+"""
+import calendar
+from datetime import date
+from decimal import Decimal
+
+from django.db.models import F, Sum, Value
+
+from income.models import IncomeMonthlyRollup
+from userincome.models import UserIncomeMonthlyRollup
+from userpreferences import fx
+
+from .models import ExpenseMonthlyRollup
+
+RECENT_MONTHS = 3
+
+
+def months_back(today: date, months: int) -> date:
+    """First day of the month ``months`` before ``today``'s."""
+    year, month = divmod(today.year * 12 + today.month - 1 - months, 12)
+    return date(year, month + 1, 1)
+
+
+def stats_window(today: date) -> tuple:
+    """``(start, end)`` covering this year and the last RECENT_MONTHS months."""
+    start = min(date(today.year, 1, 1), months_back(today, RECENT_MONTHS - 1))
+    end = today.replace(day=calendar.monthrange(today.year, today.month)[1])
+    return start, end
+
+
+def _grouped(rollups, kind: str, group_field: str, start: date, end: date):
+    return (
+        rollups.filter(month__gte=start, month__lte=end)
+        .annotate(kind=Value(kind), group=F(group_field))
+        .values("kind", "month", "group", "currency")
+        .annotate(total=Sum("total"))
+        .order_by()
+    )
+
+
+def stats_query(owner, start: date, end: date):
+    return _grouped(
+        ExpenseMonthlyRollup.objects.filter(owner=owner), "expense", "category__name", start, end,
+    ).union(
+        _grouped(IncomeMonthlyRollup.objects.filter(owner=owner), "income", "category", start, end),
+        _grouped(UserIncomeMonthlyRollup.objects.filter(owner=owner), "source", "source", start, end),
+        all=True,
+    )
+
+
+def _floats(totals: dict) -> dict:
+    return {key: float(total) for key, total in totals.items()}
+
+
+def _fold(rows, currency: str, today: date) -> dict:
+    totals = fx.convert_grouped(rows, currency, key=("kind", "month", "group"))
+    recent_start = months_back(today, RECENT_MONTHS - 1)
+
+    expense_months = dict.fromkeys(range(1, 13), Decimal(0))
+    income_months = dict.fromkeys(range(1, 13), Decimal(0))
+    categories, sources = {}, {}
+    for (kind, month, group), total in totals.items():
+        this_year = month.year == today.year
+        if kind == "expense":
+            if this_year:
+                expense_months[month.month] += total
+            if month >= recent_start:
+                categories[group] = categories.get(group, Decimal(0)) + total
+        elif kind == "income" and this_year:
+            income_months[month.month] += total
+        elif kind == "source" and this_year:
+            sources[group] = sources.get(group, Decimal(0)) + total
+
+    return {
+        "currency": currency,
+        "year": today.year,
+        "this_year_expenses_data": {"months": _floats(expense_months)},
+        "last_3_months_expense_data": {"categories": _floats(categories),
+                                       "since": recent_start.isoformat()},
+        "this_year_income_data": {"months": _floats(income_months)},
+        "income_sources_data": {"sources": _floats(sources)},
+    }
+
+
+def user_stats(owner, currency: str, today: date = None) -> dict:
+    today = today or date.today()
+    return _fold(list(stats_query(owner, *stats_window(today))), currency, today)
+
+
+async def auser_stats(owner, currency: str, today: date = None) -> dict:
+    today = today or date.today()
+    await fx.rates.aload()  # so converting below never queries
+    rows = [row async for row in stats_query(owner, *stats_window(today))]
+    return _fold(rows, currency, today)
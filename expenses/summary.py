@@ -0,0 +1,160 @@
+import calendar
+from datetime import date, datetime, timedelta
+
+from django.conf import settings
+from django.db.models import F, Sum
+from django.db.models.functions import TruncDay, TruncMonth, TruncWeek
+
+from userpreferences import fx
+
+from .models import Expense, ExpenseMonthlyRollup
+
+GRANULARITIES = {
+    "day": TruncDay,
+    "week": TruncWeek,
+    "month": TruncMonth,
+}
+DEFAULT_MONTHS = 6
+MAX_MONTHS = 120
+
+
+class SummaryParamError(ValueError):
+    pass
+
+
+def default_window(today: date = None, months: int = DEFAULT_MONTHS) -> tuple:
+    """The current calendar month and the ``months - 1`` before it."""
+    today = today or date.today()
+    year, month = divmod(today.year * 12 + today.month - months, 12)
+    last_day = calendar.monthrange(today.year, today.month)[1]
+    return date(year, month + 1, 1), today.replace(day=last_day)
+
+
+def parse_window(params) -> tuple:
+    """``(start, end, granularity)`` from ``?start=&end=&months=&granularity=``.
+
+    ``months`` picks a window of whole calendar months ending with the
+    current one; ``start``/``end`` override either edge. Raises
+    SummaryParamError with a message fit for the client.
+    """
+    try:
+        months = int(params.get("months") or DEFAULT_MONTHS)
+    except ValueError:
+        raise SummaryParamError("months must be a whole number")
+    if not 1 <= months <= MAX_MONTHS:
+        raise SummaryParamError(f"months must be between 1 and {MAX_MONTHS}")
+    start, end = default_window(months=months)
+    try:
+        if params.get("start"):
+            start = datetime.strptime(params["start"], "%Y-%m-%d").date()
+        if params.get("end"):
+            end = datetime.strptime(params["end"], "%Y-%m-%d").date()
+    except ValueError:
+        raise SummaryParamError("Dates must use YYYY-MM-DD")
+
+    granularity = params.get("granularity") or None
+    if granularity and granularity not in GRANULARITIES:
+        raise SummaryParamError("granularity must be one of: " + ", ".join(GRANULARITIES))
+    return start, end, granularity
+
+
+def covers_whole_months(start: date, end: date) -> bool:
+    return start.day == 1 and (end + timedelta(days=1)).day == 1
+
+
+def _grouped_query(rows, rollups, date_field, group_field, start, end, granularity, currency):
+    """The single grouped query behind ``breakdown``, and whether it hit the rollup."""
+    group_by = [group_field]
+    if granularity:
+        group_by = ["period", group_field]
+
+    if granularity in (None, "month") and covers_whole_months(start, end):
+        rollups = rollups.filter(month__gte=start, month__lte=end)
+        if granularity:
+            rollups = rollups.annotate(period=F("month"))
+        return rollups.values(*group_by, "currency").annotate(total=Sum("total")), group_by, True
+
+    rows = rows.filter(**{f"{date_field}__gte": start, f"{date_field}__lte": end})
+    if granularity:
+        rows = rows.annotate(period=GRANULARITIES[granularity](date_field))
+    query = rows.values(*group_by).annotate(
+        total=fx.converted_sum("amount", currency)).order_by(*group_by)
+    return query, group_by, False
+
+
+def _fold(grouped_rows, group_by, from_rollup, group_field, granularity, currency) -> tuple:
+    if from_rollup:
+        # Rollup totals are still per currency; convert and merge them.
+        grouped = fx.convert_grouped(grouped_rows, currency, key=tuple(group_by))
+        grouped_rows = [dict(zip(group_by, group), total=total)
+                        for group, total in sorted(grouped.items())]
+
+    totals = {}
+    periods = []
+    for row in grouped_rows:
+        name = row[group_field]
+        totals[name] = totals.get(name, 0) + row["total"]
+        if granularity:
+            periods.append({
+                "period": row["period"].isoformat(),
+                "category": name,
+                "total": float(row["total"]),
+            })
+
+    return {name: float(total) for name, total in totals.items() if total > 0}, periods
+
+
+def breakdown(rows, rollups, date_field: str, group_field: str, start: date, end: date,
+              granularity: str = None, currency: str = None) -> tuple:
+    """``({group: total}, periods)`` for ``[start, end]`` in one grouped query.
+
+    ``rows`` are the raw transactions and ``rollups`` their monthly rollup,
+    both already filtered to one owner; month-aligned windows are answered
+    from the rollup. With a granularity the totals are also returned
+    bucketed by period. Amounts are converted to ``currency``.
+    """
+    query, group_by, from_rollup = _grouped_query(
+        rows, rollups, date_field, group_field, start, end, granularity, currency)
+    return _fold(query, group_by, from_rollup, group_field, granularity, currency)
+
+
+async def abreakdown(rows, rollups, date_field: str, group_field: str, start: date, end: date,
+                     granularity: str = None, currency: str = None) -> tuple:
+    """``breakdown`` on the async ORM."""
+    await fx.rates.aload()  # so building and converting below never query
+    query, group_by, from_rollup = _grouped_query(
+        rows, rollups, date_field, group_field, start, end, granularity, currency)
+    grouped_rows = [row async for row in query]
+    return _fold(grouped_rows, group_by, from_rollup, group_field, granularity, currency)
+
+
+def _category_summary(currency, totals, periods, granularity) -> dict:
+    summary = {"currency": currency, "expense_category_data": totals}
+    if granularity:
+        summary["periods"] = periods
+    return summary
+
+
+def category_breakdown(owner, start: date, end: date, granularity: str = None,
+                       currency: str = None) -> dict:
+    """Per-category expense totals for ``[start, end]`` in one grouped query.
+
+    With a granularity the same rows are also returned bucketed by period, so
+    charts can draw both views without a second round trip. Month-aligned
+    windows are answered from the monthly rollup instead of the raw rows.
+    Totals are expressed in ``currency`` (the base currency by default).
+    """
+    currency = currency or settings.FX_BASE_CURRENCY
+    totals, periods = breakdown(
+        Expense.objects.filter(owner=owner), ExpenseMonthlyRollup.objects.filter(owner=owner),
+        "expense_date", "category__name", start, end, granularity, currency)
+    return _category_summary(currency, totals, periods, granularity)
+
+
+async def acategory_breakdown(owner, start: date, end: date, granularity: str = None,
+                              currency: str = None) -> dict:
+    currency = currency or settings.FX_BASE_CURRENCY
+    totals, periods = await abreakdown(
+        Expense.objects.filter(owner=owner), ExpenseMonthlyRollup.objects.filter(owner=owner),
+        "expense_date", "category__name", start, end, granularity, currency)
+    return _category_summary(currency, totals, periods, granularity)
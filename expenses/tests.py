@@ -1,3 +1,971 @@
-from django.test import TestCase
+import csv
+import json
+import zipfile
+from datetime import date, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+from unittest import mock, skipUnless
+from xml.etree import ElementTree
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.template import engines
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from expenseswebsite import profiling
+from userincome.models import UserIncome
+from userpreferences import fx
+from userpreferences.models import ExchangeRate, UserPreference
+
+from . import cache, categories, checks, importers, rollups, search
+from .models import Category, Expense, ExpenseMonthlyRollup
+from .pagination import encode_cursor, keyset_page
+from .queryplan import QueryPlanAssertions
+
+
+class ExpenseCategorySummaryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice", password="secret123")
+        self.client.force_login(self.user)
+        self.url = reverse("expense-category-summary")
+
+    def add_categories(self, count, amount="10.00"):
+        for _ in range(count):
+            category = Category.objects.create(name=f"Category {Category.objects.count()}")
+            Expense.objects.create(
+                owner=self.user, amount=Decimal(amount), category=category,
+                description="test", expense_date=date.today())
+
+    def count_queries(self, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params or {})
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_query_count_is_constant_in_number_of_categories(self):
+        self.add_categories(2)
+        self.count_queries()  # warm the process-level exchange rate table
+        few = self.count_queries()
+        self.add_categories(20)
+        many = self.count_queries()
+        self.assertEqual(few, many)
+
+        monthly = self.count_queries({"granularity": "month"})
+        self.assertEqual(monthly, few)
+
+    def test_totals_respect_window_and_owner(self):
+        food = Category.objects.create(name="Food")
+        other = User.objects.create_user(username="bob", password="secret123")
+        Expense.objects.create(owner=self.user, amount=Decimal("5.00"), category=food,
+                               description="in", expense_date=date.today())
+        Expense.objects.create(owner=self.user, amount=Decimal("7.00"), category=food,
+                               description="old", expense_date=date.today() - timedelta(days=400))
+        Expense.objects.create(owner=other, amount=Decimal("100.00"), category=food,
+                               description="not mine", expense_date=date.today())
+
+        data = self.client.get(self.url).json()
+        self.assertEqual(data["expense_category_data"], {"Food": 5.0})
+
+        start = (date.today() - timedelta(days=500)).isoformat()
+        data = self.client.get(self.url, {"start": start, "granularity": "day"}).json()
+        self.assertEqual(data["expense_category_data"], {"Food": 12.0})
+        self.assertEqual(len(data["periods"]), 2)
+
+    def test_totals_are_converted_to_preferred_currency(self):
+        food = Category.objects.create(name="Food")
+        ExchangeRate.objects.create(currency="EUR", rate=Decimal("0.5"))
+        self.addCleanup(fx.rates.invalidate)
+        UserPreference.objects.update_or_create(owner=self.user, defaults={"currency": "EUR"})
+        Expense.objects.create(owner=self.user, amount=Decimal("10.00"), currency="USD",
+                               category=food, description="usd", expense_date=date.today())
+        Expense.objects.create(owner=self.user, amount=Decimal("5.00"), currency="EUR",
+                               category=food, description="eur", expense_date=date.today())
+
+        data = self.client.get(self.url).json()
+        self.assertEqual(data["currency"], "EUR")
+        self.assertEqual(data["expense_category_data"], {"Food": 10.0})
+
+        data = self.client.get(self.url, {"granularity": "day"}).json()
+        self.assertEqual(data["expense_category_data"], {"Food": 10.0})
+
+    def test_rejects_unknown_granularity(self):
+        response = self.client.get(self.url, {"granularity": "year"})
+        self.assertEqual(response.status_code, 400)
+
+
+class RollupMaintenanceTests(TestCase):
+    """Every incremental update must leave the rollups as ``rebuild`` would."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user(username="alice", password="secret123")
+        cls.bob = User.objects.create_user(username="bob", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+        cls.rent = Category.objects.create(name="Rent")
+
+    def setUp(self):
+        self.expense = Expense.objects.create(
+            owner=self.alice, amount=Decimal("10.25"), category=self.food,
+            description="groceries", expense_date=date(2024, 3, 15))
+        Expense.objects.create(owner=self.alice, amount=Decimal("4.75"), category=self.food,
+                               description="bread", expense_date=date(2024, 3, 2))
+
+    def buckets(self):
+        return sorted(ExpenseMonthlyRollup.objects.values_list(
+            "owner_id", "month", "category_id", "currency", "total", "count"))
+
+    def assertMatchesRebuild(self):
+        incremental = self.buckets()
+        rollups.rebuild(Expense, ExpenseMonthlyRollup)
+        self.assertEqual(incremental, self.buckets())
+
+    def test_create(self):
+        self.assertEqual(self.buckets(), [
+            (self.alice.pk, date(2024, 3, 1), self.food.pk, "USD", Decimal("15.00"), 2)])
+        self.assertMatchesRebuild()
+
+    def test_amount_change(self):
+        self.expense.amount = Decimal("20.10")
+        self.expense.save()
+        self.assertMatchesRebuild()
+
+    def test_date_change_to_another_month(self):
+        self.expense.expense_date = date(2024, 4, 1)
+        self.expense.save()
+        self.assertEqual(len(self.buckets()), 2)
+        self.assertMatchesRebuild()
+
+    def test_category_change(self):
+        self.expense.category = self.rent
+        self.expense.save()
+        self.assertMatchesRebuild()
+
+    def test_owner_change(self):
+        self.expense.owner = self.bob
+        self.expense.save()
+        self.assertMatchesRebuild()
+
+    def test_currency_change(self):
+        self.expense.currency = "EUR"
+        self.expense.save()
+        self.assertMatchesRebuild()
+
+    def test_delete(self):
+        self.expense.delete()
+        self.assertMatchesRebuild()
+        Expense.objects.all().delete()
+        self.assertEqual(self.buckets(), [])
+        self.assertMatchesRebuild()
+
+    def test_string_inputs_are_bucketed_like_stored_values(self):
+        Expense.objects.create(owner=self.alice, amount="1.10", category=self.rent,
+                               description="stamp", expense_date="2024-05-31")
+        self.assertMatchesRebuild()
+
+
+class CurrencyBackfillMigrationTests(TransactionTestCase):
+    before = [("expenses", "0004_owner_date_indexes"), ("income", "0003_owner_date_indexes"),
+              ("userincome", "0003_owner_date_indexes"), ("userpreferences", "0004_exchangerate")]
+    after = [("expenses", "0005_expense_currency"), ("income", "0005_income_amount_decimal"),
+             ("userincome", "0005_userincome_amount_decimal"), ("userpreferences", "0004_exchangerate")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_existing_rows_take_the_owners_preferred_currency(self):
+        old = self.migrate(self.before)
+        User = old.get_model("auth", "User")
+        euro = User.objects.create(username="alice")
+        dollar = User.objects.create(username="bob")
+        UserPreference = old.get_model("userpreferences", "UserPreference")
+        UserPreference.objects.bulk_create([UserPreference(owner=euro, currency="EUR - Euro"),
+                                            UserPreference(owner=dollar, currency="USD")])
+        food = old.get_model("expenses", "Category").objects.create(name="Food")
+        for owner in (euro, dollar):
+            old.get_model("expenses", "Expense").objects.create(
+                owner=owner, amount=Decimal("10"), category=food, description="x",
+                expense_date=date(2024, 3, 1))
+            old.get_model("income", "Income").objects.create(
+                owner=owner, amount=Decimal("5"), category="SALARY", date=date(2024, 3, 1))
+            old.get_model("userincome", "UserIncome").objects.create(
+                owner=owner, amount=Decimal("5"), source="Job", description="x",
+                date=date(2024, 3, 1))
+
+        new = self.migrate(self.after)
+        for app, model in (("expenses", "Expense"), ("expenses", "ExpenseMonthlyRollup"),
+                           ("income", "Income"), ("income", "IncomeMonthlyRollup"),
+                           ("userincome", "UserIncome"), ("userincome", "UserIncomeMonthlyRollup")):
+            with self.subTest(model=model):
+                rows = new.get_model(app, model).objects.values_list("owner__username", "currency")
+                self.assertEqual(sorted(rows), [("alice", "EUR"), ("bob", "USD")])
+
+
+class DashboardCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+        Expense.objects.create(owner=cls.user, amount=Decimal("10"), category=cls.food,
+                               description="lunch", expense_date=date.today())
+
+    def setUp(self):
+        caches["dashboard"].clear()
+        self.addCleanup(caches["dashboard"].clear)
+        self.client.force_login(self.user)
+
+    def summary(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse("summary"))
+        return response.context["total_expenses"], len(captured.captured_queries)
+
+    def test_miss_then_hit(self):
+        total, miss_queries = self.summary()
+        self.assertEqual(total, Decimal("10"))
+        total, hit_queries = self.summary()
+        self.assertEqual(total, Decimal("10"))
+        self.assertLess(hit_queries, miss_queries)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5})
+
+    def test_saves_and_deletes_invalidate(self):
+        self.summary()
+        expense = Expense.objects.create(owner=self.user, amount=Decimal("5"), category=self.food,
+                                         description="coffee", expense_date=date.today())
+        self.assertEqual(self.summary()[0], Decimal("15"))
+        expense.amount = Decimal("7")
+        expense.save()
+        self.assertEqual(self.summary()[0], Decimal("17"))
+        expense.delete()
+        self.assertEqual(self.summary()[0], Decimal("10"))
+        self.assertEqual(cache.stats()["hits"], 0)
+
+    def test_another_owners_write_keeps_the_entry(self):
+        self.summary()
+        other = User.objects.create_user(username="bob", password="secret123")
+        Expense.objects.create(owner=other, amount=Decimal("5"), category=self.food,
+                               description="coffee", expense_date=date.today())
+        self.summary()
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_rebuild_rollups_invalidates(self):
+        self.summary()
+        # bulk_create skips the signals, as a raw data fix would.
+        Expense.objects.bulk_create([Expense(
+            owner=self.user, amount=Decimal("2"), category=self.food,
+            description="tea", expense_date=date.today())])
+        self.assertEqual(self.summary()[0], Decimal("10"))
+        call_command("rebuild_rollups", stdout=StringIO())
+        self.assertEqual(self.summary()[0], Decimal("12"))
+
+    def test_stats_endpoint_is_staff_only_and_resettable(self):
+        self.summary()
+        self.summary()
+        url = reverse("dashboard-cache-stats")
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+        User.objects.filter(pk=self.user.pk).update(is_staff=True)
+        self.assertEqual(self.client.get(url).json(), {"hits": 1, "misses": 1, "hit_rate": 0.5})
+        cache.reset_stats()
+        self.assertEqual(self.client.get(url).json(), {"hits": 0, "misses": 0, "hit_rate": None})
+
+    def test_deploy_check_wants_a_shared_backend(self):
+        dashboard = {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        with override_settings(CACHES={"default": dashboard, "dashboard": dashboard}):
+            self.assertEqual([e.id for e in checks.check_shared_caches(None)], ["expenses.W001"])
+        dashboard = {"BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                     "LOCATION": "dashboard_cache"}
+        with override_settings(CACHES={"default": dashboard, "dashboard": dashboard}):
+            self.assertEqual(checks.check_shared_caches(None), [])
+
+
+class ExpenseQueryPlanTests(QueryPlanAssertions, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        other = User.objects.create_user(username="bob", password="secret123")
+        categories = [Category.objects.create(name=name) for name in ("Food", "Rent", "Travel")]
+        for owner in (cls.user, other):
+            for i in range(60):
+                Expense.objects.create(
+                    owner=owner, amount=Decimal(i), category=categories[i % 3],
+                    description=f"expense {i}",
+                    expense_date=date.today() - timedelta(days=i * 5))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_index(self):
+        response = self.assertRequestUsesIndexes("get", reverse("expenses"))
+        cursor = response.context["page_obj"].next_cursor
+        self.assertRequestUsesIndexes("get", reverse("expenses"), {"after": cursor})
+
+    def test_search(self):
+        self.assertRequestUsesIndexes(
+            "post", reverse("expense-search"), data={"searchText": "expense 1"},
+            content_type="application/json")
+
+    def test_summary(self):
+        self.assertRequestUsesIndexes("get", reverse("summary"))
+
+    def test_stats(self):
+        self.assertRequestUsesIndexes("get", reverse("stats-api"))
+
+    def test_category_summary(self):
+        url = reverse("expense-category-summary")
+        self.assertRequestUsesIndexes("get", url)
+        start = (date.today() - timedelta(days=90)).isoformat()
+        self.assertRequestUsesIndexes("get", url, {"start": start, "granularity": "week"})
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        food = Category.objects.create(name="Food")
+        # Three rows per day, so page boundaries fall between rows sharing a date.
+        for i in range(13):
+            Expense.objects.create(owner=cls.user, amount=Decimal(i), category=food,
+                                   description=f"expense {i}",
+                                   expense_date=date(2024, 1, 1) + timedelta(days=i // 3))
+        cls.newest_first = list(Expense.objects.order_by("-expense_date", "-id")
+                                .values_list("id", flat=True))
+
+    def page(self, **cursor):
+        return keyset_page(Expense.objects.filter(owner=self.user), per_page=5, **cursor)
+
+    def ids(self, page):
+        return [expense.pk for expense in page]
+
+    def test_walk_forward_then_back(self):
+        pages = [self.page()]
+        while pages[-1].has_next:
+            pages.append(self.page(after=pages[-1].next_cursor))
+        self.assertEqual([len(page) for page in pages], [5, 5, 3])
+        self.assertEqual([pk for page in pages for pk in self.ids(page)], self.newest_first)
+        self.assertEqual([(page.has_previous, page.has_next) for page in pages],
+                         [(False, True), (True, True), (True, False)])
+        self.assertIsNone(pages[0].previous_cursor)
+        self.assertIsNone(pages[-1].next_cursor)
+
+        back = [pages[-1]]
+        while back[-1].has_previous:
+            back.append(self.page(before=back[-1].previous_cursor))
+        self.assertEqual([self.ids(page) for page in back[::-1]], [self.ids(page) for page in pages])
+        self.assertTrue(all(page.has_next for page in back[1:]))
+
+    def test_before_near_the_newest_row_falls_back_to_the_first_page(self):
+        first = self.page()
+        for pk in (self.newest_first[0], self.newest_first[2]):
+            with self.subTest(before=pk):
+                page = self.page(before=encode_cursor(Expense.objects.get(pk=pk)))
+                self.assertEqual(self.ids(page), self.ids(first))
+                self.assertEqual((page.has_previous, page.has_next), (False, True))
+
+    def test_before_reports_has_next_from_the_data(self):
+        oldest = Expense.objects.get(pk=self.newest_first[-1])
+        cursor = encode_cursor(oldest)
+        oldest.delete()
+        page = self.page(before=cursor)
+        self.assertEqual(self.ids(page), self.newest_first[7:12])
+        self.assertEqual((page.has_previous, page.has_next), (True, False))
+
+    def test_malformed_cursors_fall_back_to_the_first_page(self):
+        first = self.ids(self.page())
+        for cursor in ("garbage", "2024-13-01.5", "2024-01-01.x", "2024-01-01", "1.2.3", ""):
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.ids(self.page(after=cursor)), first)
+                self.assertEqual(self.ids(self.page(before=cursor)), first)
+
+    def test_index_view_pages(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("expenses"), {"after": "garbage"})
+        self.assertEqual(response.status_code, 200)
+        page = response.context["page_obj"]
+        response = self.client.get(reverse("expenses"), {"after": page.next_cursor})
+        self.assertEqual(self.ids(response.context["page_obj"]), self.newest_first[5:10])
+
+
+class ExportTests(TestCase):
+    HEADER = ["date", "description", "category", "amount", "currency"]
+    XLSX_NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        other = User.objects.create_user(username="bob", password="secret123")
+        food = Category.objects.create(name="Food")
+        rent = Category.objects.create(name="Rent")
+        Expense.objects.create(owner=cls.user, amount=Decimal("12.50"), category=food,
+                               description='Lunch, "the usual" <cafe>', expense_date=date(2024, 3, 2))
+        Expense.objects.create(owner=cls.user, amount=Decimal("800"), category=rent,
+                               description="March rent", expense_date=date(2024, 3, 1))
+        Expense.objects.create(owner=cls.user, amount=Decimal("9"), category=food,
+                               description="Old lunch", expense_date=date(2023, 12, 30))
+        Expense.objects.create(owner=other, amount=Decimal("1"), category=food,
+                               description="not mine", expense_date=date(2024, 3, 2))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def export(self, fmt, **params):
+        response = self.client.get(reverse("expense-export", args=[fmt]), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(f"expenses.{fmt}", response["Content-Disposition"])
+        return b"".join(response.streaming_content)
+
+    async def aexport(self, fmt, **params):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("expense-export", args=[fmt]), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    def parse(self, fmt, body) -> list:
+        """Rows as lists of strings, header first."""
+        if fmt == "csv":
+            return list(csv.reader(StringIO(body.decode())))
+        if fmt == "json":
+            rows = json.loads(body)
+            self.assertTrue(all(list(row) == self.HEADER for row in rows))
+            return [self.HEADER] + [[str(value) for value in row.values()] for row in rows]
+        with zipfile.ZipFile(BytesIO(body)) as archive:
+            self.assertIn("xl/workbook.xml", archive.namelist())
+            sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+        return [[cell.findtext(".//x:t", namespaces=self.XLSX_NS) or cell.findtext("x:v", namespaces=self.XLSX_NS)
+                 for cell in row.findall("x:c", self.XLSX_NS)]
+                for row in sheet.iter(f"{{{self.XLSX_NS['x']}}}row")]
+
+    def assertRows(self, fmt, rows, expected):
+        self.assertEqual(rows[0], self.HEADER)
+        amounts = [Decimal(row[3]) for row in rows[1:]]
+        self.assertEqual([(row[0], row[1], row[2], row[4]) for row in rows[1:]],
+                         [(day, text, category, "USD") for day, text, category, _ in expected])
+        self.assertEqual(amounts, [Decimal(amount) for *_, amount in expected])
+
+    def test_formats(self):
+        expected = [("2024-03-02", 'Lunch, "the usual" <cafe>', "Food", "12.50"),
+                    ("2024-03-01", "March rent", "Rent", "800"),
+                    ("2023-12-30", "Old lunch", "Food", "9")]
+        for fmt in ("csv", "json", "xlsx"):
+            with self.subTest(fmt=fmt):
+                self.assertRows(fmt, self.parse(fmt, self.export(fmt)), expected)
+
+    def test_filters(self):
+        rows = self.parse("csv", self.export("csv", start="2024-01-01", category="Food"))
+        self.assertEqual([row[1] for row in rows[1:]], ['Lunch, "the usual" <cafe>'])
+        rows = self.parse("json", self.export("json", end="2023-12-31"))
+        self.assertEqual([row[1] for row in rows[1:]], ["Old lunch"])
+
+    def test_empty_export(self):
+        for fmt in ("csv", "json", "xlsx"):
+            with self.subTest(fmt=fmt):
+                self.assertEqual(self.parse(fmt, self.export(fmt, start="2030-01-01"))[1:], [])
+
+    def test_bad_requests(self):
+        response = self.client.get(reverse("expense-export", args=["csv"]), {"start": "03/02/2024"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "start must use YYYY-MM-DD"})
+        response = self.client.get(reverse("expense-export", args=["pdf"]))
+        self.assertEqual(response.status_code, 400)
+
+    async def test_asgi_streams_asynchronously(self):
+        for fmt in ("csv", "json", "xlsx"):
+            with self.subTest(fmt=fmt):
+                sync_body = await sync_to_async(self.export)(fmt)
+                self.assertEqual(self.parse(fmt, await self.aexport(fmt)), self.parse(fmt, sync_body))
+
+
+class ImportTests(TestCase):
+    HEADER = "date,description,category,amount\n"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+
+    def run_import(self, body):
+        return importers.import_expenses(self.user, importers.parse_csv(StringIO(self.HEADER + body)))
+
+    def rollup_total(self):
+        return ExpenseMonthlyRollup.objects.get(owner=self.user).total
+
+    def test_amounts_are_rounded_before_they_are_summed(self):
+        report = self.run_import("2024-03-01,a,Food,1.005\n" * 3)
+        self.assertEqual((report.created, report.errors), (3, []))
+        stored = list(Expense.objects.filter(owner=self.user).values_list("amount", flat=True))
+        self.assertEqual(stored, [Decimal("1.00")] * 3)
+        self.assertEqual(self.rollup_total(), sum(stored))
+
+    def test_bad_amounts_are_row_errors(self):
+        report = self.run_import(
+            "2024-03-01,a,Food,NaN\n2024-03-01,b,Food,Infinity\n2024-03-01,c,Food,-inf\n"
+            "2024-03-01,d,Food,100000000\n2024-03-01,e,Food,1e30\n2024-03-01,f,Food,abc\n")
+        self.assertEqual(report.created, 0)
+        self.assertEqual(report.errors, [
+            (2, "Invalid amount"), (3, "Invalid amount"), (4, "Invalid amount"),
+            (5, "Amount is too large"), (6, "Amount is too large"), (7, "Invalid amount")])
+        self.assertFalse(Expense.objects.exists())
+
+    def test_mixed_file_imports_the_good_rows(self):
+        report = self.run_import(
+            "2024-03-01,ok,Food,99999999.99\n"
+            "2024-03-01,nan,Food,NaN\n"
+            "2024-13-01,bad date,Food,1\n"
+            "2024-03-02,,Food,1\n"
+            "2024-03-02,no category,Nope,1\n"
+            "2024-03-03,ok too,Food,0.015\n")
+        self.assertEqual(report.created, 2)
+        self.assertEqual([line for line, _ in report.errors], [3, 4, 5, 6])
+        self.assertEqual(self.rollup_total(), Decimal("100000000.01"))
+        rollups.rebuild(Expense, ExpenseMonthlyRollup)
+        self.assertEqual(self.rollup_total(), Decimal("100000000.01"))
+
+    def upload(self, content: bytes, **data):
+        self.client.force_login(self.user)
+        return self.client.post(reverse("expense-import"), {
+            "file": SimpleUploadedFile("bank.csv", content), **data})
+
+    def test_upload_in_another_encoding(self):
+        content = (self.HEADER + "2024-03-01,Caf\xe9 cr\xe8me,Food,3.50\n").encode("cp1252")
+        response = self.upload(content)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("not valid UTF-8", [str(m) for m in response.context["messages"]][0])
+        self.assertFalse(Expense.objects.exists())
+
+        response = self.upload(content, encoding="cp1252")
+        self.assertEqual(response.context["report"].created, 1)
+        self.assertEqual(Expense.objects.get().description, "Caf\xe9 cr\xe8me")
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        other = User.objects.create_user(username="bob", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+        cls.travel = Category.objects.create(name="Travel")
+        cls.lunch = Expense.objects.create(
+            owner=cls.user, amount=Decimal("12.50"), category=cls.food,
+            description="Lunch at Cafe", expense_date=date(2024, 3, 2))
+        cls.brunch = Expense.objects.create(
+            owner=cls.user, amount=Decimal("30"), category=cls.food,
+            description="Sunday brunch", expense_date=date(2024, 3, 9))
+        cls.train = Expense.objects.create(
+            owner=cls.user, amount=Decimal("48.20"), category=cls.travel,
+            description="Train to Lyon", expense_date=date(2024, 2, 20))
+        Expense.objects.create(owner=other, amount=Decimal("5"), category=cls.food,
+                               description="lunch", expense_date=date(2024, 3, 2))
+
+    def ids(self, text):
+        return [row["id"] for row in search.search(self.user, text, limit=50)["results"]]
+
+    def test_parse_terms(self):
+        self.assertEqual(search.parse_terms("  Lunch, CAFE!  12.50 2024-03 "),
+                         ["lunch", "cafe", "12.50", "2024-03"])
+        self.assertEqual(search.parse_terms("?!"), [])
+
+    def test_terms_match_anywhere_in_amount_date_description_and_category(self):
+        self.assertEqual(self.ids("unch"), [self.brunch.pk, self.lunch.pk])
+        self.assertEqual(self.ids("12.5"), [self.lunch.pk])
+        self.assertEqual(self.ids("2024-02"), [self.train.pk])
+        self.assertEqual(self.ids("travel"), [self.train.pk])
+
+    def test_every_term_must_match(self):
+        self.assertEqual(self.ids("food cafe"), [self.lunch.pk])
+        self.assertEqual(self.ids("food lyon"), [])
+        self.assertEqual(search.search(self.user, "   ")["results"], [])
+
+    @skipUnless(connection.vendor == "postgresql", "ranking needs Postgres full-text search")
+    def test_word_prefix_matches_rank_first(self):
+        # "lunch" starts a word in the older row and sits inside "brunch" in the newer one.
+        self.assertEqual(self.ids("lunch"), [self.lunch.pk, self.brunch.pk])
+
+    @skipUnless(connection.vendor == "postgresql", "ranking needs Postgres full-text search")
+    def test_only_the_newest_candidates_are_ranked(self):
+        with mock.patch.object(search, "RANK_CANDIDATES", 1):
+            # The older word-prefix match falls outside the candidate set.
+            self.assertEqual(self.ids("lunch"), [self.brunch.pk])
+
+    def test_document_follows_edits(self):
+        self.lunch.description = "Dinner at Cafe"
+        self.lunch.save()
+        self.assertEqual(self.ids("dinner"), [self.lunch.pk])
+        self.assertEqual(self.ids("lunch"), [])
+
+        self.lunch.amount = Decimal("99.99")
+        self.lunch.category = self.travel
+        self.lunch.save(update_fields=["amount", "category"])
+        self.assertEqual(self.ids("99.99 travel"), [self.lunch.pk])
+        self.assertEqual(self.ids("12.50"), [])
+
+    def test_document_follows_category_renames(self):
+        self.travel.name = "Transport"
+        self.travel.save()
+        self.assertEqual(self.ids("transport"), [self.train.pk])
+
+
+class SearchWindowTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+        for i in range(12):
+            Expense.objects.create(owner=cls.user, amount=Decimal(i), category=cls.food,
+                                   description=f"lunch {i}",
+                                   expense_date=date.today() - timedelta(days=i))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        search.recent.clear()
+        self.addCleanup(search.recent.clear)
+
+    def search(self, text, **window):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(reverse("expense-search"), {"searchText": text, **window},
+                                        content_type="application/json")
+        return response.json(), len(captured.captured_queries)
+
+    def test_limit_offset_and_total(self):
+        payload, _ = self.search("lunch", limit=5, offset=10)
+        self.assertEqual(len(payload["results"]), 2)
+        self.assertEqual((payload["limit"], payload["offset"]), (5, 10))
+        self.assertEqual(payload["total"], 12)
+        self.assertFalse(payload["has_next"])
+        self.assertFalse(payload["total_capped"])
+
+    def test_total_is_capped(self):
+        with mock.patch.object(search, "TOTAL_CAP", 5):
+            payload, _ = self.search("lunch", limit=2)
+        self.assertTrue(payload["has_next"])
+        self.assertTrue(payload["total_capped"])
+        self.assertEqual(payload["total"], 5)
+
+    def test_repeated_search_is_served_until_data_changes(self):
+        first, first_queries = self.search("lunch", limit=50)
+        repeat, repeat_queries = self.search("lunch", limit=50)
+        self.assertEqual(repeat, first)
+        self.assertLess(repeat_queries, first_queries)
+
+        Expense.objects.create(owner=self.user, amount=Decimal("99"), category=self.food,
+                               description="lunch extra", expense_date=date.today())
+        payload, _ = self.search("lunch", limit=50)
+        self.assertEqual(payload["total"], 13)
+
+    def test_edit_changes_repeated_results(self):
+        self.assertEqual(self.search("lunch", limit=50)[0]["total"], 12)
+        expense = Expense.objects.get(description="lunch 5")
+        expense.description = "dinner 5"
+        expense.save()
+        payload, _ = self.search("lunch", limit=50)
+        self.assertEqual(payload["total"], 11)
+        self.assertNotIn(expense.pk, [row["id"] for row in payload["results"]])
+
+    def test_write_in_another_process_changes_results(self):
+        self.search("lunch", limit=50)
+        # Another worker's write only reaches this one through the shared data version.
+        Expense.objects.filter(owner=self.user, description="lunch 0").update(
+            description="dinner 0", search_document="0.00 dinner 0")
+        self.assertEqual(self.search("lunch", limit=50)[0]["total"], 12)
+        cache.bump_data_version(self.user.pk)
+        self.assertEqual(self.search("lunch", limit=50)[0]["total"], 11)
+
+    def test_income_write_changes_repeated_results(self):
+        url = reverse("search_income")
+        first = self.client.post(url, {"searchText": "bonus"}, content_type="application/json")
+        self.assertEqual(first.json()["results"], [])
+        UserIncome.objects.create(owner=self.user, amount=Decimal("50"), source="Work",
+                                  description="bonus", date=date.today())
+        payload = self.client.post(url, {"searchText": "bonus"}, content_type="application/json")
+        self.assertEqual(len(payload.json()["results"]), 1)
+
+
+class StatsApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+        cls.today = date.today()
+        Expense.objects.create(owner=cls.user, amount=Decimal("12.50"), category=cls.food,
+                               description="lunch", expense_date=cls.today)
+        UserIncome.objects.create(owner=cls.user, amount=Decimal("100.00"), source="Salary",
+                                  description="pay", date=cls.today)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_one_grouped_query_for_the_whole_page(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse("stats-api"))
+        rollup_queries = [query for query in captured.captured_queries
+                          if "monthlyrollup" in query["sql"]]
+        self.assertEqual(len(rollup_queries), 1)
+
+        data = response.json()
+        month = str(self.today.month)
+        self.assertEqual(data["this_year_expenses_data"]["months"][month], 12.5)
+        self.assertEqual(data["last_3_months_expense_data"]["categories"], {"Food": 12.5})
+        self.assertEqual(data["income_sources_data"]["sources"], {"Salary": 100.0})
+        self.assertEqual(sum(data["this_year_income_data"]["months"].values()), 0)
+
+    def test_etag_revalidation(self):
+        response = self.client.get(reverse("stats-api"))
+        etag = response["ETag"]
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        response = self.client.get(reverse("stats-api"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Expense.objects.create(owner=self.user, amount=Decimal("7.50"), category=self.food,
+                               description="coffee", expense_date=self.today)
+        response = self.client.get(reverse("stats-api"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["last_3_months_expense_data"]["categories"], {"Food": 20.0})
+
+    def test_every_write_changes_the_etag(self):
+        def etag():
+            return self.client.get(reverse("stats-api"))["ETag"]
+
+        seen = [etag()]
+        expense = Expense.objects.get(owner=self.user)
+        expense.amount = Decimal("13.00")
+        expense.save()
+        seen.append(etag())
+        UserIncome.objects.create(owner=self.user, amount=Decimal("5.00"), source="Gift",
+                                  description="gift", date=self.today)
+        seen.append(etag())
+        expense.delete()
+        seen.append(etag())
+        # A write made by another worker reaches this one through the shared version.
+        cache.bump_data_version(self.user.pk)
+        seen.append(etag())
+        self.assertEqual(len(set(seen)), len(seen))
+
+    def test_page_loads_the_stats_script(self):
+        response = self.client.get(reverse("stats"))
+        self.assertContains(response, "js/userStats.js")
+        self.assertContains(response, 'class="expense-this-month"')
+
+
+class ExpenseViewAccessTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+        cls.expense = Expense.objects.create(owner=cls.user, amount=Decimal("5"), category=cls.food,
+                                             description="lunch", expense_date=date.today())
+
+    def test_anonymous_writes_redirect_to_login(self):
+        post = {"amount": "9", "description": "changed", "expense_date": "2024-01-02",
+                "category": "Food"}
+        for url in (reverse("expense-add"), reverse("expense-edit", args=[self.expense.pk])):
+            with self.subTest(url=url):
+                response = self.client.post(url, post)
+                self.assertEqual(response.status_code, 302)
+                self.assertTrue(response["Location"].startswith("/authentication/login"))
+        self.expense.refresh_from_db()
+        self.assertEqual(self.expense.description, "lunch")
+        self.assertEqual(Expense.objects.count(), 1)
+
+    def edit(self, amount, **fields):
+        self.client.force_login(self.user)
+        return self.client.post(reverse("expense-edit", args=[self.expense.pk]), {
+            "amount": amount, "description": "dinner", "expense_date": "2024-01-02", **fields})
+
+    def test_edit_rejects_non_finite_and_too_large_amounts(self):
+        for amount, error in (("NaN", "Invalid amount"), ("Infinity", "Invalid amount"),
+                              ("-inf", "Invalid amount"), ("1e20", "Amount is too large")):
+            with self.subTest(amount=amount):
+                response = self.edit(amount, category="Food")
+                self.assertEqual(response.status_code, 200)
+                # The edit page doesn't show messages, so earlier ones pile up.
+                self.assertEqual([str(m) for m in response.context["messages"]][-1], error)
+        self.expense.refresh_from_db()
+        self.assertEqual((self.expense.amount, self.expense.description), (Decimal("5"), "lunch"))
+
+    def test_edit_rounds_the_amount_and_keeps_the_category(self):
+        self.assertRedirects(self.edit("12.345"), reverse("expenses"), fetch_redirect_response=False)
+        self.expense.refresh_from_db()
+        self.assertEqual(self.expense.amount, Decimal("12.34"))
+        self.assertEqual(self.expense.category, self.food)
+        self.assertEqual(self.expense.search_document, "12.34 2024-01-02 dinner food")
+
+    def test_list_pages_load_their_search_script(self):
+        self.client.force_login(self.user)
+        for url, script in ((reverse("expenses"), "js/searchExpenses.js"),
+                            (reverse("income"), "js/searchIncome.js")):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertContains(response, script)
+                self.assertContains(response, 'id="searchField"')
+                self.assertContains(response, 'class="table-body"')
+
+
+class CategoryRegistryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        cls.food = Category.objects.create(name="Food")
+        cls.expense = Expense.objects.create(owner=cls.user, amount=Decimal("5"), category=cls.food,
+                                             description="lunch", expense_date=date.today())
+
+    def setUp(self):
+        self.client.force_login(self.user)
+        categories.registry.invalidate()
+        self.addCleanup(categories.registry.invalidate)
+
+    def category_queries(self, method, path, data=None):
+        with CaptureQueriesContext(connection) as captured:
+            getattr(self.client, method)(path, data)
+        return [query["sql"] for query in captured.captured_queries
+                if 'FROM "expenses_category"' in query["sql"]]
+
+    def test_steady_state_add_and_edit_skip_category_queries(self):
+        self.assertEqual(len(self.category_queries("get", reverse("expense-add"))), 1)
+        self.assertEqual(self.category_queries("get", reverse("expense-add")), [])
+        self.assertEqual(self.category_queries("post", reverse("expense-add"), {
+            "amount": "3", "description": "coffee", "expense_date": "2024-01-02", "category": "Food",
+        }), [])
+        self.assertEqual(self.category_queries(
+            "get", reverse("expense-edit", args=[self.expense.pk])), [])
+        self.assertEqual(Expense.objects.get(description="coffee").search_document,
+                         "3.00 2024-01-02 coffee food")
+
+    def test_changes_invalidate_the_registry(self):
+        self.assertEqual(categories.registry.id_of("Food"), self.food.pk)
+        rent = Category.objects.create(name="Rent")
+        self.assertEqual(categories.registry.ids(), {"Food": self.food.pk, "Rent": rent.pk})
+        rent.delete()
+        self.assertEqual(categories.registry.names(), {self.food.pk: "Food"})
+
+    def test_unknown_name_reloads_once(self):
+        categories.registry.ids()
+        # Created behind the registry's back, as another process would.
+        Category.objects.bulk_create([Category(name="Travel")])
+        travel = Category.objects.get(name="Travel")
+        self.assertEqual(categories.registry.id_of("Travel"), travel.pk)
+        self.assertIsNone(categories.registry.id_of("Nope"))
+
+
+class LayoutCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_templates_use_the_cached_loader(self):
+        loaders = engines["django"].engine.template_loaders
+        self.assertEqual([type(loader).__name__ for loader in loaders], ["Loader"])
+        self.assertEqual(loaders[0].__module__, "django.template.loaders.cached")
+
+    def test_navbar_adds_no_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse("expense-add"))
+        self.assertContains(response, "Sign Out")
+        self.assertContains(response, "csrfmiddlewaretoken")
+        self.assertEqual([query["sql"] for query in captured.captured_queries
+                          if "userpreferences_userpreference" in query["sql"]], [])
+
+
+class SessionModeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        Category.objects.create(name="Food")
+
+    def session_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            self.client.get(reverse("expenses"))
+            response = self.client.post(reverse("expense-add"), {
+                "amount": "3", "description": "coffee", "expense_date": "2024-01-02",
+                "category": "Food"})
+        self.assertRedirects(response, reverse("expenses"), fetch_redirect_response=False)
+        self.assertTrue(Expense.objects.filter(description="coffee").exists())
+        return [query["sql"] for query in captured.captured_queries
+                if "django_session" in query["sql"]]
+
+    def test_db_sessions_read_the_table(self):
+        self.client.force_login(self.user)
+        self.assertTrue(self.session_queries())
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies",
+                       MESSAGE_STORAGE="django.contrib.messages.storage.cookie.CookieStorage")
+    def test_signed_cookie_sessions_skip_the_table(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.session_queries(), [])
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.cached_db")
+    def test_cached_db_sessions_skip_reads(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.session_queries(), [])
+
+
+class ProfilingMiddlewareTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="alice", password="secret123")
+        self.client.force_login(self.user)
+        profiling.metrics.reset()
+        self.addCleanup(profiling.metrics.reset)
+
+    def test_records_view_latency_and_queries(self):
+        self.client.get(reverse("expenses"))
+        stats = profiling.metrics.snapshot()[("expenses", "GET")]
+        self.assertEqual(stats["requests"], 1)
+        self.assertGreater(stats["queries"], 0)
+        self.assertGreater(stats["seconds"], stats["sql_seconds"])
+
+    def test_flags_repeated_statements(self):
+        recorder = profiling.QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            for name in ("Food", "Rent", "Travel"):
+                Category.objects.filter(name=name).exists()
+        self.assertEqual(recorder.count, 3)
+        self.assertEqual(recorder.duplicates, 2)
+
+    def test_metrics_endpoint(self):
+        self.client.get(reverse("expenses"))
+        response = self.client.get(reverse("ops-metrics"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'view_db_queries_total{view="expenses",method="GET"}')
+        self.assertContains(response, 'view_request_duration_seconds_count{view="expenses",method="GET"} 1')
+
+        response = self.client.get(reverse("ops-metrics"), REMOTE_ADDR="10.0.0.1")
+        self.assertEqual(response.status_code, 403)
+
+
+class AsyncEndpointTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="secret123")
+        food = Category.objects.create(name="Food")
+        Expense.objects.create(owner=cls.user, amount=Decimal("12.50"), category=food,
+                               description="team lunch", expense_date=date.today())
+
+    async def test_search_and_summary(self):
+        await self.async_client.aforce_login(self.user)
+        profiling.metrics.reset()
+        self.addCleanup(profiling.metrics.reset)
+
+        response = await self.async_client.post(
+            reverse("expense-search"), {"searchText": "lunch"}, content_type="application/json")
+        self.assertEqual([row["description"] for row in response.json()["results"]], ["team lunch"])
+
+        response = await self.async_client.get(reverse("expense-category-summary"))
+        self.assertEqual(response.json()["expense_category_data"], {"Food": 12.5})
+
+        # Queries run by the async ORM are still attributed to the view.
+        self.assertGreater(profiling.metrics.snapshot()[("expense-search", "POST")]["queries"], 0)
@@ -9,8 +9,13 @@ urlpatterns = [
     path("search/", views.search_expenses, name="expense-search"),
     path("summary/", views.summary_view, name="summary"),
     path("stats/", views.stats_view, name="stats"),
+    path("stats/data/", views.stats_api, name="stats-api"),
+    path("summary/cache-stats/", views.dashboard_cache_stats,
+         name="dashboard-cache-stats"),
     path("category-summary/", views.expense_category_summary,
          name="expense-category-summary"),
     path("add-expense/", views.add_expense, name="add_expense"),
+    path("import/", views.import_expenses, name="expense-import"),
+    path("export/<str:fmt>/", views.export_expenses, name="expense-export"),
 
 ]
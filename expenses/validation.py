@@ -0,0 +1,51 @@
+from datetime import datetime
+from decimal import Decimal
+
+from .models import Expense
+
+CENTS = Decimal("0.01")
+_amount_field = Expense._meta.get_field("amount")
+# Smallest amount the column cannot hold (10 digits, 2 after the point).
+AMOUNT_LIMIT = Decimal(10) ** (_amount_field.max_digits - _amount_field.decimal_places)
+
+
+class ExpenseRowError(ValueError):
+    pass
+
+
+def clean_expense(amount_str: str, description: str, date_str: str,
+                  category_name: str, category_ids: dict) -> dict:
+    """Validate raw expense fields the way add_expense always has.
+
+    ``category_ids`` maps category name to id so callers can resolve many
+    rows without a query each. Raises ExpenseRowError with the user-facing
+    message for the first invalid field. The amount comes back rounded to
+    cents, as the column stores it, so totals built from it match the rows.
+    """
+    try:
+        amount = Decimal(amount_str)
+    except Exception:
+        raise ExpenseRowError("Invalid amount")
+    if not amount.is_finite():
+        raise ExpenseRowError("Invalid amount")
+    if abs(amount) >= AMOUNT_LIMIT:
+        raise ExpenseRowError("Amount is too large")
+    amount = amount.quantize(CENTS)
+
+    if not description.strip():
+        raise ExpenseRowError("Description is required")
+
+    try:
+        expense_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+    except Exception:
+        raise ExpenseRowError("Invalid date format")
+
+    if category_name not in category_ids:
+        raise ExpenseRowError("Selected category does not exist")
+
+    return {
+        "amount": amount,
+        "description": description,
+        "expense_date": expense_date,
+        "category_id": category_ids[category_name],
+    }
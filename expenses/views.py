@@ -1,51 +1,66 @@
-from datetime import datetime, date, timedelta
+import codecs
+from datetime import date
 import json
 from decimal import Decimal
 
 from django.contrib import messages
+from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
 from django.db.models import Sum
 from django.http import JsonResponse, HttpRequest, HttpResponse
 from django.shortcuts import render, redirect, get_object_or_404
-
-from .models import Category, Expense
-from income.models import Income
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+from . import cache, categories, exports, importers, search, stats, summary
+from .models import Expense, ExpenseMonthlyRollup
+from .pagination import keyset_page
+from .validation import ExpenseRowError, clean_expense
+from income.models import IncomeMonthlyRollup
+from userpreferences import fx
 from userpreferences.models import UserPreference
 
+IMPORT_ERRORS_SHOWN = 100
+
 
 # 🔎 AJAX: Search Expenses
-def search_expenses(request: HttpRequest) -> JsonResponse:
-    """Search expenses by amount, date, description, or category."""
+@login_required(login_url="/authentication/login")
+async def search_expenses(request: HttpRequest) -> JsonResponse:
+    """Ranked search by amount, date, description, or category.
+
+    Takes ``limit``/``offset`` and returns a capped total; a session repeating
+    one of its recent searches gets the stored response back.
+    """
     if request.method == "POST":
-        search_str = json.loads(request.body).get("searchText", "")
-        expenses = (
-            Expense.objects.filter(amount__startswith=search_str, owner=request.user) |
-            Expense.objects.filter(expense_date__startswith=search_str, owner=request.user) |
-            Expense.objects.filter(description__icontains=search_str, owner=request.user) |
-            Expense.objects.filter(
-                category__name__icontains=search_str, owner=request.user)
-        )
-        return JsonResponse(list(expenses.values()), safe=False)
-    return JsonResponse([], safe=False)
+        payload = json.loads(request.body)
+        search_str = payload.get("searchText", "")
+        limit, offset = search.window_params(payload)
+        user = await request.auser()
+
+        session = request.session.session_key or f"user:{user.pk}"
+        key = ("expenses", await cache.adata_version(user.pk),
+               tuple(search.parse_terms(search_str)), limit, offset)
+        response = search.recent.get(session, key)
+        if response is None:
+            response = await search.asearch(user, search_str, limit, offset)
+            search.recent.put(session, key, response)
+        return JsonResponse(response)
+    return JsonResponse({"results": [], "has_next": False, "total": 0})
 
 
 # 🏠 Dashboard / Index
 @login_required(login_url="/authentication/login")
 def index(request: HttpRequest) -> HttpResponse:
     expenses = Expense.objects.filter(
-        owner=request.user).order_by("-expense_date")
-
-    paginator = Paginator(expenses, 5)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+        owner=request.user).select_related("category")
+    page_obj = keyset_page(
+        expenses, after=request.GET.get("after"), before=request.GET.get("before"))
 
     user_preference, _ = UserPreference.objects.get_or_create(
         owner=request.user, defaults={"currency": "USD"}
     )
 
     context = {
-        "expenses": expenses,
         "page_obj": page_obj,
         "currency": user_preference.currency,
     }
@@ -53,109 +68,64 @@ def index(request: HttpRequest) -> HttpResponse:
 
 
 # ➕ Add Expense
-@login_required(login_url="/authentication/login")
-
 @login_required(login_url="/authentication/login")
 def add_expense(request: HttpRequest) -> HttpResponse:
-    categories = Category.objects.all()
     values = request.POST if request.method == "POST" else {}
     if request.method == "POST":
-        amount_str = request.POST.get("amount") or ""
-        description = request.POST.get("description") or ""
-        date_str = request.POST.get("expense_date") or ""
         category_name = request.POST.get("category") or ""
-
-        # Validate amount
-        try:
-            amount_value = Decimal(amount_str)
-        except Exception:
-            messages.error(request, "Invalid amount")
-            return render(request, "expenses/add_expense.html", {
-                "categories": categories,
-                "values": values
-            })
-
-        # Validate description
-        if not description.strip():
-            messages.error(request, "Description is required")
-            return render(request, "expenses/add_expense.html", {
-                "categories": categories,
-                "values": values
-            })
-
-        # Validate date
         try:
-            expense_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-        except Exception:
-            messages.error(request, "Invalid date format")
+            cleaned = clean_expense(
+                request.POST.get("amount") or "",
+                request.POST.get("description") or "",
+                request.POST.get("expense_date") or "",
+                category_name,
+                categories.registry.ids(expect=category_name),
+            )
+        except ExpenseRowError as exc:
+            messages.error(request, str(exc))
             return render(request, "expenses/add_expense.html", {
-                "categories": categories,
+                "categories": categories.registry.all(),
                 "values": values
             })
 
-        # Validate category
-        try:
-            category_obj = Category.objects.get(name=category_name)
-        except Category.DoesNotExist:
-            messages.error(request, "Selected category does not exist")
-            return render(request, "expenses/add_expense.html", {
-                "categories": categories,
-                "values": values
-            })
-
-        # Save expense
+        # Save expense, recorded in the owner's preferred currency
         Expense.objects.create(
-            owner=request.user,
-            amount=amount_value,
-            description=description,
-            expense_date=expense_date,
-            category=category_obj,
-        )
+            owner=request.user, currency=fx.preferred_currency(request.user), **cleaned)
         messages.success(request, "Expense saved successfully")
         return redirect("expenses")
 
-    return render(request, "expenses/add_expense.html", {"categories": categories, "values": values})
+    return render(request, "expenses/add_expense.html",
+                  {"categories": categories.registry.all(), "values": values})
+
+
+@login_required(login_url="/authentication/login")
 def edit_expense(request: HttpRequest, pk: int) -> HttpResponse:
     expense = get_object_or_404(Expense, id=pk, owner=request.user)
-    categories = Category.objects.all()
+    context = {"expense": expense, "categories": categories.registry.all()}
 
     if request.method == "POST":
-        amount_str = request.POST.get("amount") or ""
-        description = request.POST.get("description") or ""
-        date_str = request.POST.get("expense_date") or ""
-        category_name = request.POST.get("category") or ""
-
-        try:
-            expense.amount = Decimal(amount_str)
-        except Exception:
-            messages.error(request, "Invalid amount")
-            return render(request, "expenses/edit_expense.html", {"expense": expense, "categories": categories})
-
-        if not description.strip():
-            messages.error(request, "Description is required")
-            return render(request, "expenses/edit_expense.html", {"expense": expense, "categories": categories})
-        expense.description = description
-
+        # A form without a category keeps the current one.
+        category_name = (request.POST.get("category")
+                         or categories.registry.names(expect=expense.category_id).get(expense.category_id, ""))
         try:
-            expense.expense_date = datetime.strptime(
-                date_str, "%Y-%m-%d").date()
-        except ValueError:
-            messages.error(request, "Invalid date format")
-            return render(request, "expenses/edit_expense.html", {"expense": expense, "categories": categories})
-
-        if category_name:
-            try:
-                category_obj = Category.objects.get(name=category_name)
-                expense.category = category_obj
-            except Category.DoesNotExist:
-                messages.error(request, "Selected category does not exist")
-                return render(request, "expenses/edit_expense.html", {"expense": expense, "categories": categories})
-
+            cleaned = clean_expense(
+                request.POST.get("amount") or "",
+                request.POST.get("description") or "",
+                request.POST.get("expense_date") or "",
+                category_name,
+                categories.registry.ids(expect=category_name),
+            )
+        except ExpenseRowError as exc:
+            messages.error(request, str(exc))
+            return render(request, "expenses/edit-expense.html", context)
+
+        for field, value in cleaned.items():
+            setattr(expense, field, value)
         expense.save()
         messages.success(request, "Expense updated successfully")
         return redirect("expenses")
 
-    return render(request, "expenses/edit_expense.html", {"expense": expense, "categories": categories})
+    return render(request, "expenses/edit-expense.html", context)
 
 
 # ❌ Delete Expense
@@ -169,22 +139,83 @@ def delete_expense(request: HttpRequest, pk: int) -> HttpResponse:
 
 # 📊 Expense Category Summary (JSON for charts)
 @login_required(login_url="/authentication/login")
-def expense_category_summary(request: HttpRequest) -> JsonResponse:
-    today = date.today()
-    six_months_ago = today - timedelta(days=30 * 6)
+async def expense_category_summary(request: HttpRequest) -> JsonResponse:
+    """Category totals over ``?start=&end=`` (or ``?months=``), optionally bucketed by ``?granularity=``."""
+    try:
+        start, end, granularity = summary.parse_window(request.GET)
+    except summary.SummaryParamError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
 
-    expenses = Expense.objects.filter(
-        owner=request.user, expense_date__gte=six_months_ago, expense_date__lte=today
-    )
+    user = await request.auser()
+    return JsonResponse(await summary.acategory_breakdown(
+        user, start, end, granularity,
+        currency=await fx.apreferred_currency(user)))
+
+
+# 📥 Import Expenses
+@login_required(login_url="/authentication/login")
+def import_expenses(request: HttpRequest) -> HttpResponse:
+    """Bulk import expenses from an uploaded CSV or OFX file."""
+    context = {"categories": categories.registry.all(), "formats": importers.FORMATS,
+               "encodings": importers.ENCODINGS}
+    if request.method == "POST":
+        upload = request.FILES.get("file")
+        if upload is None:
+            messages.error(request, "Choose a file to import")
+            return render(request, "expenses/import.html", context)
+
+        fmt = request.POST.get("format") or upload.name.rsplit(".", 1)[-1].lower()
+        if fmt not in importers.PARSERS:
+            messages.error(request, "Unsupported file format")
+            return render(request, "expenses/import.html", context)
+
+        encoding = request.POST.get("encoding") or "utf-8-sig"
+        if encoding not in importers.ENCODINGS:
+            messages.error(request, "Unsupported encoding")
+            return render(request, "expenses/import.html", context)
+
+        rows = importers.PARSERS[fmt](codecs.iterdecode(upload, encoding))
+        try:
+            report = importers.import_expenses(
+                request.user, rows, default_category=request.POST.get("category") or "",
+                default_currency=fx.preferred_currency(request.user))
+        except UnicodeDecodeError:
+            # Rows are decoded as they are imported; the transaction rolled back.
+            messages.error(request, f"The file is not valid {importers.ENCODINGS[encoding]}; "
+                                    "choose its encoding and try again. Nothing was imported.")
+            return render(request, "expenses/import.html", context)
+        if report.created:
+            messages.success(request, f"Imported {report.created} expenses")
+        context["report"] = report
+        context["errors"] = report.errors[:IMPORT_ERRORS_SHOWN]
+    return render(request, "expenses/import.html", context)
+
+
+# 📤 Export Expenses
+EXPORT_COLUMNS = [
+    ("date", "expense_date"),
+    ("description", "description"),
+    ("category", "category__name"),
+    ("amount", "amount"),
+    ("currency", "currency"),
+]
 
-    summary = {}
-    for category in Category.objects.all():
-        total = expenses.filter(category=category).aggregate(
-            total=Sum("amount"))["total"] or 0
-        if total > 0:
-            summary[category.name] = float(total)
 
-    return JsonResponse({"expense_category_data": summary}, safe=False)
+@login_required(login_url="/authentication/login")
+def export_expenses(request: HttpRequest, fmt: str) -> HttpResponse:
+    """Stream the owner's expenses as CSV, JSON or XLSX."""
+    if fmt not in exports.FORMATS:
+        return JsonResponse({"error": f"Unsupported format {fmt!r}"}, status=400)
+    try:
+        filters = exports.parse_filters(request)
+    except exports.ExportFilterError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    expenses = exports.filter_queryset(
+        Expense.objects.filter(owner=request.user), filters,
+        date_field="expense_date", category_lookup="category__name",
+    ).order_by("-expense_date", "-id")
+    return exports.export_response(request, fmt, "expenses", EXPORT_COLUMNS, expenses)
 
 
 # 📈 Stats View
@@ -193,29 +224,68 @@ def stats_view(request: HttpRequest) -> HttpResponse:
     return render(request, "expenses/stats.html")
 
 
+@login_required(login_url="/authentication/login")
+async def stats_api(request: HttpRequest) -> HttpResponse:
+    """Everything the stats page charts, in one response (see expenses.stats).
+
+    The ETag follows the owner's data version, currency, the FX rates and
+    the date, so reloading with nothing changed is answered with a 304.
+    """
+    user = await request.auser()
+    currency = await fx.apreferred_currency(user)
+    await fx.rates.aload()
+    today = date.today()
+    version = await cache.adata_version(user.pk)
+    etag = quote_etag(f"{version}-{currency}-{fx.rates.fingerprint}-{today.isoformat()}")
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = JsonResponse(await stats.auser_stats(user, currency, today))
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 # 📊 Summary View
 @login_required(login_url="/authentication/login")
 def summary_view(request: HttpRequest) -> HttpResponse:
-    expenses = Expense.objects.filter(owner=request.user)
-    incomes = Income.objects.filter(owner=request.user)
+    currency = fx.preferred_currency(request.user)
+    context = cache.get_dashboard(
+        request.user.pk, lambda: build_dashboard(request.user, currency),
+        variant=f"{currency}:{fx.rates.fingerprint}")
+    return render(request, "expenses/summary.html", context)
 
-    total_expenses = expenses.aggregate(total=Sum("amount"))[
-        "total"] or Decimal("0.00")
-    total_income = incomes.aggregate(total=Sum("amount"))[
-        "total"] or Decimal("0.00")
+
+def build_dashboard(owner, currency: str) -> dict:
+    expense_rollups = ExpenseMonthlyRollup.objects.filter(owner=owner)
+    income_rollups = IncomeMonthlyRollup.objects.filter(owner=owner)
+
+    total_expenses = fx.convert_grouped(
+        expense_rollups.values("currency").annotate(total=Sum("total")),
+        currency).get(None, Decimal("0.00"))
+    total_income = fx.convert_grouped(
+        income_rollups.values("currency").annotate(total=Sum("total")),
+        currency).get(None, Decimal("0.00"))
     balance = total_income - total_expenses
 
-    category_summary = expenses.values(
-        "category__name").annotate(total=Sum("amount"))
+    category_summary = fx.convert_grouped(
+        expense_rollups.values("category__name", "currency").annotate(total=Sum("total")),
+        currency, key="category__name")
 
-    categories = [item["category__name"] for item in category_summary]
-    amounts = [float(item["total"]) for item in category_summary]
+    categories = list(category_summary)
+    amounts = [float(total) for total in category_summary.values()]  # for Chart.js
 
-    context = {
-        "total_expenses": float(total_expenses),
-        "total_income": float(total_income),
-        "balance": float(balance),
+    return {
+        "currency": currency,
+        "total_expenses": total_expenses,
+        "total_income": total_income,
+        "balance": balance,
         "categories_json": json.dumps(categories),
         "amounts_json": json.dumps(amounts),
     }
-    return render(request, "expenses/summary.html", context)
+
+
+# 🧮 Dashboard cache counters
+@staff_member_required
+def dashboard_cache_stats(request: HttpRequest) -> JsonResponse:
+    return JsonResponse(cache.stats())
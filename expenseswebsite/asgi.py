@@ -8,9 +8,13 @@ https://docs.djangoproject.com/en/3.0/howto/deployment/asgi/
 """
 
 import os
+from pathlib import Path
 
 from django.core.asgi import get_asgi_application
+from dotenv import load_dotenv
 
+# Settings read only the environment; local overrides live in .env.
+load_dotenv(Path(__file__).resolve().parent.parent / '.env')
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'expenseswebsite.settings')
 
 application = get_asgi_application()
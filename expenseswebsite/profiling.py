@@ -0,0 +1,221 @@
+"""Per-view latency and SQL profiling.
+
+``QueryProfilingMiddleware`` gives each request a ``QueryRecorder`` that
+counts queries, sums their time and notices the same statement running
+more than once (the usual N+1 shape). Every database connection carries
+a permanent execute wrapper that hands queries to the current request's
+recorder through a context variable, which also reaches the worker
+threads the async ORM runs in. Every request is
+folded into in-process counters served at ``/ops/metrics`` in Prometheus
+text format and, when the ``expenseswebsite.profiling`` logger is enabled
+for INFO, written as one JSON log line.
+
+Work per query is a clock read and a dict increment, and per request a
+locked counter update, so the middleware can stay on in production. Set
+``QUERY_PROFILING`` off to remove it from the stack entirely. Counters are
+per process; scrape every worker, or rely on the log in multi-process
+deployments.
+"""
+import bisect
+import contextvars
+import json
+import logging
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed, PermissionDenied
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` callable tallying one request's SQL."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - started
+            self.count += 1
+            self.statements[sql] = self.statements.get(sql, 0) + 1
+
+    @property
+    def duplicates(self) -> int:
+        """Queries that repeated a statement already run in this request."""
+        return self.count - len(self.statements)
+
+    def repeated(self, limit: int = 3) -> list:
+        counts = sorted(self.statements.items(), key=lambda item: -item[1])
+        return [(sql, count) for sql, count in counts[:limit] if count > 1]
+
+
+_current = contextvars.ContextVar("query_recorder", default=None)
+
+
+def _dispatch(execute, sql, params, many, context):
+    recorder = _current.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install(sender=None, connection=None, **kwargs):
+    """``connection_created`` receiver routing the connection's SQL through ``_dispatch``."""
+    if _dispatch not in connection.execute_wrappers:
+        # Outermost, so ``connection.execute_wrapper()`` blocks still pop their own.
+        connection.execute_wrappers.insert(0, _dispatch)
+
+
+if getattr(settings, "QUERY_PROFILING", False):
+    connection_created.connect(install, dispatch_uid="expenseswebsite.profiling.install")
+
+
+class ViewMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def observe(self, view: str, method: str, seconds: float, recorder: QueryRecorder):
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            stats = self._views.get((view, method))
+            if stats is None:
+                stats = self._views[(view, method)] = {
+                    "requests": 0, "seconds": 0.0, "queries": 0,
+                    "sql_seconds": 0.0, "duplicates": 0,
+                    "buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+                }
+            stats["requests"] += 1
+            stats["seconds"] += seconds
+            stats["queries"] += recorder.count
+            stats["sql_seconds"] += recorder.seconds
+            stats["duplicates"] += recorder.duplicates
+            stats["buckets"][bucket] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {key: {**stats, "buckets": list(stats["buckets"])}
+                    for key, stats in self._views.items()}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+    def render(self) -> str:
+        """The counters in Prometheus text exposition format."""
+        views = sorted(self.snapshot().items())
+        lines = []
+
+        def family(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+
+        def labels(view, method, **extra):
+            pairs = {"view": view, "method": method, **extra}
+            return ",".join(f'{key}="{_escape(value)}"' for key, value in pairs.items())
+
+        histogram = []
+        for (view, method), stats in views:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ("+Inf",), stats["buckets"]):
+                cumulative += count
+                histogram.append(
+                    f"view_request_duration_seconds_bucket{{{labels(view, method, le=str(bound))}}} {cumulative}")
+            histogram.append(f"view_request_duration_seconds_sum{{{labels(view, method)}}} {stats['seconds']:.6f}")
+            histogram.append(f"view_request_duration_seconds_count{{{labels(view, method)}}} {stats['requests']}")
+        family("view_request_duration_seconds", "histogram",
+               "Wall time spent in the view and the middleware below it.", histogram)
+
+        for name, key, help_text in (
+            ("view_db_queries_total", "queries", "SQL queries issued."),
+            ("view_db_query_seconds_total", "sql_seconds", "Time spent executing SQL."),
+            ("view_db_duplicate_queries_total", "duplicates",
+             "Queries repeating a statement already run in the same request."),
+        ):
+            family(name, "counter", help_text, [
+                f"{name}{{{labels(view, method)}}} {stats[key]}" for (view, method), stats in views])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+metrics = ViewMetrics()
+
+
+class QueryProfilingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_PROFILING", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        token = _current.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.record(request, response, recorder, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        token = _current.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.record(request, response, recorder, time.perf_counter() - started)
+        return response
+
+    def record(self, request, response, recorder, elapsed):
+        match = request.resolver_match
+        view = match.view_name if match else "unresolved"
+        metrics.observe(view, request.method, elapsed, recorder)
+
+        if recorder.duplicates and logger.isEnabledFor(logging.WARNING):
+            logger.warning(json.dumps({
+                "event": "duplicate_queries", "view": view, "path": request.path,
+                "duplicates": recorder.duplicates,
+                "repeated": [{"sql": sql, "count": count} for sql, count in recorder.repeated()],
+            }))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(json.dumps({
+                "event": "request", "view": view, "method": request.method,
+                "status": response.status_code, "ms": round(elapsed * 1000, 2),
+                "queries": recorder.count, "sql_ms": round(recorder.seconds * 1000, 2),
+                "duplicates": recorder.duplicates,
+            }))
+
+
+def metrics_view(request):
+    """Prometheus scrape endpoint, open to allowed addresses and staff."""
+    allowed = request.META.get("REMOTE_ADDR") in settings.OPS_METRICS_ALLOWED_IPS
+    if not (allowed or request.user.is_staff):
+        raise PermissionDenied
+    return HttpResponse(metrics.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
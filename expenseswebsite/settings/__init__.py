@@ -0,0 +1,18 @@
+"""
+Django settings for expenseswebsite project.
+
+``DJANGO_ENV`` picks the module: ``dev`` (the default) or ``prod`` (the
+default on Heroku, which sets ``DYNO``).
+"""
+import os
+
+DJANGO_ENV = os.environ.get('DJANGO_ENV', 'prod' if 'DYNO' in os.environ else 'dev')
+
+if DJANGO_ENV == 'prod':
+    from .prod import *  # noqa: F401,F403
+elif DJANGO_ENV == 'dev':
+    from .dev import *  # noqa: F401,F403
+else:
+    from django.core.exceptions import ImproperlyConfigured
+
+    raise ImproperlyConfigured(f"DJANGO_ENV must be 'dev' or 'prod', not {DJANGO_ENV!r}")
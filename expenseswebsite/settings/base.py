@@ -0,0 +1,243 @@
+"""
+Settings shared by every environment; dev.py and prod.py build on these.
+
+Everything here is read from the environment and nothing is read from disk,
+printed or connected to at import time, so importing settings stays cheap
+(manage.py loads .env before Django starts; see manage.py bench_startup).
+"""
+
+from pathlib import Path
+from django.contrib import messages
+import dj_database_url
+import os
+
+# ✅ BASE_DIR as a Path object (fixes the error)
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = os.environ.get('SECRET_KEY', ')l0nv5udi#-6w(kes8pb$e!sp(c!)_6ffg4n=_k5zf8c!^vrec')
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = False
+
+ALLOWED_HOSTS = [host for host in os.environ.get('ALLOWED_HOSTS', '').split(',') if host]
+
+# Application definition
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    # runserver serves static files through WhiteNoise, as in production.
+    'whitenoise.runserver_nostatic',
+    'expenses',
+    'userpreferences',
+    'userincome',
+    'authentication',
+    'tailwind',
+    'theme',
+    # After theme, so theme's collectstatic (which builds Tailwind first)
+    # takes precedence over the stock command.
+    'django.contrib.staticfiles',
+    'income',
+
+
+]
+
+MIDDLEWARE = [
+    'expenseswebsite.profiling.QueryProfilingMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'expenseswebsite.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [BASE_DIR / 'templates'],  # ✅ cleaner with Path
+        'APP_DIRS': True,
+        # With no 'loaders' option Django wraps these in the cached loader,
+        # so templates compile once per process (runserver's autoreloader
+        # resets it when a template changes). Compare with manage.py
+        # bench_templates.
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'expenseswebsite.wsgi.application'
+
+# Database (overridable from env; DATABASE_URL wins)
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ.get("DB_NAME", "incomeexpensesdb"),
+        "USER": os.environ.get("DB_USER", "postgres"),
+        "PASSWORD": os.environ.get("DB_PASSWORD", "1968"),
+        "HOST": os.environ.get("DB_HOST", "127.0.0.1"),
+        "PORT": os.environ.get("DB_PORT", "5432"),
+    }
+}
+
+if 'DATABASE_URL' in os.environ:
+    DATABASES['default'] = dj_database_url.parse(os.environ['DATABASE_URL'])
+    # sslmode is a Postgres option; other backends (sqlite:// for a local run)
+    # would be handed it as a connect() argument and fail.
+    if (DATABASES['default']['ENGINE'] in ('django.db.backends.postgresql',
+                                           'django.contrib.gis.db.backends.postgis')
+            and os.environ.get('DB_SSL_REQUIRE', 'on').lower() in ('1', 'on', 'true', 'yes')):
+        DATABASES['default'].setdefault('OPTIONS', {})['sslmode'] = 'require'
+
+# Password validation
+AUTH_PASSWORD_VALIDATORS = [
+    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
+]
+
+# Internationalization
+LANGUAGE_CODE = 'en-us'
+TIME_ZONE = 'UTC'
+USE_I18N = True
+USE_L10N = True
+USE_TZ = True
+
+# Static files. `manage.py collectstatic` builds the Tailwind stylesheet,
+# then, with STATIC_MANIFEST on, writes content-hashed copies plus gzip and
+# brotli variants that WhiteNoise serves with far-future cache headers. The
+# manifest only exists after collectstatic, so dev.py turns it off by
+# default and serves plain files straight from the source directories.
+STATIC_URL = '/static/'
+STATICFILES_DIRS = [BASE_DIR / 'expenseswebsite' / 'static']
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATICFILES_BACKENDS = {
+    True: 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    False: 'django.contrib.staticfiles.storage.StaticFilesStorage',
+}
+STATIC_MANIFEST = os.environ.get('STATIC_MANIFEST', 'on').lower() in ('1', 'on', 'true', 'yes')
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': STATICFILES_BACKENDS[STATIC_MANIFEST],
+    },
+}
+
+# Connection reuse. With DB_POOL on (the default) each request borrows a
+# connection from psycopg's pool and hands it back when it finishes; Django
+# refuses persistent connections on top of a pool, so DB_CONN_MAX_AGE only
+# applies with the pool off. Health checks drop connections the server has
+# closed before a request gets to use them.
+DB_POOL = os.environ.get('DB_POOL', 'on').lower() in ('1', 'on', 'true', 'yes')
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+if DB_POOL and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', 10)),
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    }
+else:
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('DB_CONN_MAX_AGE', 60))
+
+# Caches. The dashboard alias holds each owner's cached summary and data
+# version, which search and stats responses are keyed on. It is written
+# from signals in whichever process saves a row (web workers, import and
+# rebuild commands), so every process must share it: the default is the
+# database cache (run `manage.py createcachetable` once per database), and
+# Redis works as well. `check --deploy` warns about a per-process backend.
+# dev.py uses local memory, which is fine for a single runserver.
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'db': 'django.core.cache.backends.db.DatabaseCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+}
+DASHBOARD_CACHE_LOCATIONS = {
+    'locmem': 'dashboard',
+    'file': str(BASE_DIR / 'cache' / 'dashboard'),
+    'db': 'dashboard_cache',
+    'redis': 'redis://127.0.0.1:6379/1',
+}
+DASHBOARD_CACHE_BACKEND = os.environ.get('DASHBOARD_CACHE_BACKEND', 'db')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS['locmem'],
+    },
+    'dashboard': {
+        'BACKEND': CACHE_BACKENDS[DASHBOARD_CACHE_BACKEND],
+        'LOCATION': os.environ.get('DASHBOARD_CACHE_LOCATION',
+                                   DASHBOARD_CACHE_LOCATIONS[DASHBOARD_CACHE_BACKEND]),
+    },
+    'sessions': {
+        'BACKEND': CACHE_BACKENDS[os.environ.get('SESSION_CACHE_BACKEND', 'locmem')],
+        'LOCATION': os.environ.get('SESSION_CACHE_LOCATION', 'sessions'),
+    },
+}
+
+# Sessions. 'db' reads django_session on every authenticated request;
+# 'cached_db' serves those reads from the sessions cache and only writes
+# through to the table, so it needs a cache every worker shares (set
+# SESSION_CACHE_BACKEND=redis), or a logout in one worker would not reach
+# the others; 'signed_cookies' keeps the session in the client's cookie and
+# touches no table at all, at the cost of sessions that cannot be revoked
+# server-side. Flash messages then live in their own cookie as well.
+# Compare the modes with manage.py bench_sessions.
+SESSION_ENGINES = {
+    'db': 'django.contrib.sessions.backends.db',
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'signed_cookies': 'django.contrib.sessions.backends.signed_cookies',
+}
+SESSION_MODE = os.environ.get('SESSION_MODE', 'db')
+SESSION_ENGINE = SESSION_ENGINES[SESSION_MODE]
+SESSION_CACHE_ALIAS = 'sessions'
+MESSAGE_STORAGES = {
+    'db': 'django.contrib.messages.storage.fallback.FallbackStorage',
+    'cached_db': 'django.contrib.messages.storage.fallback.FallbackStorage',
+    'signed_cookies': 'django.contrib.messages.storage.cookie.CookieStorage',
+}
+MESSAGE_STORAGE = MESSAGE_STORAGES[SESSION_MODE]
+
+# Amounts are converted through rates quoted against this currency
+# (see userpreferences.fx and manage.py load_fx_rates).
+FX_BASE_CURRENCY = 'USD'
+
+# Per-view latency/query profiling, served at /ops/metrics to these
+# addresses (and to staff); see expenseswebsite.profiling.
+QUERY_PROFILING = os.environ.get('QUERY_PROFILING', 'on').lower() in ('1', 'on', 'true', 'yes')
+OPS_METRICS_ALLOWED_IPS = os.environ.get('OPS_METRICS_ALLOWED_IPS', '127.0.0.1,::1').split(',')
+
+MESSAGE_TAGS = {
+    messages.ERROR: 'danger'
+}
+
+# ✅ Email Configuration (uses .env values)
+EMAIL_HOST = os.environ.get("EMAIL_HOST")
+EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER")
+EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD")
+EMAIL_PORT = 587
+EMAIL_USE_TLS = True
+EMAIL_USE_SSL = False
+DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+
+# ✅ Use console backend for development, real SMTP in production
+EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+TAILWIND_APP_NAME = 'theme'
+LOGOUT_REDIRECT_URL = 'login'  # or your homepage
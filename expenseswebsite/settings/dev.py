@@ -0,0 +1,20 @@
+"""Local development: debug on, static files served unhashed from source, in-memory dashboard cache."""
+import os
+
+from .base import *  # noqa: F401,F403
+from .base import (CACHE_BACKENDS, CACHES, DASHBOARD_CACHE_LOCATIONS, STATICFILES_BACKENDS,
+                   STORAGES)
+
+DEBUG = True
+
+STATIC_MANIFEST = os.environ.get('STATIC_MANIFEST', 'off').lower() in ('1', 'on', 'true', 'yes')
+STORAGES = {**STORAGES, 'staticfiles': {'BACKEND': STATICFILES_BACKENDS[STATIC_MANIFEST]}}
+
+# Enough for a single runserver; writes made by management commands only
+# reach it with a shared backend (DASHBOARD_CACHE_BACKEND=db).
+DASHBOARD_CACHE_BACKEND = os.environ.get('DASHBOARD_CACHE_BACKEND', 'locmem')
+CACHES = {**CACHES, 'dashboard': {
+    'BACKEND': CACHE_BACKENDS[DASHBOARD_CACHE_BACKEND],
+    'LOCATION': os.environ.get('DASHBOARD_CACHE_LOCATION',
+                               DASHBOARD_CACHE_LOCATIONS[DASHBOARD_CACHE_BACKEND]),
+}}
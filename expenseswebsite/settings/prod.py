@@ -0,0 +1,8 @@
+"""Production: debug off, hashed static files, any host unless ALLOWED_HOSTS says otherwise."""
+from .base import *  # noqa: F401,F403
+from .base import ALLOWED_HOSTS
+
+DEBUG = False
+
+# Heroku's router fronts the app under whatever hostname it was given.
+ALLOWED_HOSTS = ALLOWED_HOSTS or ['*']
@@ -7,43 +7,82 @@ tableOutput.style.display = "none";
 const noResults = document.querySelector(".no-results");
 const tbody = document.querySelector(".table-body");
 
-searchField.addEventListener("keyup", (e) => {
-  const searchValue = e.target.value;
-
-  if (searchValue.trim().length > 0) {
-    paginationContainer.style.display = "none";
-    tbody.innerHTML = "";
-    fetch("/search-expenses", {
-      body: JSON.stringify({ searchText: searchValue }),
-      method: "POST",
-    })
-      .then((res) => res.json())
-      .then((data) => {
-        console.log("data", data);
-        appTable.style.display = "none";
-        tableOutput.style.display = "block";
+const SEARCH_DELAY_MS = 250;
+const PAGE_SIZE = 20;
+
+const getCookie = (name) => {
+  const match = document.cookie.match(new RegExp("(?:^|; )" + name + "=([^;]*)"));
+  return match ? decodeURIComponent(match[1]) : "";
+};
+
+let timer = null;
+let inflight = null;
+let lastQuery = "";
+
+const showTable = () => {
+  tableOutput.style.display = "none";
+  appTable.style.display = "block";
+  paginationContainer.style.display = "block";
+};
+
+const runSearch = (searchValue) => {
+  // Only the newest request may update the table.
+  if (inflight) inflight.abort();
+  inflight = new AbortController();
 
-        console.log("data.length", data.length);
+  fetch("/search/", {
+    body: JSON.stringify({ searchText: searchValue, limit: PAGE_SIZE, offset: 0 }),
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+      "X-CSRFToken": getCookie("csrftoken"),
+    },
+    signal: inflight.signal,
+  })
+    .then((res) => res.json())
+    .then((payload) => {
+      const data = payload.results;
+      paginationContainer.style.display = "none";
+      appTable.style.display = "none";
+      tbody.innerHTML = "";
 
-        if (data.length === 0) {
-          noResults.style.display = "block";
-          tableOutput.style.display = "none";
-        } else {
-          noResults.style.display = "none";
-          data.forEach((item) => {
-            tbody.innerHTML += `
+      if (data.length === 0) {
+        noResults.style.display = "block";
+        tableOutput.style.display = "none";
+      } else {
+        noResults.style.display = "none";
+        tableOutput.style.display = "block";
+        tableOutput.dataset.total = payload.total_capped ? `${payload.total}+` : payload.total;
+        data.forEach((item) => {
+          tbody.innerHTML += `
                 <tr>
                 <td>${item.amount}</td>
-                <td>${item.category}</td>
+                <td>${item.category_name}</td>
                 <td>${item.description}</td>
-                <td>${item.date}</td>
+                <td>${item.expense_date}</td>
                 </tr>`;
-          });
-        }
-      });
-  } else {
-    tableOutput.style.display = "none";
-    appTable.style.display = "block";
-    paginationContainer.style.display = "block";
+        });
+      }
+    })
+    .catch((err) => {
+      if (err.name !== "AbortError") throw err;
+    });
+};
+
+searchField.addEventListener("input", (e) => {
+  const searchValue = e.target.value.trim();
+  clearTimeout(timer);
+
+  if (searchValue.length === 0) {
+    if (inflight) inflight.abort();
+    lastQuery = "";
+    showTable();
+    return;
   }
+  if (searchValue === lastQuery) return;
+
+  timer = setTimeout(() => {
+    lastQuery = searchValue;
+    runSearch(searchValue);
+  }, SEARCH_DELAY_MS);
 });
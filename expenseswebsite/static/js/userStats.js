@@ -26,11 +26,9 @@ const updateTopMonthsUI = (topMonth, type) => {
 const updateThisMonthUI = (data = [], type = "expenses") => {
   const currentMonthNumber = new Date().getMonth() + 1;
 
-  const currentMonthData = data.find((item, i) => {
-    const key = currentMonthNumber;
-    // TODO
-    return item;
-  });
+  const currentMonthData = data.find(
+    (item) => Number(Object.keys(item)[0]) === currentMonthNumber
+  );
 
   if (type === "expenses") {
     document.querySelector(".expense-this-month").textContent = getHumanMonth(
@@ -69,35 +67,38 @@ const formatStats = (data = {}, type = "expenses") => {
   updateTopMonthsUI(topMonth, type);
 };
 
-const setGraphs = (data) => {};
+const setGraphs = (data) => {
+  const categories = data.last_3_months_expense_data.categories;
+  new Chart(document.getElementById("myChart"), {
+    type: "doughnut",
+    data: {
+      labels: Object.keys(categories),
+      datasets: [
+        {
+          label: `Last 3 months expenses (${data.currency})`,
+          data: Object.values(categories),
+          borderWidth: 1,
+        },
+      ],
+    },
+    options: {
+      plugins: {
+        title: {
+          display: true,
+          text: "Expenses per category",
+        },
+      },
+    },
+  });
+};
+
 const fetchData = () => {
-  const promise1 = fetch("/expense_summary_rest")
+  // One request for the whole page; the browser revalidates it by ETag.
+  fetch("/stats/data/")
     .then((res) => res.json())
-    .then((data) => Promise.resolve(data))
-    .catch((e) => Promise.reject(e));
-  const promise2 = fetch("/last_3months_stats")
-    .then((res) => res.json())
-    .then((data) => Promise.resolve(data))
-    .catch((e) => Promise.reject(e));
-  const promise3 = fetch("/income/income_sources_data")
-    .then((res) => res.json())
-    .then((data) => Promise.resolve(data))
-    .catch((e) => Promise.reject(e));
-  const promise4 = fetch("/income/income_summary_rest")
-    .then((res) => res.json())
-    .then((data) => Promise.resolve(data))
-    .catch((e) => Promise.reject(e));
-
-  Promise.all([promise1, promise2, promise3, promise4])
     .then((data) => {
-      const [
-        thisYearExpenses,
-        expenseCategories,
-        incomeSources,
-        thisYearIncome,
-      ] = data;
-      formatStats(thisYearExpenses.this_year_expenses_data, "expenses");
-      formatStats(thisYearIncome.this_year_income_data, "income");
+      formatStats(data.this_year_expenses_data, "expenses");
+      formatStats(data.this_year_income_data, "income");
       setGraphs(data);
     })
     .catch((errs) => console.log("errs", errs));
@@ -19,6 +19,7 @@ from django.urls import path
 from expenses import views
 from django.conf import settings
 from django.conf.urls.static import static
+from . import profiling
 urlpatterns = [
     path('', include('expenses.urls')),
     path('authentication/', include('authentication.urls')),
@@ -29,4 +30,5 @@ urlpatterns = [
     path('expenses/', include('expenses.urls')),
     path('summary/', views.summary_view, name='summary'),
     path('stats/', views.stats_view, name='stats'),
+    path('ops/metrics', profiling.metrics_view, name='ops-metrics'),
 ]
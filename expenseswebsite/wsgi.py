@@ -8,9 +8,13 @@ https://docs.djangoproject.com/en/3.0/howto/deployment/wsgi/
 """
 
 import os
+from pathlib import Path
 
 from django.core.wsgi import get_wsgi_application
+from dotenv import load_dotenv
 
+# Settings read only the environment; local overrides live in .env.
+load_dotenv(Path(__file__).resolve().parent.parent / '.env')
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'expenseswebsite.settings')
 
 application = get_wsgi_application()
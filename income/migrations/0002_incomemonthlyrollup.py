@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-18 18:53
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+CENTS = Decimal("0.01")
+
+
+# The aggregation is frozen here as it stood for this migration; app code
+# such as expenses.rollups may change after it has run.
+def backfill_rollups(apps, schema_editor):
+    Source = apps.get_model("income", "Income")
+    Rollup = apps.get_model("income", "IncomeMonthlyRollup")
+    rows = (
+        Source.objects.annotate(bucket_month=TruncMonth("date"))
+        .values("owner_id", "bucket_month", "category")
+        .annotate(bucket_total=Sum("amount"), bucket_count=Count("pk"))
+        .order_by()
+    )
+    Rollup.objects.all().delete()
+    Rollup.objects.bulk_create(
+        (Rollup(owner_id=row["owner_id"], month=row["bucket_month"],
+                category=row["category"],
+                total=Decimal(str(row["bucket_total"])).quantize(CENTS),
+                count=row["bucket_count"])
+         for row in rows.iterator(chunk_size=2000)),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('income', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IncomeMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('category', models.CharField(choices=[('SALARY', 'Salary'), ('BUSINESS', 'Business'), ('INVESTMENT', 'Investment'), ('SIDE_HUSTLE', 'Side Hustle'), ('OTHER', 'Other')], max_length=50)),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('owner', 'month', 'category'), name='unique_income_rollup_bucket')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
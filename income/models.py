@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 
+from expenses.rollups import MonthlyRollup
+
 
 class Income(models.Model):
     CATEGORY_CHOICES = [
@@ -11,7 +14,8 @@ class Income(models.Model):
         ('OTHER', 'Other'),
     ]
 
-    amount = models.FloatField()
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3, default=settings.FX_BASE_CURRENCY)
     date = models.DateField()
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     description = models.TextField(blank=True, null=True)
@@ -19,6 +23,25 @@ class Income(models.Model):
 
     class Meta:
         ordering = ['-date']
+        indexes = [
+            models.Index(fields=['owner', '-date', '-id'],
+                         name='income_owner_date_idx'),
+            models.Index(fields=['owner', 'category', 'date'],
+                         name='income_owner_cat_date_idx'),
+        ]
 
     def __str__(self):
         return f"{self.category}: {self.amount}"
+
+
+class IncomeMonthlyRollup(MonthlyRollup):
+    category = models.CharField(max_length=50, choices=Income.CATEGORY_CHOICES)
+
+    date_field = "date"
+    group_field = "category"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["owner", "month", "category", "currency"],
+                                    name="unique_income_rollup_bucket"),
+        ]
@@ -0,0 +1,4 @@
+from expenses import rollups
+from .models import Income, IncomeMonthlyRollup
+
+rollups.track(Income, IncomeMonthlyRollup)
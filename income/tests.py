@@ -1,3 +1,115 @@
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Sum
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from expenses.queryplan import QueryPlanAssertions
+from .models import Income, IncomeMonthlyRollup
+
+
+class IncomeQueryPlanTests(QueryPlanAssertions, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='alice', password='secret123')
+        other = User.objects.create_user(username='bob', password='secret123')
+        categories = [code for code, _ in Income.CATEGORY_CHOICES]
+        for owner in (cls.user, other):
+            for i in range(60):
+                Income.objects.create(
+                    owner=owner, amount=100 + i, category=categories[i % len(categories)],
+                    description=f'income {i}', date=date.today() - timedelta(days=i * 5))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_income_summary(self):
+        self.assertRequestUsesIndexes('get', reverse('income-summary'))
+
+
+class IncomeDecimalTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='secret123')
+        self.client.force_login(self.user)
+
+    def test_totals_do_not_drift(self):
+        for _ in range(10):
+            self.client.post(reverse('add-income'), {
+                'amount': '0.10', 'income_date': date.today().isoformat(),
+                'category': 'SALARY', 'description': 'tip'})
+
+        rollup = IncomeMonthlyRollup.objects.get(owner=self.user)
+        self.assertEqual(rollup.total, Decimal('1.00'))
+        self.assertEqual(Income.objects.filter(owner=self.user).aggregate(
+            total=Sum('amount'))['total'], Decimal('1.00'))
+        data = self.client.get(reverse('income-summary')).json()
+        self.assertEqual(data['income_category_data'], {'SALARY': 1.0})
+
+
+class IncomeSummaryTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='secret123')
+        self.client.force_login(self.user)
+        self.url = reverse('income-summary')
+        # Not month-aligned, so the totals come from the raw rows.
+        self.params = {'start': (date.today() - timedelta(days=40)).isoformat(),
+                       'end': date.today().isoformat()}
+        self.get(self.params)  # warm up per-process state (URLs, rate table)
+
+    def add_income(self, count):
+        categories = [code for code, _ in Income.CATEGORY_CHOICES]
+        Income.objects.bulk_create(
+            Income(owner=self.user, amount=Decimal('10.00'), category=categories[i % len(categories)],
+                   description='bulk', date=date.today() - timedelta(days=i % 30))
+            for i in range(count))
+
+    def get(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def peak_memory(self, params):
+        tracemalloc.start()
+        try:
+            self.get(params)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_query_count_and_memory_do_not_grow_with_rows(self):
+        self.add_income(50)
+        with CaptureQueriesContext(connection) as few_queries:
+            self.get(self.params)
+        few_memory = self.peak_memory(self.params)
+
+        self.add_income(5000)
+        with CaptureQueriesContext(connection) as many_queries:
+            data = self.get(self.params).json()
+        many_memory = self.peak_memory(self.params)
+
+        self.assertEqual(len(few_queries), len(many_queries))
+        self.assertLess(many_memory, few_memory + 64 * 1024)
+        self.assertEqual(sum(data['income_category_data'].values()), 50500.0)
+
+    def test_monthly_buckets_and_windows(self):
+        Income.objects.create(owner=self.user, amount=Decimal('5.00'), category='SALARY',
+                              description='now', date=date.today())
+        Income.objects.create(owner=self.user, amount=Decimal('7.00'), category='SALARY',
+                              description='old', date=date.today() - timedelta(days=400))
+
+        data = self.get({'granularity': 'month'}).json()
+        self.assertEqual(data['income_category_data'], {'SALARY': 5.0})
+        self.assertEqual(len(data['periods']), 1)
+
+        data = self.get({'months': 24, 'granularity': 'month'}).json()
+        self.assertEqual(data['income_category_data'], {'SALARY': 12.0})
+        self.assertEqual(len(data['periods']), 2)
 
-# Create your tests here.
+    def test_rejects_bad_window(self):
+        self.assertEqual(self.client.get(self.url, {'months': 0}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'granularity': 'year'}).status_code, 400)
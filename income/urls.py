@@ -7,4 +7,5 @@ urlpatterns = [
     path('edit/<int:id>/', views.edit_income, name='edit-income'),
     path('delete/<int:id>/', views.delete_income, name='delete-income'),
     path('summary/', views.income_summary_api, name='income-summary'),
+    path('export/<str:fmt>/', views.export_income, name='income-export'),
 ]
@@ -3,10 +3,13 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.paginator import Paginator
 from django.http import JsonResponse
-from datetime import datetime, date, timedelta
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
 import json
 
-from .models import Income
+from expenses import exports, summary
+from userpreferences import fx
+from .models import Income, IncomeMonthlyRollup
 
 
 @login_required(login_url='/authentication/login')
@@ -37,9 +40,9 @@ def add_income(request):
         return render(request, 'income/add_income.html')
 
     try:
-        amount_value = float(amount)
+        amount_value = Decimal(amount)
         income_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-    except ValueError:
+    except (InvalidOperation, ValueError):
         messages.error(request, 'Invalid amount or date format')
         return render(request, 'income/add_income.html')
 
@@ -48,7 +51,8 @@ def add_income(request):
         amount=amount_value,
         date=income_date,
         category=category,
-        description=description
+        description=description,
+        currency=fx.preferred_currency(request.user),
     )
     messages.success(request, 'Income added successfully')
     return redirect('income-list')
@@ -66,7 +70,7 @@ def edit_income(request, id):
     category = request.POST.get('category')
     description = request.POST.get('description')
 
-    income.amount = float(amount)
+    income.amount = Decimal(amount)
     income.date = datetime.strptime(date_str, "%Y-%m-%d").date()
     income.category = category
     income.description = description
@@ -85,15 +89,51 @@ def delete_income(request, id):
 
 
 @login_required(login_url='/authentication/login')
-def income_summary_api(request):
-    """Return income summary by category for chart.js"""
-    six_months_ago = date.today() - timedelta(days=30 * 6)
-    incomes = Income.objects.filter(
-        owner=request.user, date__gte=six_months_ago)
-
-    summary = {}
-    for income in incomes:
-        summary[income.category] = summary.get(
-            income.category, 0) + income.amount
-
-    return JsonResponse(summary, safe=False)
+async def income_summary_api(request):
+    """Income totals by category for chart.js.
+
+    Takes the same ``start``/``end``/``months``/``granularity`` parameters as
+    the expense category summary; the default is the last six months.
+    """
+    try:
+        start, end, granularity = summary.parse_window(request.GET)
+    except summary.SummaryParamError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
+    user = await request.auser()
+    currency = await fx.apreferred_currency(user)
+    totals, periods = await summary.abreakdown(
+        Income.objects.filter(owner=user),
+        IncomeMonthlyRollup.objects.filter(owner=user),
+        'date', 'category', start, end, granularity, currency)
+
+    data = {'currency': currency, 'income_category_data': totals}
+    if granularity:
+        data['periods'] = periods
+    return JsonResponse(data)
+
+
+EXPORT_COLUMNS = [
+    ('date', 'date'),
+    ('category', 'category'),
+    ('description', 'description'),
+    ('amount', 'amount'),
+    ('currency', 'currency'),
+]
+
+
+@login_required(login_url='/authentication/login')
+def export_income(request, fmt):
+    """Stream the owner's income as CSV, JSON or XLSX."""
+    if fmt not in exports.FORMATS:
+        return JsonResponse({'error': f'Unsupported format {fmt!r}'}, status=400)
+    try:
+        filters = exports.parse_filters(request)
+    except exports.ExportFilterError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
+    incomes = exports.filter_queryset(
+        Income.objects.filter(owner=request.user), filters,
+        date_field='date', category_lookup='category',
+    ).order_by('-date', '-id')
+    return exports.export_response(request, fmt, 'income', EXPORT_COLUMNS, incomes)
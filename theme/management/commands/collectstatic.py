@@ -0,0 +1,18 @@
+from django.contrib.staticfiles.management.commands.collectstatic import Command as CollectStaticCommand
+from django.core.management import call_command
+
+
+class Command(CollectStaticCommand):
+    help = ("Build the Tailwind stylesheet, then collect static files "
+            "(hashed and pre-compressed by the configured storage).")
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument("--skip-tailwind", action="store_true",
+                            help="Collect the stylesheet already in theme/static as is.")
+
+    def handle(self, **options):
+        if not options["skip_tailwind"]:
+            # Writes theme/static/css/dist/styles.css, which collectstatic then picks up.
+            call_command("tailwind", "build", stdout=self.stdout, stderr=self.stderr)
+        return super().handle(**options)
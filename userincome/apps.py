@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class UserincomeConfig(AppConfig):
     name = 'userincome'
+
+    def ready(self):
+        import userincome.signals  # ensures signals are registered
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+# Frozen as it stood for this migration; app code
+# (userpreferences.currencies.code_of) may change after it has run.
+def preferred_codes(apps):
+    """``{owner_id: code}`` for owners whose preference is not the base currency.
+
+    Until this migration amounts were entered in the owner's preferred
+    currency, so that is the currency of every existing row. Preferences
+    were stored either as 'EUR' or as 'EUR - Euro'.
+    """
+    UserPreference = apps.get_model("userpreferences", "UserPreference")
+    codes = {}
+    for owner_id, value in UserPreference.objects.values_list("owner_id", "currency"):
+        code = (value or "").split(" - ", 1)[0].strip().upper()
+        if len(code) == 3 and code != settings.FX_BASE_CURRENCY:
+            codes[owner_id] = code
+    return codes
+
+
+def backfill_currency(apps, schema_editor):
+    # The rollups are rebuilt from these rows, by currency, in the next migration.
+    Source = apps.get_model("userincome", "UserIncome")
+    for owner_id, code in preferred_codes(apps).items():
+        Source.objects.filter(owner_id=owner_id).update(currency=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userincome', '0003_owner_date_indexes'),
+        ('userpreferences', '0002_rename_user_userpreference_owner'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='userincomemonthlyrollup',
+            name='unique_userincome_rollup_bucket',
+        ),
+        migrations.AddField(
+            model_name='userincome',
+            name='currency',
+            field=models.CharField(default=settings.FX_BASE_CURRENCY, max_length=3),
+        ),
+        migrations.AddField(
+            model_name='userincomemonthlyrollup',
+            name='currency',
+            field=models.CharField(default=settings.FX_BASE_CURRENCY, max_length=3),
+        ),
+        migrations.AddConstraint(
+            model_name='userincomemonthlyrollup',
+            constraint=models.UniqueConstraint(fields=('owner', 'month', 'source', 'currency'), name='unique_userincome_rollup_bucket'),
+        ),
+        migrations.RunPython(backfill_currency, migrations.RunPython.noop),
+    ]
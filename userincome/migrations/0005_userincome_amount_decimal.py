@@ -0,0 +1,52 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:10
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Round, TruncMonth
+
+CENTS = Decimal("0.01")
+
+
+# The aggregation is frozen here as it stood for this migration; app code
+# such as expenses.rollups may change after it has run.
+def round_amounts(apps, schema_editor):
+    """Store whole cents and re-sum the rollups from the rounded amounts.
+
+    Postgres rounds in the column cast; SQLite keeps the old REAL values.
+    """
+    Source = apps.get_model("userincome", "UserIncome")
+    Rollup = apps.get_model("userincome", "UserIncomeMonthlyRollup")
+    Source.objects.update(amount=Round(F("amount"), 2))
+    rows = (
+        Source.objects.annotate(bucket_month=TruncMonth("date"))
+        .values("owner_id", "bucket_month", "source", "currency")
+        .annotate(bucket_total=Sum("amount"), bucket_count=Count("pk"))
+        .order_by()
+    )
+    Rollup.objects.all().delete()
+    Rollup.objects.bulk_create(
+        (Rollup(owner_id=row["owner_id"], month=row["bucket_month"],
+                source=row["source"], currency=row["currency"],
+                total=Decimal(str(row["bucket_total"])).quantize(CENTS),
+                count=row["bucket_count"])
+         for row in rows.iterator(chunk_size=2000)),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('userincome', '0004_userincome_currency'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='userincome',
+            name='amount',
+            field=models.DecimalField(decimal_places=2, max_digits=10),
+        ),
+        migrations.RunPython(round_amounts, migrations.RunPython.noop),
+    ]
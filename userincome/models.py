@@ -1,12 +1,16 @@
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils.timezone import now
 
+from expenses.rollups import MonthlyRollup
+
 # Create your models here.
 
 
 class UserIncome(models.Model):
-    amount = models.FloatField()  # DECIMAL
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3, default=settings.FX_BASE_CURRENCY)
     date = models.DateField(default=now)
     description = models.TextField()
     owner = models.ForeignKey(to=User, on_delete=models.CASCADE)
@@ -17,6 +21,12 @@ class UserIncome(models.Model):
 
     class Meta:
         ordering: ['-date']
+        indexes = [
+            models.Index(fields=['owner', '-date', '-id'],
+                         name='userincome_owner_date_idx'),
+            models.Index(fields=['owner', 'source', 'date'],
+                         name='userincome_owner_src_date_idx'),
+        ]
 
 
 class Source(models.Model):
@@ -24,3 +34,16 @@ class Source(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class UserIncomeMonthlyRollup(MonthlyRollup):
+    source = models.CharField(max_length=266)
+
+    date_field = "date"
+    group_field = "source"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["owner", "month", "source", "currency"],
+                                    name="unique_userincome_rollup_bucket"),
+        ]
@@ -0,0 +1,4 @@
+from expenses import rollups
+from .models import UserIncome, UserIncomeMonthlyRollup
+
+rollups.track(UserIncome, UserIncomeMonthlyRollup)
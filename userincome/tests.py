@@ -1,3 +1,31 @@
+from datetime import date, timedelta
+
+from django.contrib.auth.models import User
 from django.test import TestCase
+from django.urls import reverse
+
+from expenses.queryplan import QueryPlanAssertions
+from .models import UserIncome
+
+
+class UserIncomeQueryPlanTests(QueryPlanAssertions, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='alice', password='secret123')
+        other = User.objects.create_user(username='bob', password='secret123')
+        for owner in (cls.user, other):
+            for i in range(60):
+                UserIncome.objects.create(
+                    owner=owner, amount=100 + i, source=('Salary', 'Freelance')[i % 2],
+                    description=f'income {i}', date=date.today() - timedelta(days=i * 5))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_index(self):
+        self.assertRequestUsesIndexes('get', reverse('income'))
 
-# Create your tests here.
+    def test_search(self):
+        self.assertRequestUsesIndexes(
+            'post', reverse('search_income'), data={'searchText': 'Free'},
+            content_type='application/json')
@@ -9,5 +9,7 @@ urlpatterns = [
     path('edit-income/<int:id>', views.income_edit, name="income-edit"),
     path('income-delete/<int:id>', views.delete_income, name="income-delete"),
     path('search-income', csrf_exempt(views.search_income),
-         name="search_income")
+         name="search_income"),
+    path('export-income/<str:fmt>', views.export_income,
+         name="userincome-export"),
 ]
@@ -1,4 +1,5 @@
 # userincome/views.py
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
@@ -7,13 +8,15 @@ from django.http import JsonResponse, HttpRequest, HttpResponse
 from decimal import Decimal
 import json
 
-from .models import Source, UserIncome
+from .models import Source, UserIncome, UserIncomeMonthlyRollup
 from .forms import UserIncomeForm
+from userpreferences import fx
+from userpreferences.currencies import code_of
 from userpreferences.models import UserPreference
+from expenses import cache, exports, search
 
 # for chart aggregation
-from django.db.models.functions import TruncMonth
-from django.db.models import Sum
+from django.db.models import Q, Sum
 
 
 @login_required(login_url='/authentication/login/')
@@ -28,24 +31,28 @@ def index(request: HttpRequest) -> HttpResponse:
     page_obj = paginator.get_page(page_number)
 
     user_pref, _ = UserPreference.objects.get_or_create(
-        user=request.user, defaults={'currency': 'USD'}
+        owner=request.user, defaults={'currency': 'USD'}
     )
 
-    # monthly aggregation for Chart.js
-    monthly = (
-        incomes_qs
-        .annotate(month=TruncMonth('date'))
-        .values('month')
-        .annotate(total=Sum('amount'))
-        .order_by('month')
-    )
-    labels = [entry['month'].strftime("%b %Y") for entry in monthly]
-    data = [float(entry['total']) for entry in monthly]
+    currency = code_of(user_pref.currency) or settings.FX_BASE_CURRENCY
+
+    # monthly aggregation for Chart.js, read from the maintained rollup
+    # and converted into the user's currency
+    monthly = fx.convert_grouped(
+        UserIncomeMonthlyRollup.objects
+        .filter(owner=request.user)
+        .values('month', 'currency')
+        .annotate(total=Sum('total'))
+        .order_by(),
+        currency, key='month')
+    months = sorted(monthly)
+    labels = [month.strftime("%b %Y") for month in months]
+    data = [float(monthly[month]) for month in months]
 
     context = {
         'incomes': incomes_qs,
         'page_obj': page_obj,
-        'currency': user_pref.currency,
+        'currency': currency,
         'chart_labels': labels,
         'chart_data': data,
     }
@@ -62,6 +69,7 @@ def add_income(request: HttpRequest) -> HttpResponse:
         if form.is_valid():
             income = form.save(commit=False)
             income.owner = request.user
+            income.currency = fx.preferred_currency(request.user)
             income.save()
             messages.success(request, "Record saved successfully")
             return redirect('income')
@@ -98,15 +106,59 @@ def delete_income(request: HttpRequest, id: int) -> HttpResponse:
 
 
 @login_required(login_url='/authentication/login/')
-def search_income(request: HttpRequest) -> JsonResponse:
+async def search_income(request: HttpRequest) -> JsonResponse:
+    """
+    Windowed income search (``limit``/``offset``, capped total), sharing the
+    expense search's per-session cache of recent responses.
+    """
     if request.method == 'POST':
-        search_str = json.loads(request.body).get('searchText', '')
-        qs = (
-            UserIncome.objects.filter(amount__istartswith=search_str, owner=request.user) |
-            UserIncome.objects.filter(date__istartswith=search_str, owner=request.user) |
-            UserIncome.objects.filter(description__icontains=search_str, owner=request.user) |
-            UserIncome.objects.filter(
-                source__icontains=search_str, owner=request.user)
-        )
-        return JsonResponse(list(qs.values()), safe=False)
+        payload = json.loads(request.body)
+        search_str = payload.get('searchText', '')
+        limit, offset = search.window_params(payload)
+        user = await request.auser()
+
+        session = request.session.session_key or f'user:{user.pk}'
+        key = ('income', await cache.adata_version(user.pk), search_str.lower(), limit, offset)
+        response = search.recent.get(session, key)
+        if response is None:
+            qs = (
+                UserIncome.objects.filter(owner=user)
+                .filter(Q(amount__istartswith=search_str) |
+                        Q(date__istartswith=search_str) |
+                        Q(description__icontains=search_str) |
+                        Q(source__icontains=search_str))
+                .order_by('-date', '-id')
+                .values('id', 'amount', 'currency', 'date', 'description', 'source')
+            )
+            response = await search.apaginate(qs, limit, offset)
+            search.recent.put(session, key, response)
+        return JsonResponse(response)
     return JsonResponse({'error': 'invalid method'}, status=400)
+
+
+EXPORT_COLUMNS = [
+    ('date', 'date'),
+    ('source', 'source'),
+    ('description', 'description'),
+    ('amount', 'amount'),
+    ('currency', 'currency'),
+]
+
+
+@login_required(login_url='/authentication/login/')
+def export_income(request: HttpRequest, fmt: str) -> HttpResponse:
+    """
+    Stream the owner's income records as CSV, JSON or XLSX.
+    """
+    if fmt not in exports.FORMATS:
+        return JsonResponse({'error': f'Unsupported format {fmt!r}'}, status=400)
+    try:
+        filters = exports.parse_filters(request)
+    except exports.ExportFilterError as exc:
+        return JsonResponse({'error': str(exc)}, status=400)
+
+    incomes = exports.filter_queryset(
+        UserIncome.objects.filter(owner=request.user), filters,
+        date_field='date', category_lookup='source',
+    ).order_by('-date', '-id')
+    return exports.export_response(request, fmt, 'income', EXPORT_COLUMNS, incomes)
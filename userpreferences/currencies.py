@@ -0,0 +1,59 @@
+"""Process-wide registry of the currencies listed in ``currencies.json``.
+
+The file is parsed once and re-read only when its modification time
+changes, so views get O(1) code lookups without touching the disk.
+"""
+import json
+import os
+import threading
+
+from django.conf import settings
+
+
+class CurrencyRegistry:
+    def __init__(self, path=None):
+        self._path = path
+        self._mtime = None
+        self._names = {}
+        self._choices = []
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return self._path or os.path.join(settings.BASE_DIR, 'currencies.json')
+
+    def _refresh(self):
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime == self._mtime:
+            return
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            with open(self.path, 'r') as json_file:
+                names = json.load(json_file)
+            self._choices = [{'name': code, 'value': name} for code, name in names.items()]
+            self._names = names
+            self._mtime = mtime
+
+    def names(self) -> dict:
+        self._refresh()
+        return self._names
+
+    def choices(self) -> list:
+        """``[{'name': code, 'value': full name}, ...]`` in file order."""
+        self._refresh()
+        return self._choices
+
+    def name(self, code):
+        return self.names().get(code)
+
+    def __contains__(self, code):
+        return code in self.names()
+
+
+def code_of(value: str) -> str:
+    """Currency code from a stored preference, which older rows kept as 'USD - US Dollar'."""
+    return (value or '').split(' - ', 1)[0].strip()
+
+
+registry = CurrencyRegistry()
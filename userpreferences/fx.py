@@ -0,0 +1,204 @@
+"""Currency conversion against the local ExchangeRate table.
+
+Rates are held in a process-level table that reloads at most every
+``RATE_TTL`` seconds, so conversions never need a query of their own.
+Writers (the ExchangeRate receivers, ``load_fx_rates``) bump a rates
+version in the shared ``dashboard`` cache, and every process compares it
+at most once per ``VERSION_CHECK_INTERVAL``, so new rates reach all
+workers within seconds. Two ways to aggregate in a user's currency:
+
+* ``converted_sum`` builds a ``Sum(CASE currency WHEN ... )`` expression so
+  the database converts and sums raw rows in one pass;
+* ``convert_grouped`` converts totals already grouped by currency (e.g.
+  from the monthly rollups), one multiplication per group.
+"""
+import asyncio
+import hashlib
+import threading
+import time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Case, DecimalField, F, Sum, Value, When
+
+from .currencies import code_of
+from .models import ExchangeRate, UserPreference
+
+RATE_TTL = 300
+VERSION_CHECK_INTERVAL = 1
+RATE_VERSION_KEY = 'fx:rates:version'
+CENTS = Decimal('0.01')
+
+
+def _cache():
+    return caches['dashboard']
+
+
+def rates_version() -> int:
+    """Changes whenever any process changes the rates."""
+    cache = _cache()
+    version = cache.get(RATE_VERSION_KEY)
+    if version is None:
+        # Seeded from the clock so an evicted counter never repeats a value.
+        cache.add(RATE_VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(RATE_VERSION_KEY)
+    return version
+
+
+async def arates_version() -> int:
+    cache = _cache()
+    version = await cache.aget(RATE_VERSION_KEY)
+    if version is None:
+        await cache.aadd(RATE_VERSION_KEY, time.time_ns(), timeout=None)
+        version = await cache.aget(RATE_VERSION_KEY)
+    return version
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class RateTable:
+    def __init__(self):
+        self._rates = None
+        self._loaded_at = 0
+        self._version = None
+        self._checked_at = 0
+        self._fingerprint = ''
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Reload here now, and in every other process at its next version check."""
+        self._rates = None
+        cache = _cache()
+        try:
+            cache.incr(RATE_VERSION_KEY)
+        except ValueError:
+            cache.add(RATE_VERSION_KEY, time.time_ns(), timeout=None)
+
+    def _check_due(self) -> bool:
+        return time.monotonic() - self._checked_at >= VERSION_CHECK_INTERVAL
+
+    def _current(self, version=None):
+        """The loaded rates, or None when they need (re)loading.
+
+        ``version`` is the shared rates version when a check was due.
+        """
+        rates = self._rates
+        if rates is None or time.monotonic() - self._loaded_at >= RATE_TTL:
+            return None
+        if version is not None:
+            if version != self._version:
+                return None
+            self._checked_at = time.monotonic()
+        return rates
+
+    def _store(self, rates: dict, version):
+        rates[settings.FX_BASE_CURRENCY] = Decimal(1)
+        digest = hashlib.sha1(repr(sorted(rates.items())).encode()).hexdigest()
+        with self._lock:
+            self._rates, self._fingerprint = rates, digest[:12]
+            self._version = version
+            self._loaded_at = self._checked_at = time.monotonic()
+        return rates
+
+    def _load(self):
+        # On the event loop, aload() has just checked, and a blocking cache
+        # read is not allowed there.
+        version = rates_version() if self._check_due() and not _on_event_loop() else None
+        rates = self._current(version)
+        if rates is not None:
+            return rates
+        # Read before the rows, so a change made meanwhile forces another reload.
+        version = version if version is not None else rates_version()
+        return self._store(dict(ExchangeRate.objects.values_list('currency', 'rate')), version)
+
+    async def aload(self) -> dict:
+        """Refresh with the async ORM; async views call this before converting."""
+        version = await arates_version() if self._check_due() else None
+        rates = self._current(version)
+        if rates is not None:
+            return rates
+        version = version if version is not None else await arates_version()
+        return self._store({currency: rate async for currency, rate
+                            in ExchangeRate.objects.values_list('currency', 'rate')}, version)
+
+    def rates(self) -> dict:
+        return self._load()
+
+    @property
+    def fingerprint(self) -> str:
+        """Changes whenever the rates do; identical across processes."""
+        self._load()
+        return self._fingerprint
+
+    def factor(self, source: str, target: str) -> Decimal:
+        """Multiplier from ``source`` to ``target``; 1 when either rate is unknown."""
+        if source == target:
+            return Decimal(1)
+        rates = self._load()
+        if source not in rates or target not in rates:
+            return Decimal(1)
+        return rates[target] / rates[source]
+
+
+rates = RateTable()
+
+
+def preferred_currency(user) -> str:
+    currency = UserPreference.objects.filter(owner=user).values_list(
+        'currency', flat=True).first()
+    return code_of(currency) or settings.FX_BASE_CURRENCY
+
+
+async def apreferred_currency(user) -> str:
+    currency = await UserPreference.objects.filter(owner=user).values_list(
+        'currency', flat=True).afirst()
+    return code_of(currency) or settings.FX_BASE_CURRENCY
+
+
+def converted(amount_field: str, target: str, currency_field: str = 'currency'):
+    """``amount_field`` expressed in ``target``, as a CASE over the known rates."""
+    whens = [
+        When(**{currency_field: code},
+             then=F(amount_field) * Value(rates.factor(code, target)))
+        for code in rates.rates() if code != target
+    ]
+    return Case(*whens, default=F(amount_field),
+                output_field=DecimalField(max_digits=20, decimal_places=2))
+
+
+def converted_sum(amount_field: str, target: str, currency_field: str = 'currency'):
+    return Sum(converted(amount_field, target, currency_field))
+
+
+def convert(amount, source: str, target: str) -> Decimal:
+    return (Decimal(str(amount)) * rates.factor(source, target)).quantize(CENTS)
+
+
+def convert_grouped(rows, target: str, key=None, amount='total', currency='currency'):
+    """Fold rows grouped by currency into ``{key: total in target}``.
+
+    ``key`` picks the grouping columns (a field name or a tuple of them);
+    without one, everything folds into a single total under ``None``.
+    """
+    factors = {}
+    totals = {}
+    for row in rows:
+        code = row[currency]
+        if code not in factors:
+            factors[code] = rates.factor(code, target)
+        if key is None:
+            group = None
+        elif isinstance(key, tuple):
+            group = tuple(row[k] for k in key)
+        else:
+            group = row[key]
+        value = Decimal(str(row[amount] or 0)) * factors[code]
+        totals[group] = totals.get(group, Decimal(0)) + value
+    return {group: total.quantize(CENTS) for group, total in totals.items()}
@@ -0,0 +1,56 @@
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from userpreferences import fx
+from userpreferences.models import ExchangeRate
+
+
+class Command(BaseCommand):
+    help = (
+        "Load exchange rates from a local file. JSON: "
+        '{"base": "USD", "rates": {"EUR": 0.92, ...}}; CSV: currency,rate rows '
+        "quoted against FX_BASE_CURRENCY."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        base = settings.FX_BASE_CURRENCY
+        try:
+            if path.endswith(".json"):
+                with open(path) as source:
+                    data = json.load(source)
+                base = data.get("base", base)
+                raw = data["rates"]
+            else:
+                with open(path, newline="") as source:
+                    raw = {row["currency"]: row["rate"] for row in csv.DictReader(source)}
+            rates = {code.upper(): Decimal(str(rate)) for code, rate in raw.items()}
+        except (OSError, KeyError, ValueError, InvalidOperation) as exc:
+            raise CommandError(f"Could not read rates from {path}: {exc}")
+
+        rates[base] = Decimal(1)
+        if base != settings.FX_BASE_CURRENCY:
+            # Re-quote everything against the configured base currency
+            if settings.FX_BASE_CURRENCY not in rates:
+                raise CommandError(
+                    f"{path} has no rate for {settings.FX_BASE_CURRENCY}")
+            pivot = rates[settings.FX_BASE_CURRENCY]
+            rates = {code: rate / pivot for code, rate in rates.items()}
+
+        ExchangeRate.objects.bulk_create(
+            [ExchangeRate(currency=code, rate=rate.quantize(Decimal("1e-10")))
+             for code, rate in rates.items() if rate > 0],
+            update_conflicts=True, unique_fields=["currency"],
+            update_fields=["rate", "updated_at"],
+        )
+        # bulk_create sends no post_save, so bump the shared rates version here;
+        # web workers reload at their next version check.
+        fx.rates.invalidate()
+        self.stdout.write(f"Loaded {len(rates)} rates against {settings.FX_BASE_CURRENCY}")
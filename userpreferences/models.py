@@ -9,3 +9,13 @@ class UserPreference(models.Model):
 
     def __str__(self):
         return str(self.owner)+'s' + 'preferences'
+
+
+class ExchangeRate(models.Model):
+    """Units of ``currency`` per one unit of ``settings.FX_BASE_CURRENCY``."""
+    currency = models.CharField(max_length=3, unique=True)
+    rate = models.DecimalField(max_digits=20, decimal_places=10)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.currency} {self.rate}'
@@ -1,7 +1,8 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
-from .models import UserPreference
+from . import fx
+from .models import ExchangeRate, UserPreference
 
 
 @receiver(post_save, sender=User)
@@ -9,3 +10,9 @@ def create_user_preference(sender, instance, created, **kwargs):
     if created:
         # Automatically create a UserPreference for every new user
         UserPreference.objects.create(owner=instance, currency='USD')
+
+
+@receiver(post_save, sender=ExchangeRate)
+@receiver(post_delete, sender=ExchangeRate)
+def reload_exchange_rates(sender, **kwargs):
+    fx.rates.invalidate()
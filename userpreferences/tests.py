@@ -1,3 +1,141 @@
+import json
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
 from django.test import TestCase
+from django.urls import reverse
+
+from . import fx
+from .currencies import CurrencyRegistry, code_of
+from .models import ExchangeRate, UserPreference
+
+
+class CurrencyRegistryTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'currencies.json')
+        self.write({'USD': 'US Dollar', 'EUR': 'Euro'}, mtime=1_000_000)
+        self.registry = CurrencyRegistry(self.path)
+
+    def write(self, names, mtime):
+        with open(self.path, 'w') as json_file:
+            json.dump(names, json_file)
+        os.utime(self.path, (mtime, mtime))
+
+    def test_lookups(self):
+        self.assertIn('EUR', self.registry)
+        self.assertNotIn('XYZ', self.registry)
+        self.assertEqual(self.registry.name('USD'), 'US Dollar')
+        self.assertIsNone(self.registry.name('XYZ'))
+        self.assertEqual(self.registry.choices(), [{'name': 'USD', 'value': 'US Dollar'},
+                                                   {'name': 'EUR', 'value': 'Euro'}])
+
+    def test_reloads_when_the_file_changes(self):
+        self.assertNotIn('GBP', self.registry)
+        self.write({'GBP': 'Pound Sterling'}, mtime=2_000_000)
+        self.assertIn('GBP', self.registry)
+        self.assertNotIn('USD', self.registry)
+
+    def test_code_of_legacy_values(self):
+        self.assertEqual(code_of('USD - US Dollar'), 'USD')
+        self.assertEqual(code_of('EUR'), 'EUR')
+        self.assertEqual(code_of(None), '')
+
+
+class FxTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        ExchangeRate.objects.bulk_create([
+            ExchangeRate(currency='EUR', rate=Decimal('0.3')),
+            ExchangeRate(currency='GBP', rate=Decimal('0.25')),
+        ])
+
+    def setUp(self):
+        fx.rates.invalidate()
+        self.addCleanup(fx.rates.invalidate)
+
+    def test_convert_rounds_to_cents(self):
+        self.assertEqual(fx.convert(Decimal('1'), 'EUR', 'USD'), Decimal('3.33'))
+        self.assertEqual(fx.convert(Decimal('2'), 'EUR', 'USD'), Decimal('6.67'))
+        self.assertEqual(fx.convert(Decimal('10'), 'USD', 'GBP'), Decimal('2.50'))
+        self.assertEqual(fx.convert('1.005', 'USD', 'USD'), Decimal('1.00'))
+        self.assertEqual(fx.convert(Decimal('3'), 'EUR', 'GBP'), Decimal('2.50'))
+
+    def test_unknown_currency_converts_at_one(self):
+        self.assertEqual(fx.rates.factor('XYZ', 'EUR'), Decimal(1))
+        self.assertEqual(fx.convert(Decimal('10'), 'XYZ', 'EUR'), Decimal('10.00'))
+        self.assertEqual(fx.convert(Decimal('10'), 'EUR', 'XYZ'), Decimal('10.00'))
+
+    def test_convert_grouped(self):
+        rows = [{'category': 'Food', 'currency': 'USD', 'total': Decimal('1')},
+                {'category': 'Food', 'currency': 'EUR', 'total': Decimal('0.3')},
+                {'category': 'Rent', 'currency': 'GBP', 'total': None}]
+        self.assertEqual(fx.convert_grouped(rows, 'USD', key='category'),
+                         {'Food': Decimal('2.00'), 'Rent': Decimal('0.00')})
+        self.assertEqual(fx.convert_grouped(rows, 'EUR'), {None: Decimal('0.60')})
+
+    def test_rates_are_served_from_memory(self):
+        fx.rates.rates()
+        with self.assertNumQueries(0):
+            fx.convert(Decimal('1'), 'EUR', 'GBP')
+            fx.rates.fingerprint
+
+    def test_saving_a_rate_reloads(self):
+        before = fx.rates.fingerprint
+        ExchangeRate.objects.filter(currency='EUR').get().save()
+        self.assertEqual(fx.rates.fingerprint, before)
+        rate = ExchangeRate.objects.get(currency='EUR')
+        rate.rate = Decimal('0.5')
+        rate.save()
+        self.assertNotEqual(fx.rates.fingerprint, before)
+        self.assertEqual(fx.convert(Decimal('1'), 'EUR', 'USD'), Decimal('2.00'))
+
+    def test_load_fx_rates_changes_the_fingerprint(self):
+        before = fx.rates.fingerprint
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as source:
+            json.dump({'base': 'EUR', 'rates': {'USD': 2, 'GBP': 0.5}}, source)
+        self.addCleanup(os.unlink, source.name)
+
+        call_command('load_fx_rates', source.name, stdout=StringIO())
+        self.assertNotEqual(fx.rates.fingerprint, before)
+        self.assertEqual(fx.rates.rates()['EUR'], Decimal('0.5'))
+        self.assertEqual(fx.convert(Decimal('4'), 'GBP', 'EUR'), Decimal('8.00'))
+
+    def test_change_in_another_process_reloads_after_the_version_check(self):
+        before = fx.rates.fingerprint
+        # As load_fx_rates run elsewhere would: new rows, then a version bump.
+        ExchangeRate.objects.filter(currency='EUR').update(rate=Decimal('0.5'))
+        caches['dashboard'].incr(fx.RATE_VERSION_KEY)
+        with mock.patch.object(fx, 'VERSION_CHECK_INTERVAL', 60):
+            self.assertEqual(fx.rates.fingerprint, before)
+        with mock.patch.object(fx, 'VERSION_CHECK_INTERVAL', 0):
+            self.assertNotEqual(fx.rates.fingerprint, before)
+            self.assertEqual(fx.convert(Decimal('1'), 'EUR', 'USD'), Decimal('2.00'))
+
+    def test_preferred_currency(self):
+        user = User.objects.create_user(username='alice', password='secret123')
+        self.assertEqual(fx.preferred_currency(user), 'USD')
+        UserPreference.objects.filter(owner=user).update(currency='EUR - Euro')
+        self.assertEqual(fx.preferred_currency(user), 'EUR')
+
+
+class PreferencesViewTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='alice', password='secret123')
+        self.client.force_login(self.user)
+
+    def test_rejects_unknown_currency(self):
+        response = self.client.post(reverse('preferences'), {'currency': 'XYZ'})
+        self.assertContains(response, 'Please choose a valid currency')
+        self.assertEqual(UserPreference.objects.get(owner=self.user).currency, 'USD')
 
-# Create your tests here.
+    def test_saves_a_known_currency(self):
+        self.client.post(reverse('preferences'), {'currency': 'EUR'})
+        self.assertEqual(UserPreference.objects.get(owner=self.user).currency, 'EUR')
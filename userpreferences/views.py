@@ -1,37 +1,32 @@
 from django.shortcuts import render
-import os
-import json
-from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from .currencies import code_of, registry
 from .models import UserPreference
 from django.contrib import messages
 # Create your views here.
 
 
+@login_required(login_url='/authentication/login')
 def index(request):
-    currency_data = []
-    file_path = os.path.join(settings.BASE_DIR, 'currencies.json')
+    currency_data = registry.choices()
+    user_preferences = UserPreference.objects.filter(owner=request.user).first()
+    context = {'currencies': currency_data, 'user_preferences': user_preferences,
+               'selected_currency': code_of(user_preferences.currency) if user_preferences else ''}
 
-    with open(file_path, 'r') as json_file:
-        data = json.load(json_file)
-        for k, v in data.items():
-            currency_data.append({'name': k, 'value': v})
-
-    exists = UserPreference.objects.filter(owner=request.user).exists()
-    user_preferences = None
-    if exists:
-        user_preferences = UserPreference.objects.get(owner=request.user)
     if request.method == 'GET':
+        return render(request, 'preferences/index.html', context)
 
-        return render(request, 'preferences/index.html', {'currencies': currency_data,
-                                                          'user_preferences': user_preferences})
-    else:
+    currency = code_of(request.POST.get('currency', ''))
+    if currency not in registry:
+        messages.error(request, 'Please choose a valid currency')
+        return render(request, 'preferences/index.html', context)
 
-        currency = request.POST['currency']
-        if exists:
-            user_preferences.currency = currency
-            user_preferences.save()
-        else:
-            UserPreference.objects.create(
-                owner=request.user, currency=currency)
-        messages.success(request, 'Changes saved')
-        return render(request, 'preferences/index.html', {'currencies': currency_data, 'user_preferences': user_preferences})
+    if user_preferences:
+        user_preferences.currency = currency
+        user_preferences.save()
+    else:
+        user_preferences = UserPreference.objects.create(
+            owner=request.user, currency=currency)
+    context.update(user_preferences=user_preferences, selected_currency=currency)
+    messages.success(request, 'Changes saved')
+    return render(request, 'preferences/index.html', context)